@@ -9,6 +9,7 @@ import hashlib
 import json
 import secrets
 import uuid
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -110,6 +111,17 @@ class UserStore:
                 return self._user_from_dict(d)
         return None
 
+    def get_users(self, user_ids: Iterable[str]) -> dict[str, User]:
+        """Look up several users in one read, keyed by ID (missing IDs are omitted)."""
+        wanted = set(user_ids)
+        if not wanted:
+            return {}
+        return {
+            d["id"]: self._user_from_dict(d)
+            for d in self._read_json(self._users_path)
+            if d["id"] in wanted
+        }
+
     def get_user_by_email(self, email: str) -> Optional[User]:
         for d in self._read_json(self._users_path):
             if d.get("email", "").lower() == email.lower():
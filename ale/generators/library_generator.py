@@ -1,5 +1,7 @@
 """Library generator — converts extraction candidates into Agentic Library specs."""
 
+import functools
+import re
 from pathlib import Path
 
 import yaml
@@ -7,6 +9,41 @@ import yaml
 from ale.analyzers.repo_analyzer import RepoAnalyzer
 from ale.models.agentic_library import AgenticLibrary, InstructionStep, Guardrail, ValidationCriterion
 
+# Lines that open a function/class definition in the languages we sketch
+_SIG_RE = re.compile(r"\s*(?:async def |def |class |function |export |pub fn |func )")
+
+# Caps on one file's code sketch, so a huge generated source file cannot
+# balloon the library spec
+_MAX_SKETCH_SIGS = 50
+_MAX_SKETCH_CHARS = 32_768
+_SKETCH_TRUNCATED = "# ... (truncated)"
+
+
+@functools.lru_cache(maxsize=4096)
+def _scan_file_signatures(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Return the stripped signature lines of a source file.
+
+    At most ``_MAX_SKETCH_SIGS`` lines (and about ``_MAX_SKETCH_CHARS``
+    characters) are kept; a trailing ``_SKETCH_TRUNCATED`` marker notes
+    any cut.  ``mtime_ns`` and ``size`` are only part of the cache key, so
+    an edited file is rescanned while repeated generations over the same
+    repo reuse the previous scan.
+    """
+    sigs: list[str] = []
+    total = 0
+    # Stream the file; only the signature lines are kept
+    with open(path, errors="replace", buffering=65536) as fh:
+        for line in fh:
+            if not _SIG_RE.match(line):
+                continue
+            if len(sigs) >= _MAX_SKETCH_SIGS or total >= _MAX_SKETCH_CHARS:
+                sigs.append(_SKETCH_TRUNCATED)
+                break
+            sig = line.strip()
+            sigs.append(sig)
+            total += len(sig) + 1
+    return tuple(sigs)
+
 
 class LibraryGenerator:
     """Generates an Agentic Library specification from a repo feature."""
@@ -67,13 +104,12 @@ class LibraryGenerator:
         for i, src_file in enumerate(candidate.source_files):
             path = Path(src_file)
             if path.exists():
-                content = path.read_text(errors="replace")
                 library.instructions.append(
                     InstructionStep(
                         order=i + 1,
                         title=f"Implement {path.stem}",
                         description=f"Recreate the functionality from {path.name}",
-                        code_sketch=self._extract_code_sketch(content),
+                        code_sketch=self._extract_code_sketch(path),
                     )
                 )
 
@@ -130,19 +166,12 @@ class LibraryGenerator:
 
         return library
 
-    def _extract_code_sketch(self, source_code: str) -> str:
-        """Extract a language-agnostic pseudocode sketch from source."""
+    def _extract_code_sketch(self, path: Path) -> str:
+        """Extract a language-agnostic pseudocode sketch from a source file."""
         # For now, return a simplified version. LLM enrichment will improve this.
-        lines = source_code.split("\n")
         # Extract function/class signatures as a sketch
-        sketch_lines = []
-        for line in lines:
-            stripped = line.strip()
-            if any(
-                stripped.startswith(kw)
-                for kw in ["def ", "class ", "function ", "export ", "pub fn ", "func "]
-            ):
-                sketch_lines.append(stripped)
+        st = path.stat()
+        sketch_lines = _scan_file_signatures(str(path), st.st_mtime_ns, st.st_size)
         return "\n".join(sketch_lines) if sketch_lines else "# See source files for reference"
 
     def _enrich_with_llm(self, library: AgenticLibrary) -> AgenticLibrary:
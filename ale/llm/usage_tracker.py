@@ -6,6 +6,7 @@ Stores all records as JSON files under ``~/.ale/llm_usage/``.
 from __future__ import annotations
 
 import json
+import threading
 import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
@@ -89,18 +90,26 @@ class UsageTracker:
     Records are stored one-per-line in monthly files under
     ``~/.ale/llm_usage/YYYY-MM.jsonl``.  Budget config lives in
     ``~/.ale/llm_usage/budget.json``.
+
+    With ``flush_every > 1`` new records are buffered in memory and
+    appended in batches of that size; queries flush the buffer first, so
+    this tracker always sees its own records.  Call :meth:`flush` before
+    the process exits.
     """
 
-    def __init__(self, base_dir: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        base_dir: str | Path | None = None,
+        flush_every: int = 1,
+    ) -> None:
         self._base = Path(base_dir) if base_dir else Path.home() / ".ale" / "llm_usage"
         self._base.mkdir(parents=True, exist_ok=True)
+        self._flush_every = flush_every
+        self._pending: list[UsageRecord] = []
+        self._pending_lock = threading.Lock()
 
     # -- helpers -------------------------------------------------------------
 
-    def _records_file(self, dt: datetime | None = None) -> Path:
-        dt = dt or datetime.now(timezone.utc)
-        return self._base / f"{dt.strftime('%Y-%m')}.jsonl"
-
     def _budget_file(self) -> Path:
         return self._base / "budget.json"
 
@@ -122,14 +131,36 @@ class UsageTracker:
             purpose=purpose,
             cost_estimate=cost_estimate,
         )
-        path = self._records_file()
-        with path.open("a") as fh:
-            fh.write(json.dumps(asdict(record)) + "\n")
+        with self._pending_lock:
+            self._pending.append(record)
+            if len(self._pending) < self._flush_every:
+                return record
+            batch, self._pending = self._pending, []
+        self.record_usage_bulk(batch)
         return record
 
+    def record_usage_bulk(self, records: list[UsageRecord]) -> None:
+        """Append several records, opening each monthly file once."""
+        by_month: dict[str, list[str]] = {}
+        for record in records:
+            by_month.setdefault(record.timestamp[:7], []).append(
+                json.dumps(asdict(record)) + "\n"
+            )
+        for month, lines in by_month.items():
+            with (self._base / f"{month}.jsonl").open("a") as fh:
+                fh.write("".join(lines))
+
+    def flush(self) -> None:
+        """Write any buffered records to disk."""
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            self.record_usage_bulk(batch)
+
     # -- querying ------------------------------------------------------------
 
     def _load_all_records(self) -> list[UsageRecord]:
+        self.flush()
         records: list[UsageRecord] = []
         for path in sorted(self._base.glob("*.jsonl")):
             for line in path.read_text().splitlines():
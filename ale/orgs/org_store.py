@@ -6,7 +6,9 @@ Provides a DB-ready interface backed by simple JSON files under ~/.ale/orgs/.
 from __future__ import annotations
 
 import json
+import threading
 import uuid
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -32,22 +34,72 @@ class OrgStore:
         self._orgs_path = self._base / "organizations.json"
         self._members_path = self._base / "members.json"
         self._repos_path = self._base / "repositories.json"
+        # Held around every read-modify-write of the JSON files and every
+        # access to the parse cache; re-entrant so writers can read.
+        self._lock = threading.RLock()
+        # path -> (mtime_ns, size, parsed list); see _read_json.
+        self._cache: dict[Path, tuple[int, int, list[dict]]] = {}
+        # (parsed members list, {(org_id, user_id): member dict}); see _member_index.
+        self._member_idx: tuple[list[dict], dict[tuple[str, str], dict]] | None = None
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _read_json(self, path: Path) -> list[dict]:
-        if not path.exists():
-            return []
-        try:
-            data = json.loads(path.read_text())
-            return data if isinstance(data, list) else []
-        except (json.JSONDecodeError, OSError):
-            return []
+        """Return the parsed list in *path*, reusing it while the file is unchanged.
+
+        Read-heavy endpoints (org pages, dashboards) hit the same three
+        files on every request, so the parse is cached per path and
+        validated against the file's mtime and size. The returned list is
+        shared and must not be mutated; writers use ``_read_for_update``.
+        """
+        with self._lock:
+            try:
+                st = path.stat()
+            except OSError:
+                return []
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+            try:
+                data = json.loads(path.read_text())
+            except (json.JSONDecodeError, OSError):
+                return []
+            if not isinstance(data, list):
+                data = []
+            self._cache[path] = (st.st_mtime_ns, st.st_size, data)
+            return data
+
+    def _read_for_update(self, path: Path) -> list[dict]:
+        """Return a private copy of *path*'s records for a writer to mutate.
+
+        Callers must hold ``self._lock``.  Readers never see the copy, so a
+        half-applied or failed write leaves the cached list untouched.
+        """
+        return [dict(d) for d in self._read_json(path)]
 
     def _write_json(self, path: Path, data: list[dict]) -> None:
-        path.write_text(json.dumps(data, indent=2, default=str))
+        with self._lock:
+            self._cache.pop(path, None)
+            path.write_text(json.dumps(data, indent=2, default=str))
+
+    def _member_index(self) -> dict[tuple[str, str], dict]:
+        """Map ``(org_id, user_id)`` to its member dict.
+
+        Rebuilt only when ``_read_json`` hands back a different members
+        list, i.e. after the file changed.
+        """
+        with self._lock:
+            members = self._read_json(self._members_path)
+            idx = self._member_idx
+            if idx is None or idx[0] is not members:
+                # Reversed so the first entry wins, as a linear scan would.
+                idx = self._member_idx = (
+                    members,
+                    {(d["org_id"], d["user_id"]): d for d in reversed(members)},
+                )
+            return idx[1]
 
     @staticmethod
     def _org_from_dict(d: dict) -> Organization:
@@ -58,7 +110,7 @@ class OrgStore:
             description=d.get("description", ""),
             owner_id=d.get("owner_id", ""),
             created_at=d.get("created_at", ""),
-            settings=d.get("settings", {}),
+            settings=dict(d.get("settings") or {}),
         )
 
     @staticmethod
@@ -135,10 +187,11 @@ class OrgStore:
 
     def create_org(self, org: Organization) -> Organization:
         """Persist a new organization. Returns the organization."""
-        orgs = self._read_json(self._orgs_path)
-        orgs.append(self._org_to_dict(org))
-        self._write_json(self._orgs_path, orgs)
-        return org
+        with self._lock:
+            orgs = self._read_for_update(self._orgs_path)
+            orgs.append(self._org_to_dict(org))
+            self._write_json(self._orgs_path, orgs)
+            return org
 
     def get_org(self, org_id: str) -> Optional[Organization]:
         """Get an organization by ID."""
@@ -158,34 +211,57 @@ class OrgStore:
         """List all organizations."""
         return [self._org_from_dict(d) for d in self._read_json(self._orgs_path)]
 
+    def list_orgs_with_counts_for_user(
+        self, user_id: str,
+    ) -> list[tuple[Organization, int, int]]:
+        """List a user's organizations as ``(org, member_count, repo_count)``.
+
+        Reads each JSON file once, rather than once per organization.
+        """
+        members = self._read_json(self._members_path)
+        org_ids = {d["org_id"] for d in members if d["user_id"] == user_id}
+        if not org_ids:
+            return []
+        member_counts = Counter(d["org_id"] for d in members if d["org_id"] in org_ids)
+        repo_counts = Counter(
+            d["org_id"] for d in self._read_json(self._repos_path) if d["org_id"] in org_ids
+        )
+        return [
+            (self._org_from_dict(d), member_counts[d["id"]], repo_counts[d["id"]])
+            for d in self._read_json(self._orgs_path)
+            if d["id"] in org_ids
+        ]
+
     def update_org(self, org_id: str, **kwargs: str) -> Optional[Organization]:
         """Update an organization's fields. Returns the updated org or None."""
-        orgs = self._read_json(self._orgs_path)
-        for d in orgs:
-            if d["id"] == org_id:
-                for key, value in kwargs.items():
-                    if key in d and value:
-                        d[key] = value
-                self._write_json(self._orgs_path, orgs)
-                return self._org_from_dict(d)
+        with self._lock:
+            orgs = self._read_for_update(self._orgs_path)
+            for d in orgs:
+                if d["id"] == org_id:
+                    for key, value in kwargs.items():
+                        if key in d and value:
+                            d[key] = value
+                    self._write_json(self._orgs_path, orgs)
+                    return self._org_from_dict(d)
         return None
 
     def delete_org(self, org_id: str) -> bool:
         """Delete an organization and all its members and repos."""
-        orgs = self._read_json(self._orgs_path)
-        original_len = len(orgs)
-        orgs = [d for d in orgs if d["id"] != org_id]
-        if len(orgs) < original_len:
-            self._write_json(self._orgs_path, orgs)
-            # Clean up members
-            members = self._read_json(self._members_path)
-            members = [m for m in members if m["org_id"] != org_id]
-            self._write_json(self._members_path, members)
-            # Clean up repos
-            repos = self._read_json(self._repos_path)
-            repos = [r for r in repos if r["org_id"] != org_id]
-            self._write_json(self._repos_path, repos)
-            return True
+        with self._lock:
+            orgs = self._read_json(self._orgs_path)
+            original_len = len(orgs)
+            orgs = [d for d in orgs if d["id"] != org_id]
+            if len(orgs) < original_len:
+                self._write_json(self._orgs_path, orgs)
+                # Clean up members
+                members = self._read_json(self._members_path)
+                members = [m for m in members if m["org_id"] != org_id]
+                self._write_json(self._members_path, members)
+                # Clean up repos
+                repos = self._read_json(self._repos_path)
+                repos = [r for r in repos if r["org_id"] != org_id]
+                self._write_json(self._repos_path, repos)
+                return True
         return False
 
     # ------------------------------------------------------------------
@@ -204,21 +280,27 @@ class OrgStore:
             user_id=user_id,
             role=role_enum,
         )
-        members = self._read_json(self._members_path)
-        # Remove existing membership for this user in this org (upsert)
-        members = [m for m in members if not (m["org_id"] == org_id and m["user_id"] == user_id)]
-        members.append(self._member_to_dict(member))
-        self._write_json(self._members_path, members)
-        return member
+        with self._lock:
+            members = self._read_json(self._members_path)
+            # Remove existing membership for this user in this org (upsert)
+            members = [
+                m for m in members if not (m["org_id"] == org_id and m["user_id"] == user_id)
+            ]
+            members.append(self._member_to_dict(member))
+            self._write_json(self._members_path, members)
+            return member
 
     def remove_member(self, org_id: str, user_id: str) -> bool:
         """Remove a member from an organization."""
-        members = self._read_json(self._members_path)
-        original_len = len(members)
-        members = [m for m in members if not (m["org_id"] == org_id and m["user_id"] == user_id)]
-        if len(members) < original_len:
-            self._write_json(self._members_path, members)
-            return True
+        with self._lock:
+            members = self._read_json(self._members_path)
+            original_len = len(members)
+            members = [
+                m for m in members if not (m["org_id"] == org_id and m["user_id"] == user_id)
+            ]
+            if len(members) < original_len:
+                self._write_json(self._members_path, members)
+                return True
         return False
 
     def list_members(self, org_id: str) -> list[OrgMember]:
@@ -229,25 +311,36 @@ class OrgStore:
             if d["org_id"] == org_id
         ]
 
+    def get_org_and_member(
+        self, slug: str, user_id: str,
+    ) -> tuple[Organization | None, OrgMember | None]:
+        """Get an organization by slug together with the user's membership.
+
+        Either element is None when the org or the membership is missing.
+        """
+        org = self.get_org_by_slug(slug)
+        if org is None:
+            return None, None
+        return org, self.get_member(org.id, user_id)
+
     def get_member(self, org_id: str, user_id: str) -> Optional[OrgMember]:
         """Get a specific member of an organization."""
-        for d in self._read_json(self._members_path):
-            if d["org_id"] == org_id and d["user_id"] == user_id:
-                return self._member_from_dict(d)
-        return None
+        d = self._member_index().get((org_id, user_id))
+        return self._member_from_dict(d) if d is not None else None
 
     def update_member_role(self, org_id: str, user_id: str, role: str) -> Optional[OrgMember]:
         """Update a member's role within an organization."""
-        members = self._read_json(self._members_path)
-        for d in members:
-            if d["org_id"] == org_id and d["user_id"] == user_id:
-                try:
-                    role_enum = OrgRole(role)
-                except ValueError:
-                    role_enum = OrgRole.member
-                d["role"] = role_enum.value
-                self._write_json(self._members_path, members)
-                return self._member_from_dict(d)
+        with self._lock:
+            members = self._read_for_update(self._members_path)
+            for d in members:
+                if d["org_id"] == org_id and d["user_id"] == user_id:
+                    try:
+                        role_enum = OrgRole(role)
+                    except ValueError:
+                        role_enum = OrgRole.member
+                    d["role"] = role_enum.value
+                    self._write_json(self._members_path, members)
+                    return self._member_from_dict(d)
         return None
 
     # ------------------------------------------------------------------
@@ -263,10 +356,11 @@ class OrgStore:
             url=url,
             default_branch=default_branch,
         )
-        repos = self._read_json(self._repos_path)
-        repos.append(self._repo_to_dict(repo))
-        self._write_json(self._repos_path, repos)
-        return repo
+        with self._lock:
+            repos = self._read_for_update(self._repos_path)
+            repos.append(self._repo_to_dict(repo))
+            self._write_json(self._repos_path, repos)
+            return repo
 
     def list_repos(self, org_id: str) -> list[Repository]:
         """List all repositories for an organization."""
@@ -285,12 +379,13 @@ class OrgStore:
 
     def remove_repo(self, repo_id: str) -> bool:
         """Remove a repository."""
-        repos = self._read_json(self._repos_path)
-        original_len = len(repos)
-        repos = [d for d in repos if d["id"] != repo_id]
-        if len(repos) < original_len:
-            self._write_json(self._repos_path, repos)
-            return True
+        with self._lock:
+            repos = self._read_json(self._repos_path)
+            original_len = len(repos)
+            repos = [d for d in repos if d["id"] != repo_id]
+            if len(repos) < original_len:
+                self._write_json(self._repos_path, repos)
+                return True
         return False
 
     def update_repo_status(
@@ -298,18 +393,26 @@ class OrgStore:
         repo_id: str,
         status: str,
         last_scanned: Optional[str] = None,
+        expected_status: str | None = None,
     ) -> Optional[Repository]:
-        """Update a repository's scan status and last_scanned timestamp."""
-        repos = self._read_json(self._repos_path)
-        for d in repos:
-            if d["id"] == repo_id:
-                try:
-                    status_enum = ScanStatus(status)
-                except ValueError:
-                    status_enum = ScanStatus.pending
-                d["scan_status"] = status_enum.value
-                if last_scanned:
-                    d["last_scanned"] = last_scanned
-                self._write_json(self._repos_path, repos)
-                return self._repo_from_dict(d)
+        """Update a repository's scan status and last_scanned timestamp.
+
+        With *expected_status*, nothing is written (and None returned)
+        unless the repository currently has that status.
+        """
+        with self._lock:
+            repos = self._read_for_update(self._repos_path)
+            for d in repos:
+                if d["id"] == repo_id:
+                    if expected_status is not None and d.get("scan_status") != expected_status:
+                        return None
+                    try:
+                        status_enum = ScanStatus(status)
+                    except ValueError:
+                        status_enum = ScanStatus.pending
+                    d["scan_status"] = status_enum.value
+                    if last_scanned:
+                        d["last_scanned"] = last_scanned
+                    self._write_json(self._repos_path, repos)
+                    return self._repo_from_dict(d)
         return None
@@ -7,6 +7,7 @@ backed by JSON files under ~/.ale/approvals/.
 from __future__ import annotations
 
 import json
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -27,6 +28,8 @@ class ApprovalStore:
             self._base = Path(base_dir)
         self._base.mkdir(parents=True, exist_ok=True)
         self._requests_path = self._base / "requests.json"
+        # Held around every read-modify-write of the JSON file
+        self._lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -71,9 +74,10 @@ class ApprovalStore:
             "decided_by": "",
             "decision_comment": "",
         }
-        requests = self._read_json(self._requests_path)
-        requests.append(request)
-        self._write_json(self._requests_path, requests)
+        with self._lock:
+            requests = self._read_json(self._requests_path)
+            requests.append(request)
+            self._write_json(self._requests_path, requests)
         return request
 
     def get_request(self, request_id: str) -> Optional[dict]:
@@ -92,32 +96,34 @@ class ApprovalStore:
 
     def approve(self, request_id: str, approver_id: str, comment: str = "") -> Optional[dict]:
         """Approve a pending request. Returns updated dict or None."""
-        requests = self._read_json(self._requests_path)
-        for r in requests:
-            if r["id"] == request_id:
-                if r["status"] != "pending":
-                    return r  # Already decided
-                r["status"] = "approved"
-                r["decided_at"] = datetime.utcnow().isoformat()
-                r["decided_by"] = approver_id
-                r["decision_comment"] = comment
-                self._write_json(self._requests_path, requests)
-                return r
+        with self._lock:
+            requests = self._read_json(self._requests_path)
+            for r in requests:
+                if r["id"] == request_id:
+                    if r["status"] != "pending":
+                        return r  # Already decided
+                    r["status"] = "approved"
+                    r["decided_at"] = datetime.utcnow().isoformat()
+                    r["decided_by"] = approver_id
+                    r["decision_comment"] = comment
+                    self._write_json(self._requests_path, requests)
+                    return r
         return None
 
     def reject(self, request_id: str, approver_id: str, comment: str = "") -> Optional[dict]:
         """Reject a pending request. Returns updated dict or None."""
-        requests = self._read_json(self._requests_path)
-        for r in requests:
-            if r["id"] == request_id:
-                if r["status"] != "pending":
-                    return r  # Already decided
-                r["status"] = "rejected"
-                r["decided_at"] = datetime.utcnow().isoformat()
-                r["decided_by"] = approver_id
-                r["decision_comment"] = comment
-                self._write_json(self._requests_path, requests)
-                return r
+        with self._lock:
+            requests = self._read_json(self._requests_path)
+            for r in requests:
+                if r["id"] == request_id:
+                    if r["status"] != "pending":
+                        return r  # Already decided
+                    r["status"] = "rejected"
+                    r["decided_at"] = datetime.utcnow().isoformat()
+                    r["decided_by"] = approver_id
+                    r["decision_comment"] = comment
+                    self._write_json(self._requests_path, requests)
+                    return r
         return None
 
     def get_pending_count(self) -> int:
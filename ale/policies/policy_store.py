@@ -7,6 +7,7 @@ Integrates with the core ale.sync.policy module for evaluation.
 from __future__ import annotations
 
 import json
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -27,6 +28,8 @@ class PolicyStore:
             self._base = Path(base_dir)
         self._base.mkdir(parents=True, exist_ok=True)
         self._policies_path = self._base / "policies.json"
+        # Held around every read-modify-write of the JSON file
+        self._lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -61,9 +64,10 @@ class PolicyStore:
             "updated_at": now,
             "enabled": True,
         }
-        policies = self._read_json(self._policies_path)
-        policies.append(policy)
-        self._write_json(self._policies_path, policies)
+        with self._lock:
+            policies = self._read_json(self._policies_path)
+            policies.append(policy)
+            self._write_json(self._policies_path, policies)
         return policy
 
     def get_policy(self, policy_id: str) -> Optional[dict]:
@@ -79,25 +83,27 @@ class PolicyStore:
 
     def update_policy(self, policy_id: str, **kwargs: object) -> Optional[dict]:
         """Update fields on an existing policy. Returns updated dict or None."""
-        policies = self._read_json(self._policies_path)
-        for p in policies:
-            if p["id"] == policy_id:
-                for key, value in kwargs.items():
-                    if key in ("name", "description", "rules", "version", "enabled"):
-                        p[key] = value
-                p["updated_at"] = datetime.utcnow().isoformat()
-                self._write_json(self._policies_path, policies)
-                return p
+        with self._lock:
+            policies = self._read_json(self._policies_path)
+            for p in policies:
+                if p["id"] == policy_id:
+                    for key, value in kwargs.items():
+                        if key in ("name", "description", "rules", "version", "enabled"):
+                            p[key] = value
+                    p["updated_at"] = datetime.utcnow().isoformat()
+                    self._write_json(self._policies_path, policies)
+                    return p
         return None
 
     def delete_policy(self, policy_id: str) -> bool:
         """Delete a policy by ID. Returns True if deleted."""
-        policies = self._read_json(self._policies_path)
-        original_len = len(policies)
-        policies = [p for p in policies if p["id"] != policy_id]
-        if len(policies) < original_len:
-            self._write_json(self._policies_path, policies)
-            return True
+        with self._lock:
+            policies = self._read_json(self._policies_path)
+            original_len = len(policies)
+            policies = [p for p in policies if p["id"] != policy_id]
+            if len(policies) < original_len:
+                self._write_json(self._policies_path, policies)
+                return True
         return False
 
     def toggle_policy(self, policy_id: str, enabled: bool) -> Optional[dict]:
@@ -6,8 +6,13 @@ Stores registry entries as JSON in a local directory.
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import json
+import os
+import tempfile
+import threading
+from collections.abc import Callable
 from pathlib import Path
 
 import yaml
@@ -28,6 +33,21 @@ def generate_library_id(name: str) -> str:
     return f"ale_{h}"
 
 
+# Publishing reads, extends and rewrites the index, so publishes to the same
+# index run one at a time, whichever LocalRegistry instance they go through.
+_index_locks: dict[Path, threading.Lock] = {}
+_index_locks_guard = threading.Lock()
+
+
+def _index_lock(index_path: Path) -> threading.Lock:
+    key = index_path.resolve()
+    with _index_locks_guard:
+        lock = _index_locks.get(key)
+        if lock is None:
+            lock = _index_locks[key] = threading.Lock()
+        return lock
+
+
 class LocalRegistry:
     """File-based local registry for Agentic Libraries."""
 
@@ -48,8 +68,16 @@ class LocalRegistry:
         with open(path) as f:
             data = yaml.safe_load(f)
 
+        return self.publish_data(data, library_path=path.resolve())
+
+    def publish_data(self, data: dict, library_path: str | Path = "") -> RegistryEntry:
+        """Publish an already-parsed Agentic Library document.
+
+        Used when the YAML is held in memory (e.g. from the web editor) so it
+        need not round-trip through a file.  ``library_path`` is recorded on
+        the entry when the document also lives on disk.
+        """
         lib = data.get("agentic_library", {})
-        manifest = lib.get("manifest", {})
 
         # Verify against spec
         schema_issues = validate_schema(data)
@@ -61,12 +89,29 @@ class LocalRegistry:
             hooks_runnable=any(v.get("hook") for v in lib.get("validation", [])),
         )
 
+        with _index_lock(self.index_path):
+            # Start from the index on disk so entries published through other
+            # instances since this one loaded are kept.
+            self._index = self._load_index()
+            entry = self._build_entry(data, verification, library_path)
+            self._index = {**self._index, entry.qualified_id: _entry_to_dict(entry)}
+            self._save_index()
+
+        return entry
+
+    def _build_entry(
+        self, data: dict, verification: VerificationResult, library_path: str | Path
+    ) -> RegistryEntry:
+        """Build the index entry for *data*, reusing the name's library_id."""
+        lib = data.get("agentic_library", {})
+        manifest = lib.get("manifest", {})
+
         # Generate or reuse library_id
         lib_name = manifest.get("name", "")
         existing_id = self.get_library_id(lib_name)
         library_id = existing_id if existing_id else generate_library_id(lib_name)
 
-        entry = RegistryEntry(
+        return RegistryEntry(
             name=lib_name,
             library_id=library_id,
             version=manifest.get("version", ""),
@@ -81,18 +126,12 @@ class LocalRegistry:
             language_agnostic=manifest.get("language_agnostic", True),
             target_languages=manifest.get("target_languages", []),
             quality=QualitySignals(verification=verification),
-            library_path=str(path.resolve()),
+            library_path=str(library_path),
             compatibility_targets=[
                 c.get("target_id", "") for c in lib.get("compatibility", [])
             ],
         )
 
-        # Store in index
-        self._index[entry.qualified_id] = _entry_to_dict(entry)
-        self._save_index()
-
-        return entry
-
     def get(self, name: str, version: str = "") -> RegistryEntry | None:
         """Get a specific library entry."""
         if version:
@@ -108,30 +147,17 @@ class LocalRegistry:
         return _dict_to_entry(self._index[latest_key])
 
     def search(self, query: SearchQuery) -> SearchResult:
-        """Search the registry."""
-        results = []
-
-        for data in self._index.values():
-            entry = _dict_to_entry(data)
-
-            if query.text and query.text.lower() not in (
-                entry.name + " " + entry.description
-            ).lower():
-                continue
-
-            if query.tags and not any(t in entry.tags for t in query.tags):
-                continue
-
-            if query.capabilities and not any(
-                c in entry.capabilities for c in query.capabilities
-            ):
-                continue
-
-            if query.verified_only and not entry.is_verified:
-                continue
-
-            results.append(entry)
+        """Search the registry.
 
+        Only the filters set on *query* are checked, against the raw index
+        records, and entries are built just for the matches.
+        """
+        checks = _query_checks(query)
+        results = [
+            _dict_to_entry(data)
+            for data in self._index.values()
+            if all(check(data) for check in checks)
+        ]
         return SearchResult(entries=results, total_count=len(results), query=query)
 
     def list_all(self) -> list[RegistryEntry]:
@@ -152,8 +178,44 @@ class LocalRegistry:
         return {}
 
     def _save_index(self):
-        with open(self.index_path, "w") as f:
-            json.dump(self._index, f, indent=2)
+        # Write-then-rename so concurrent readers never see a partial index;
+        # each save gets its own temp file so writers never share one.
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.registry_dir, prefix=".index.", suffix=".json.tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._index, f, indent=2)
+            os.chmod(tmp_path, 0o644)  # mkstemp creates the file 0600
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+
+def _query_checks(query: SearchQuery) -> list[Callable[[dict], bool]]:
+    """Return one predicate over an index record per filter set on *query*."""
+    checks: list[Callable[[dict], bool]] = []
+    if query.text:
+        text = query.text.lower()
+        checks.append(
+            lambda d: text in f"{d['name']} {d.get('description', '')}".lower()
+        )
+    if query.tags:
+        tags = set(query.tags)
+        checks.append(lambda d: not tags.isdisjoint(d.get("tags", [])))
+    if query.capabilities:
+        capabilities = set(query.capabilities)
+        checks.append(lambda d: not capabilities.isdisjoint(d.get("capabilities", [])))
+    if query.verified_only:
+        checks.append(
+            lambda d: bool(
+                d.get("quality", {}).get("verified_schema")
+                and d.get("quality", {}).get("verified_validator")
+            )
+        )
+    return checks
 
 
 def _entry_to_dict(entry: RegistryEntry) -> dict:
@@ -7,6 +7,7 @@ capabilities. All events are stored in ``~/.ale/audit_logs/``.
 from __future__ import annotations
 
 import json
+import threading
 import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
@@ -40,17 +41,21 @@ class AuditLogger:
     def __init__(self, base_dir: Optional[Path] = None) -> None:
         self._base_dir = base_dir or Path.home() / ".ale" / "audit_logs"
         self._base_dir.mkdir(parents=True, exist_ok=True)
+        # Entries grouped by (resource_type, resource_id), plus how many bytes
+        # of each daily file have been folded in; see _refresh_resource_index.
+        self._resource_index: dict[tuple[str, str], list[AuditEntry]] = {}
+        self._indexed_offsets: dict[Path, int] = {}
+        self._index_lock = threading.Lock()
+        # Per file: (bytes counted so far, non-blank lines in them)
+        self._line_counts: dict[Path, tuple[int, int]] = {}
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _log_file_for_date(self, dt: datetime) -> Path:
-        """Return the log file path for a given date."""
-        return self._base_dir / f"{dt.strftime('%Y-%m-%d')}.jsonl"
-
-    def _current_log_file(self) -> Path:
-        return self._log_file_for_date(datetime.now(timezone.utc))
+    def _log_file_for_day(self, day: str) -> Path:
+        """Return the log file path for a ``YYYY-MM-DD`` day."""
+        return self._base_dir / f"{day}.jsonl"
 
     def _read_all_entries(self) -> list[AuditEntry]:
         """Read every entry from all log files."""
@@ -66,6 +71,94 @@ class AuditLogger:
                 continue
         return entries
 
+    @staticmethod
+    def _read_complete_entries(path: Path) -> list[AuditEntry]:
+        """Parse the complete lines of *path*, skipping any that are malformed.
+
+        Anything after the last newline is a line still being appended
+        and is left for a later read, as in ``_count_lines``.
+        """
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return []
+        entries: list[AuditEntry] = []
+        for line in data[: data.rfind(b"\n") + 1].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entries.append(AuditEntry(**json.loads(line)))
+            except Exception:
+                continue
+        return entries
+
+    def _count_lines(self, path: Path) -> int:
+        """Return the number of entries in *path*, counting only new bytes.
+
+        Like the resource index, this relies on log files being append-only
+        and starts over if the file shrank.
+        """
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return 0
+        offset, count = self._line_counts.get(path, (0, 0))
+        if size < offset:
+            offset, count = 0, 0
+        if size > offset:
+            try:
+                with path.open("rb") as fh:
+                    fh.seek(offset)
+                    chunk = fh.read(size - offset)
+            except OSError:
+                return count
+            end = chunk.rfind(b"\n") + 1
+            count += sum(1 for line in chunk[:end].splitlines() if line.strip())
+            offset += end
+            self._line_counts[path] = (offset, count)
+        return count
+
+    def _refresh_resource_index(self) -> None:
+        """Fold lines appended since the last call into the resource index.
+
+        Log files are append-only, so only the unread tail of each file is
+        parsed; if a file shrank or vanished the index is rebuilt.  Callers
+        must hold ``self._index_lock``.
+        """
+        sizes: dict[Path, int] = {}
+        for path in sorted(self._base_dir.glob("*.jsonl")):
+            try:
+                sizes[path] = path.stat().st_size
+            except OSError:
+                continue
+        if any(sizes.get(path, 0) < n for path, n in self._indexed_offsets.items()):
+            self._resource_index.clear()
+            self._indexed_offsets.clear()
+
+        index = self._resource_index
+        for path, size in sizes.items():
+            offset = self._indexed_offsets.get(path, 0)
+            if size <= offset:
+                continue
+            try:
+                with path.open("rb") as fh:
+                    fh.seek(offset)
+                    chunk = fh.read(size - offset)
+            except OSError:
+                continue
+            # Stop at the last newline; a line still being written is
+            # picked up on the next refresh.
+            end = chunk.rfind(b"\n") + 1
+            for line in chunk[:end].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    entry = AuditEntry(**json.loads(line))
+                except Exception:
+                    continue
+                index.setdefault((entry.resource_type, entry.resource_id), []).append(entry)
+            self._indexed_offsets[path] = offset + end
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -82,7 +175,32 @@ class AuditLogger:
         success: bool = True,
     ) -> AuditEntry:
         """Record an audit event and return the created entry."""
-        entry = AuditEntry(
+        entry = self.new_entry(
+            actor,
+            action,
+            resource_type,
+            resource_id,
+            details,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            success=success,
+        )
+        self.log_entries([entry])
+        return entry
+
+    def new_entry(
+        self,
+        actor: str,
+        action: str,
+        resource_type: str,
+        resource_id: str,
+        details: dict[str, Any] | None = None,
+        ip_address: str = "",
+        user_agent: str = "",
+        success: bool = True,
+    ) -> AuditEntry:
+        """Build a timestamped entry without persisting it (see ``log_entries``)."""
+        return AuditEntry(
             id=uuid.uuid4().hex[:16],
             timestamp=datetime.now(timezone.utc).isoformat(),
             actor=actor,
@@ -94,10 +212,16 @@ class AuditLogger:
             user_agent=user_agent,
             success=success,
         )
-        log_file = self._current_log_file()
-        with log_file.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(asdict(entry)) + "\n")
-        return entry
+
+    def log_entries(self, entries: list[AuditEntry]) -> None:
+        """Append *entries* to their daily log files, one write per file."""
+        by_day: dict[str, list[str]] = {}
+        for entry in entries:
+            # Timestamps are UTC ISO-8601, so the first 10 chars are the day.
+            by_day.setdefault(entry.timestamp[:10], []).append(json.dumps(asdict(entry)) + "\n")
+        for day, lines in by_day.items():
+            with self._log_file_for_day(day).open("a", encoding="utf-8") as fh:
+                fh.write("".join(lines))
 
     def get_events(
         self,
@@ -127,16 +251,38 @@ class AuditLogger:
         entries.sort(key=lambda e: e.timestamp, reverse=True)
         return entries[:limit]
 
+    def count_events(self, day: str | None = None) -> int:
+        """Count logged events, optionally only those on ``YYYY-MM-DD`` *day*.
+
+        Lines are counted without being parsed, and only lines appended
+        since the previous call are read; each daily file holds the events
+        whose timestamp falls on that day.
+        """
+        paths = [self._log_file_for_day(day)] if day else self._base_dir.glob("*.jsonl")
+        return sum(self._count_lines(path) for path in paths)
+
+    def get_recent_events(self, n: int = 10) -> list[AuditEntry]:
+        """Return the *n* newest events, parsing only the newest daily files."""
+        recent: list[AuditEntry] = []
+        for path in sorted(self._base_dir.glob("*.jsonl"), reverse=True):
+            entries = self._read_complete_entries(path)
+            entries.sort(key=lambda e: e.timestamp, reverse=True)
+            recent.extend(entries[: n - len(recent)])
+            if len(recent) >= n:
+                break
+        return recent
+
     def get_events_for_resource(
         self, resource_type: str, resource_id: str
     ) -> list[AuditEntry]:
-        """Return all events for a specific resource."""
-        entries = self._read_all_entries()
-        result = [
-            e
-            for e in entries
-            if e.resource_type == resource_type and e.resource_id == resource_id
-        ]
+        """Return all events for a specific resource.
+
+        Served from an in-memory index that is brought up to date by reading
+        only what was appended to the logs since the previous lookup.
+        """
+        with self._index_lock:
+            self._refresh_resource_index()
+            result = list(self._resource_index.get((resource_type, resource_id), ()))
         result.sort(key=lambda e: e.timestamp, reverse=True)
         return result
 
@@ -164,7 +310,11 @@ class AuditLogger:
             end_date=end_date,
             limit=limit,
         )
+        return self.format_events(entries, fmt)
 
+    @staticmethod
+    def format_events(entries: list[AuditEntry], fmt: str = "json") -> str:
+        """Render already-fetched *entries* as ``json`` or ``csv`` export text."""
         if fmt == "csv":
             lines = [
                 "id,timestamp,actor,action,resource_type,resource_id,success,ip_address,user_agent"
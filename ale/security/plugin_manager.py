@@ -7,9 +7,11 @@ extensibility plugins.  Storage is file-based JSON in ``~/.ale/plugins/``.
 from __future__ import annotations
 
 import json
+import os
+import threading
 import time
 import uuid
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -57,12 +59,27 @@ PLUGIN_HOOKS = [
 
 
 class PluginManager:
-    """Manages extensibility plugins with file-based JSON persistence."""
+    """Manages extensibility plugins with file-based JSON persistence.
 
-    def __init__(self, base_dir: Optional[Path] = None) -> None:
+    Like ``WebhookManager``, plugins are loaded once into an in-memory
+    index and the file is only rewritten on mutation, optionally debounced
+    by *flush_interval* seconds.
+    """
+
+    def __init__(
+        self, base_dir: Path | None = None, flush_interval: float = 0.0
+    ) -> None:
         self._base_dir = base_dir or Path.home() / ".ale" / "plugins"
         self._base_dir.mkdir(parents=True, exist_ok=True)
         self._plugins_file = self._base_dir / "plugins.json"
+        self._lock = threading.Lock()
+        self._flush_interval = flush_interval
+        self._flush_timer: threading.Timer | None = None
+        self._dirty = False
+        self.coalesced_writes = 0
+        self._by_id: dict[str, Plugin] = {
+            p.id: p for p in map(self._plugin_from_dict, self._load_plugins())
+        }
 
     # ------------------------------------------------------------------
     # Persistence helpers
@@ -76,8 +93,37 @@ class PluginManager:
                 return []
         return []
 
-    def _save_plugins(self, data: list[dict[str, Any]]) -> None:
-        self._plugins_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    def _save_plugins(self) -> None:
+        """Persist the index now, or schedule a write if writes are debounced.
+
+        Callers must hold ``self._lock``.
+        """
+        self._dirty = True
+        if self._flush_interval <= 0:
+            self._write_plugins()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self._flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+        else:
+            self.coalesced_writes += 1
+
+    def _write_plugins(self) -> None:
+        data = [asdict(x) for x in self._by_id.values()]
+        # Write-then-rename so a crash never leaves a truncated file behind
+        tmp_path = self._plugins_file.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self._plugins_file)
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Write any pending plugin changes to disk."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self._write_plugins()
 
     @staticmethod
     def _plugin_from_dict(d: dict[str, Any]) -> Plugin:
@@ -104,19 +150,16 @@ class PluginManager:
             enabled=True,
             created_at=datetime.now(timezone.utc).isoformat(),
         )
-        plugins = self._load_plugins()
-        plugins.append(asdict(plugin))
-        self._save_plugins(plugins)
+        with self._lock:
+            self._by_id[plugin.id] = plugin
+            self._save_plugins()
         return plugin
 
     def list_plugins(self) -> list[Plugin]:
-        return [self._plugin_from_dict(d) for d in self._load_plugins()]
+        return list(self._by_id.values())
 
     def get_plugin(self, plugin_id: str) -> Optional[Plugin]:
-        for d in self._load_plugins():
-            if d.get("id") == plugin_id:
-                return self._plugin_from_dict(d)
-        return None
+        return self._by_id.get(plugin_id)
 
     def enable_plugin(self, plugin_id: str) -> Plugin:
         return self._set_enabled(plugin_id, True)
@@ -125,31 +168,27 @@ class PluginManager:
         return self._set_enabled(plugin_id, False)
 
     def _set_enabled(self, plugin_id: str, enabled: bool) -> Plugin:
-        plugins = self._load_plugins()
-        for d in plugins:
-            if d.get("id") == plugin_id:
-                d["enabled"] = enabled
-                self._save_plugins(plugins)
-                return self._plugin_from_dict(d)
-        raise ValueError(f"Plugin {plugin_id} not found")
+        return self.update_plugin(plugin_id, enabled=enabled)
 
     def update_plugin(self, plugin_id: str, **kwargs: Any) -> Plugin:
-        plugins = self._load_plugins()
-        for d in plugins:
-            if d.get("id") == plugin_id:
-                for k, v in kwargs.items():
-                    if k in Plugin.__dataclass_fields__ and k != "id":
-                        d[k] = v
-                self._save_plugins(plugins)
-                return self._plugin_from_dict(d)
-        raise ValueError(f"Plugin {plugin_id} not found")
+        changes = {
+            k: v
+            for k, v in kwargs.items()
+            if k in Plugin.__dataclass_fields__ and k != "id"
+        }
+        with self._lock:
+            plugin = self._by_id.get(plugin_id)
+            if plugin is None:
+                raise ValueError(f"Plugin {plugin_id} not found")
+            plugin = self._by_id[plugin_id] = replace(plugin, **changes)
+            self._save_plugins()
+        return plugin
 
     def delete_plugin(self, plugin_id: str) -> bool:
-        plugins = self._load_plugins()
-        new = [d for d in plugins if d.get("id") != plugin_id]
-        if len(new) == len(plugins):
-            return False
-        self._save_plugins(new)
+        with self._lock:
+            if self._by_id.pop(plugin_id, None) is None:
+                return False
+            self._save_plugins()
         return True
 
     # ------------------------------------------------------------------
@@ -2,21 +2,28 @@
 
 Provides registration, firing, delivery tracking, and retry capabilities
 for outbound webhooks.  Webhook payloads are signed with HMAC-SHA256 and
-delivered via ``urllib.request`` (no extra dependencies).
+delivered with the standard library (no extra dependencies): ``http.client``
+connections are kept alive and reused per host, falling back to
+``urllib.request`` when a proxy is configured.
 
-Storage is file-based JSON in ``~/.ale/webhooks/``.
+Storage is file-based JSON in ``~/.ale/webhooks/``; delivery records are
+appended to a JSON-lines log.
 """
 
 from __future__ import annotations
 
 import hashlib
 import hmac
+import http.client
 import json
+import os
+import threading
 import time
+import urllib.parse
 import urllib.request
 import uuid
-from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
+from dataclasses import asdict, dataclass, field, replace
+from datetime import UTC, datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
@@ -55,6 +62,18 @@ class WebhookDelivery:
     duration_ms: int = 0
 
 
+# Idle keep-alive connections kept per (scheme, host, port)
+_KEEPALIVE_PER_HOST = 4
+_PoolKey = tuple[str, str, int | None]
+
+# Errors meaning an idle keep-alive connection was closed by the server
+# before it was reused; the request is retried once on a new connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
 # All supported webhook event types
 WEBHOOK_EVENTS = [
     "library.published",
@@ -68,13 +87,45 @@ WEBHOOK_EVENTS = [
 
 
 class WebhookManager:
-    """Manages webhooks with file-based JSON persistence."""
-
-    def __init__(self, base_dir: Optional[Path] = None) -> None:
+    """Manages webhooks with file-based JSON persistence.
+
+    Webhooks are read from disk once and served from an in-memory index;
+    the file is only written on mutation.  Stored ``Webhook`` objects are
+    replaced rather than mutated, so instances handed to callers never
+    change underneath them.
+
+    With a positive *flush_interval*, writes are debounced: the first
+    mutation schedules a flush that many seconds later, and mutations
+    made in the meantime are folded into it (counted in
+    ``coalesced_writes``).  Long-lived owners should call ``flush()`` at
+    shutdown.
+    """
+
+    def __init__(
+        self, base_dir: Path | None = None, flush_interval: float = 0.0
+    ) -> None:
         self._base_dir = base_dir or Path.home() / ".ale" / "webhooks"
         self._base_dir.mkdir(parents=True, exist_ok=True)
         self._hooks_file = self._base_dir / "webhooks.json"
+        # deliveries.json is the older whole-file format, still read but no
+        # longer written; new records are appended to deliveries.jsonl.
         self._deliveries_file = self._base_dir / "deliveries.json"
+        self._deliveries_log = self._base_dir / "deliveries.jsonl"
+        self._lock = threading.Lock()
+        self._flush_interval = flush_interval
+        self._flush_timer: threading.Timer | None = None
+        self._dirty = False
+        self.coalesced_writes = 0
+        # Timestamps of failed deliveries, and how much of the delivery log
+        # has been scanned for them; see count_failed_deliveries.
+        self._failed_at: list[str] = []
+        self._failed_offset = -1
+        self._failed_lock = threading.Lock()
+        self._conn_lock = threading.Lock()
+        self._idle_conns: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+        self._by_id: dict[str, Webhook] = {
+            w.id: w for w in map(self._webhook_from_dict, self._load_webhooks())
+        }
 
     # ------------------------------------------------------------------
     # Persistence helpers
@@ -88,19 +139,59 @@ class WebhookManager:
                 return []
         return []
 
-    def _save_webhooks(self, data: list[dict[str, Any]]) -> None:
-        self._hooks_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    def _save_webhooks(self) -> None:
+        """Persist the index now, or schedule a write if writes are debounced.
+
+        Callers must hold ``self._lock``.
+        """
+        self._dirty = True
+        if self._flush_interval <= 0:
+            self._write_webhooks()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self._flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+        else:
+            self.coalesced_writes += 1
+
+    def _write_webhooks(self) -> None:
+        data = [asdict(x) for x in self._by_id.values()]
+        # Write-then-rename so a crash never leaves a truncated file behind
+        tmp_path = self._hooks_file.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self._hooks_file)
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Write any pending webhook changes to disk."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self._write_webhooks()
 
     def _load_deliveries(self) -> list[dict[str, Any]]:
+        data: list[dict[str, Any]] = []
         if self._deliveries_file.exists():
             try:
-                return json.loads(self._deliveries_file.read_text(encoding="utf-8"))
+                data.extend(json.loads(self._deliveries_file.read_text(encoding="utf-8")))
             except Exception:
-                return []
-        return []
-
-    def _save_deliveries(self, data: list[dict[str, Any]]) -> None:
-        self._deliveries_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+                pass
+        if self._deliveries_log.exists():
+            for line in self._deliveries_log.read_text(encoding="utf-8").splitlines():
+                if line.strip():
+                    try:
+                        data.append(json.loads(line))
+                    except ValueError:
+                        continue
+        return data
+
+    def _append_deliveries(self, deliveries: list[WebhookDelivery]) -> None:
+        if not deliveries:
+            return
+        with self._deliveries_log.open("a", encoding="utf-8") as fh:
+            fh.write("".join(json.dumps(asdict(d)) + "\n" for d in deliveries))
 
     @staticmethod
     def _webhook_from_dict(d: dict[str, Any]) -> Webhook:
@@ -136,38 +227,37 @@ class WebhookManager:
             created_at=now,
             updated_at=now,
         )
-        hooks = self._load_webhooks()
-        hooks.append(asdict(wh))
-        self._save_webhooks(hooks)
+        with self._lock:
+            self._by_id[wh.id] = wh
+            self._save_webhooks()
         return wh
 
     def get_webhook(self, webhook_id: str) -> Optional[Webhook]:
-        for d in self._load_webhooks():
-            if d.get("id") == webhook_id:
-                return self._webhook_from_dict(d)
-        return None
+        return self._by_id.get(webhook_id)
 
     def list_webhooks(self) -> list[Webhook]:
-        return [self._webhook_from_dict(d) for d in self._load_webhooks()]
+        return list(self._by_id.values())
 
     def update_webhook(self, webhook_id: str, **kwargs: Any) -> Webhook:
-        hooks = self._load_webhooks()
-        for d in hooks:
-            if d.get("id") == webhook_id:
-                for k, v in kwargs.items():
-                    if k in Webhook.__dataclass_fields__ and k != "id":
-                        d[k] = v
-                d["updated_at"] = datetime.now(timezone.utc).isoformat()
-                self._save_webhooks(hooks)
-                return self._webhook_from_dict(d)
-        raise ValueError(f"Webhook {webhook_id} not found")
+        changes = {
+            k: v
+            for k, v in kwargs.items()
+            if k in Webhook.__dataclass_fields__ and k != "id"
+        }
+        changes["updated_at"] = datetime.now(UTC).isoformat()
+        with self._lock:
+            wh = self._by_id.get(webhook_id)
+            if wh is None:
+                raise ValueError(f"Webhook {webhook_id} not found")
+            wh = self._by_id[webhook_id] = replace(wh, **changes)
+            self._save_webhooks()
+        return wh
 
     def delete_webhook(self, webhook_id: str) -> bool:
-        hooks = self._load_webhooks()
-        new = [d for d in hooks if d.get("id") != webhook_id]
-        if len(new) == len(hooks):
-            return False
-        self._save_webhooks(new)
+        with self._lock:
+            if self._by_id.pop(webhook_id, None) is None:
+                return False
+            self._save_webhooks()
         return True
 
     def toggle_webhook(self, webhook_id: str, active: bool) -> Webhook:
@@ -189,16 +279,21 @@ class WebhookManager:
         Returns a list of delivery records, one per matching webhook.
         """
         hooks = [w for w in self.list_webhooks() if w.active and event in w.events]
-        deliveries_data = self._load_deliveries()
-        results: list[WebhookDelivery] = []
+        results = [self._deliver(wh, event, payload) for wh in hooks]
+        self._append_deliveries(results)
+        return results
 
-        for wh in hooks:
-            delivery = self._deliver(wh, event, payload)
-            deliveries_data.append(asdict(delivery))
-            results.append(delivery)
+    def deliver(
+        self, wh: Webhook, event: str, payload: dict[str, Any]
+    ) -> WebhookDelivery:
+        """Deliver *payload* to one webhook, record the attempt, and return it.
 
-        self._save_deliveries(deliveries_data)
-        return results
+        Blocks for the HTTP round trip; async callers should run it in a
+        worker thread.
+        """
+        delivery = self._deliver(wh, event, payload)
+        self._append_deliveries([delivery])
+        return delivery
 
     def _deliver(
         self, wh: Webhook, event: str, payload: dict[str, Any]
@@ -219,13 +314,9 @@ class WebhookManager:
         success = False
 
         try:
-            req = urllib.request.Request(
-                wh.url, data=body, headers=headers, method="POST"
-            )
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                status = resp.status
-                resp_body = resp.read().decode("utf-8", errors="replace")[:2000]
-                success = 200 <= status < 300
+            status, raw = self._post(wh.url, body, headers)
+            resp_body = raw.decode("utf-8", errors="replace")[:2000]
+            success = 200 <= status < 300
         except Exception as exc:
             resp_body = str(exc)[:2000]
 
@@ -243,6 +334,68 @@ class WebhookManager:
             duration_ms=duration,
         )
 
+    def _post(self, url: str, body: bytes, headers: dict[str, str]) -> tuple[int, bytes]:
+        """POST *body* to *url* and return ``(status, response body)``.
+
+        Reuses an idle keep-alive connection to the same host when there is
+        one, so repeat deliveries skip the TCP and TLS handshakes.
+        """
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or urllib.request.getproxies():
+            req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+            with urllib.request.urlopen(req, timeout=10) as resp:
+                return resp.status, resp.read()
+
+        key = (parts.scheme, parts.hostname or "", parts.port)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        while True:
+            conn, reused = self._checkout_connection(key)
+            try:
+                conn.request("POST", target, body=body, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin_connection(key, conn)
+            return resp.status, data
+
+    def _checkout_connection(self, key: _PoolKey) -> tuple[http.client.HTTPConnection, bool]:
+        """Return ``(connection, reused)`` for exclusive use by one request."""
+        with self._conn_lock:
+            idle = self._idle_conns.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, port, timeout=10), False
+
+    def _checkin_connection(self, key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._conn_lock:
+            idle = self._idle_conns.setdefault(key, [])
+            if len(idle) < _KEEPALIVE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close idle delivery connections."""
+        with self._conn_lock:
+            conns = [c for idle in self._idle_conns.values() for c in idle]
+            self._idle_conns.clear()
+        for conn in conns:
+            conn.close()
+
     # ------------------------------------------------------------------
     # Delivery history
     # ------------------------------------------------------------------
@@ -260,6 +413,51 @@ class WebhookManager:
         deliveries.sort(key=lambda d: d.delivered_at, reverse=True)
         return deliveries[:limit]
 
+    def count_failed_deliveries(self, since: str = "") -> int:
+        """Count failed deliveries made at or after the ISO timestamp *since*.
+
+        Failure timestamps are kept in memory and topped up from the unread
+        tail of the append-only delivery log, so each call parses only the
+        records written since the last one.
+        """
+        with self._failed_lock:
+            self._refresh_failed()
+            return sum(1 for t in self._failed_at if t >= since)
+
+    def _refresh_failed(self) -> None:
+        try:
+            size = self._deliveries_log.stat().st_size
+        except OSError:
+            size = 0
+        if size < self._failed_offset or self._failed_offset < 0:
+            # First call, or the log was replaced: start over, legacy file included
+            self._failed_at = []
+            self._failed_offset = 0
+            if self._deliveries_file.exists():
+                try:
+                    legacy = json.loads(self._deliveries_file.read_text(encoding="utf-8"))
+                except Exception:
+                    legacy = []
+                self._failed_at.extend(
+                    d.get("delivered_at", "") for d in legacy if not d.get("success", False)
+                )
+        if size <= self._failed_offset:
+            return
+        with self._deliveries_log.open("rb") as fh:
+            fh.seek(self._failed_offset)
+            chunk = fh.read(size - self._failed_offset)
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                d = json.loads(line)
+            except ValueError:
+                continue
+            if not d.get("success", False):
+                self._failed_at.append(d.get("delivered_at", ""))
+        self._failed_offset += end
+
     def retry_delivery(self, delivery_id: str) -> WebhookDelivery:
         """Retry a previous delivery by replaying the same event/payload."""
         for d in self._load_deliveries():
@@ -268,10 +466,5 @@ class WebhookManager:
                 wh = self.get_webhook(original.webhook_id)
                 if wh is None:
                     raise ValueError(f"Webhook {original.webhook_id} not found")
-                delivery = self._deliver(wh, original.event, original.payload)
-                # Persist the new delivery
-                deliveries = self._load_deliveries()
-                deliveries.append(asdict(delivery))
-                self._save_deliveries(deliveries)
-                return delivery
+                return self.deliver(wh, original.event, original.payload)
         raise ValueError(f"Delivery {delivery_id} not found")
@@ -0,0 +1,115 @@
+"""Tests for the file-based audit logger."""
+
+import json
+
+from ale.security.audit_log import AuditLogger
+
+
+def _log_file(logger: AuditLogger):
+    return next(logger._base_dir.glob("*.jsonl"))
+
+
+def _entry_line(logger: AuditLogger, resource_id: str) -> str:
+    entry = logger.new_entry("alice", "webhook.create", "webhook", resource_id)
+    return json.dumps(vars(entry))
+
+
+def test_log_and_query(tmp_path):
+    logger = AuditLogger(tmp_path)
+    logger.log_event("alice", "webhook.create", "webhook", "w1")
+    logger.log_event("bob", "plugin.create", "plugin", "p1")
+
+    assert logger.count_events() == 2
+    assert [e.actor for e in logger.get_events(resource_type="plugin")] == ["bob"]
+    assert [e.resource_id for e in logger.get_events_for_resource("webhook", "w1")] == ["w1"]
+
+
+def test_per_day_counts_and_recent_events(tmp_path):
+    logger = AuditLogger(tmp_path)
+    entries = []
+    for ts in (
+        "2026-01-01T10:00:00+00:00",
+        "2026-01-02T09:00:00+00:00",
+        "2026-01-02T11:00:00+00:00",
+    ):
+        entry = logger.new_entry("alice", "webhook.create", "webhook", ts[:10])
+        entry.timestamp = ts
+        entries.append(entry)
+    logger.log_entries(entries)
+
+    assert logger.count_events(day="2026-01-01") == 1
+    assert logger.count_events(day="2026-01-02") == 2
+    assert logger.count_events(day="2026-01-03") == 0
+    assert logger.count_events() == 3
+    recent = logger.get_recent_events(2)
+    assert [e.timestamp[:13] for e in recent] == ["2026-01-02T11", "2026-01-02T09"]
+
+
+def test_counts_and_index_pick_up_appends_from_other_writers(tmp_path):
+    logger = AuditLogger(tmp_path)
+    logger.log_event("alice", "webhook.create", "webhook", "w1")
+    assert logger.count_events() == 1
+    assert len(logger.get_events_for_resource("webhook", "w1")) == 1
+
+    AuditLogger(tmp_path).log_event("bob", "webhook.update", "webhook", "w1")
+    assert logger.count_events() == 2
+    assert len(logger.get_events_for_resource("webhook", "w1")) == 2
+
+
+def test_partial_trailing_line_is_read_once_complete(tmp_path):
+    logger = AuditLogger(tmp_path)
+    logger.log_event("alice", "webhook.create", "webhook", "w1")
+    path = _log_file(logger)
+    line = _entry_line(logger, "w1")
+
+    with path.open("a") as fh:
+        fh.write(line[:20])
+    assert logger.count_events() == 1
+    assert len(logger.get_events_for_resource("webhook", "w1")) == 1
+
+    with path.open("a") as fh:
+        fh.write(line[20:] + "\n")
+    assert logger.count_events() == 2
+    assert len(logger.get_events_for_resource("webhook", "w1")) == 2
+
+
+def test_truncated_file_resets_counts_and_index(tmp_path):
+    logger = AuditLogger(tmp_path)
+    for resource_id in ("w1", "w2", "w2"):
+        logger.log_event("alice", "webhook.create", "webhook", resource_id)
+    assert logger.count_events() == 3
+    assert len(logger.get_events_for_resource("webhook", "w2")) == 2
+
+    path = _log_file(logger)
+    path.write_text(_entry_line(logger, "w1") + "\n")
+    assert logger.count_events() == 1
+    assert logger.get_events_for_resource("webhook", "w2") == []
+    assert len(logger.get_events_for_resource("webhook", "w1")) == 1
+
+
+def test_removed_file_drops_its_events(tmp_path):
+    logger = AuditLogger(tmp_path)
+    old = logger.new_entry("alice", "webhook.create", "webhook", "w1")
+    old.timestamp = "2026-01-01T10:00:00+00:00"
+    logger.log_entries([old])
+    logger.log_event("alice", "webhook.update", "webhook", "w1")
+    assert logger.count_events() == 2
+    assert len(logger.get_events_for_resource("webhook", "w1")) == 2
+
+    (tmp_path / "2026-01-01.jsonl").unlink()
+    assert logger.count_events() == 1
+    assert logger.count_events(day="2026-01-01") == 0
+    assert [e.action for e in logger.get_events_for_resource("webhook", "w1")] == [
+        "webhook.update"
+    ]
+
+
+def test_recent_events_skip_bad_and_partial_lines(tmp_path):
+    logger = AuditLogger(tmp_path)
+    for resource_id in ("w1", "w2", "w3"):
+        logger.log_event("alice", "webhook.create", "webhook", resource_id)
+    path = _log_file(logger)
+    lines = path.read_text().splitlines(keepends=True)
+    path.write_text(lines[0] + "not json\n" + "".join(lines[1:]) + _entry_line(logger, "w4")[:20])
+
+    assert {e.resource_id for e in logger.get_recent_events(10)} == {"w1", "w2", "w3"}
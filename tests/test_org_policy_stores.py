@@ -0,0 +1,88 @@
+"""Tests for the file-based org, policy and approval stores."""
+
+import threading
+
+import pytest
+
+from ale.orgs.models import Organization
+from ale.orgs.org_store import OrgStore
+from ale.policies.approval_store import ApprovalStore
+from ale.policies.policy_store import PolicyStore
+
+
+def _run_concurrently(fn, threads: int = 8, per_thread: int = 25) -> None:
+    start = threading.Barrier(threads)
+
+    def worker(t):
+        start.wait()
+        for i in range(per_thread):
+            fn(t, i)
+
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+
+def test_concurrent_org_writes_are_not_lost(tmp_path):
+    store = OrgStore(str(tmp_path))
+    store.create_org(Organization(id="o1", name="Org", slug="org"))
+
+    _run_concurrently(lambda t, i: store.add_repo("o1", f"r{t}-{i}", "http://x"))
+    _run_concurrently(lambda t, i: store.add_member("o1", f"u{t}-{i}"))
+
+    reloaded = OrgStore(str(tmp_path))
+    assert len(reloaded.list_repos("o1")) == 200
+    assert len(reloaded.list_members("o1")) == 200
+
+
+def test_concurrent_policy_and_approval_writes_are_not_lost(tmp_path):
+    policies = PolicyStore(str(tmp_path / "policies"))
+    approvals = ApprovalStore(str(tmp_path / "approvals"))
+
+    _run_concurrently(lambda t, i: policies.create_policy(f"p{t}-{i}"))
+    _run_concurrently(lambda t, i: approvals.create_request("lib", "1.0.0", f"u{t}", f"p{i}"))
+
+    assert len(PolicyStore(str(tmp_path / "policies")).list_policies()) == 200
+    assert ApprovalStore(str(tmp_path / "approvals")).get_pending_count() == 200
+
+
+def test_failed_org_write_leaves_cached_state_untouched(tmp_path, monkeypatch):
+    store = OrgStore(str(tmp_path))
+    store.create_org(Organization(id="o1", name="Before", slug="org"))
+    store.add_member("o1", "u1", "member")
+    assert store.get_member("o1", "u1").role.value == "member"
+
+    def fail(path, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "_write_json", fail)
+    with pytest.raises(OSError):
+        store.update_org("o1", name="After")
+    with pytest.raises(OSError):
+        store.update_member_role("o1", "u1", "admin")
+
+    assert store.get_org("o1").name == "Before"
+    assert store.get_member("o1", "u1").role.value == "member"
+
+
+def test_late_scan_finalize_does_not_resurrect_or_overwrite(tmp_path):
+    pytest.importorskip("fastapi")
+    from web.backend.app.routers.orgs import _finalize_scan
+
+    store = OrgStore(str(tmp_path))
+    removed = store.add_repo("o1", "gone", "http://x")
+    reset = store.add_repo("o1", "reset", "http://y")
+    scanning = store.add_repo("o1", "scanning", "http://z")
+    for repo in (removed, reset, scanning):
+        store.update_repo_status(repo.id, "scanning", last_scanned="t0")
+    store.remove_repo(removed.id)
+    store.update_repo_status(reset.id, "error")
+
+    for repo in (removed, reset, scanning):
+        _finalize_scan(store, repo.id, "t0")
+
+    assert store.get_repo(removed.id) is None
+    assert store.get_repo(reset.id).scan_status.value == "error"
+    assert store.get_repo(scanning.id).scan_status.value == "complete"
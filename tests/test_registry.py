@@ -1,6 +1,7 @@
 """Tests for the local registry."""
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
@@ -67,6 +68,19 @@ def test_publish_and_get():
         assert retrieved.name == "my-lib"
 
 
+def test_publish_data_from_memory():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        reg = LocalRegistry(Path(tmpdir) / "registry")
+        with open(_write_library(tmpdir, "mem-lib")) as f:
+            data = yaml.safe_load(f)
+
+        entry = reg.publish_data(data)
+        assert entry.name == "mem-lib"
+        assert entry.is_verified
+        assert entry.library_path == ""
+        assert reg.get("mem-lib") is not None
+
+
 def test_publish_multiple_versions():
     with tempfile.TemporaryDirectory() as tmpdir:
         reg = LocalRegistry(Path(tmpdir) / "registry")
@@ -154,3 +168,30 @@ def test_empty_registry():
         assert reg.list_all() == []
         result = reg.search(SearchQuery(text="anything"))
         assert result.total_count == 0
+
+
+def test_search_by_capability_and_text():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        reg = LocalRegistry(Path(tmpdir) / "registry")
+        _write_library(tmpdir, "cache-lib", capabilities=["kv_store"])
+        _write_library(tmpdir, "cache-proxy", capabilities=["http_client"])
+        reg.publish(Path(tmpdir) / "cache-lib.agentic.yaml")
+        reg.publish(Path(tmpdir) / "cache-proxy.agentic.yaml")
+
+        result = reg.search(SearchQuery(text="CACHE", capabilities=["kv_store"]))
+        assert [e.name for e in result.entries] == ["cache-lib"]
+
+
+def test_concurrent_publishes_through_separate_instances_are_kept():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        registry_dir = Path(tmpdir) / "registry"
+        docs = []
+        for i in range(12):
+            with open(_write_library(tmpdir, f"lib-{i}")) as f:
+                docs.append(yaml.safe_load(f))
+
+        with ThreadPoolExecutor(max_workers=12) as pool:
+            list(pool.map(lambda d: LocalRegistry(registry_dir).publish_data(d), docs))
+
+        assert len(LocalRegistry(registry_dir).list_all()) == 12
+        assert list(registry_dir.glob("*.tmp")) == []
@@ -0,0 +1,79 @@
+"""Tests for the webhook and plugin stores (in-memory index, debounced writes)."""
+
+import json
+
+from ale.security.plugin_manager import PluginManager
+from ale.security.webhook_manager import WebhookManager
+
+
+def _stored(path) -> list[dict]:
+    return json.loads(path.read_text()) if path.exists() else []
+
+
+def test_webhooks_write_through_by_default(tmp_path):
+    manager = WebhookManager(tmp_path)
+    wh = manager.register_webhook("http://example.invalid/hook", ["library.published"])
+
+    assert [d["id"] for d in _stored(tmp_path / "webhooks.json")] == [wh.id]
+    assert WebhookManager(tmp_path).get_webhook(wh.id) == wh
+
+
+def test_webhook_updates_do_not_change_returned_objects(tmp_path):
+    manager = WebhookManager(tmp_path)
+    wh = manager.register_webhook("http://example.invalid/hook", [], name="before")
+    updated = manager.update_webhook(wh.id, name="after")
+
+    assert wh.name == "before"
+    assert updated.name == "after"
+    assert manager.get_webhook(wh.id).name == "after"
+
+
+def test_debounced_webhook_mutations_are_on_disk_after_flush(tmp_path):
+    manager = WebhookManager(tmp_path, flush_interval=60)
+    keep = manager.register_webhook("http://example.invalid/a", [])
+    drop = manager.register_webhook("http://example.invalid/b", [])
+    manager.toggle_webhook(keep.id, False)
+    manager.delete_webhook(drop.id)
+
+    assert _stored(tmp_path / "webhooks.json") == []
+    assert manager.coalesced_writes == 3
+
+    manager.flush()
+    stored = _stored(tmp_path / "webhooks.json")
+    assert [(d["id"], d["active"]) for d in stored] == [(keep.id, False)]
+    assert WebhookManager(tmp_path).list_webhooks() == manager.list_webhooks()
+    assert not (tmp_path / "webhooks.json.tmp").exists()
+
+
+def test_debounced_plugin_mutations_are_on_disk_after_flush(tmp_path):
+    manager = PluginManager(tmp_path, flush_interval=60)
+    plugin = manager.register_plugin("lint", hooks=["pre_publish"])
+    manager.disable_plugin(plugin.id)
+
+    assert _stored(tmp_path / "plugins.json") == []
+
+    manager.flush()
+    reloaded = PluginManager(tmp_path).get_plugin(plugin.id)
+    assert reloaded is not None
+    assert not reloaded.enabled
+
+
+def test_failed_delivery_count_reads_only_complete_lines(tmp_path):
+    manager = WebhookManager(tmp_path)
+    (tmp_path / "deliveries.json").write_text(
+        json.dumps([{"id": "old", "success": False, "delivered_at": "2026-01-01T00:00:00"}])
+    )
+    log = tmp_path / "deliveries.jsonl"
+    failed = json.dumps({"id": "d1", "success": False, "delivered_at": "2026-01-02T00:00:00"})
+    ok = json.dumps({"id": "d2", "success": True, "delivered_at": "2026-01-02T00:00:00"})
+
+    log.write_text(ok + "\n" + failed[:10])
+    assert manager.count_failed_deliveries() == 1
+    with log.open("a") as fh:
+        fh.write(failed[10:] + "\n")
+    assert manager.count_failed_deliveries() == 2
+    assert manager.count_failed_deliveries(since="2026-01-02") == 1
+
+    # A replaced log is rescanned from the start
+    log.write_text(ok + "\n")
+    assert manager.count_failed_deliveries() == 1
@@ -0,0 +1,30 @@
+"""Tests for LLM usage tracking."""
+
+from ale.llm.usage_tracker import UsageTracker
+
+
+def test_record_and_total_tokens(tmp_path):
+    tracker = UsageTracker(tmp_path)
+    tracker.record_usage("model", 10, 5, "enrich", 0.01)
+    tracker.record_usage("model", 1, 2, "enrich", 0.01)
+
+    assert tracker.get_total_tokens() == {"input_tokens": 11, "output_tokens": 7}
+    assert len(list(tmp_path.glob("*.jsonl"))) == 1
+
+
+def test_buffered_usage_is_visible_before_it_is_flushed(tmp_path):
+    tracker = UsageTracker(tmp_path, flush_every=16)
+    for _ in range(3):
+        tracker.record_usage("model", 10, 5, "enrich", 0.01)
+    assert list(tmp_path.glob("*.jsonl")) == []
+
+    assert tracker.get_total_tokens() == {"input_tokens": 30, "output_tokens": 15}
+    assert UsageTracker(tmp_path).get_total_tokens()["input_tokens"] == 30
+
+
+def test_buffer_is_written_once_full(tmp_path):
+    tracker = UsageTracker(tmp_path, flush_every=2)
+    tracker.record_usage("model", 1, 1, "enrich", 0.0)
+    assert UsageTracker(tmp_path).get_total_tokens()["input_tokens"] == 0
+    tracker.record_usage("model", 1, 1, "enrich", 0.0)
+    assert UsageTracker(tmp_path).get_total_tokens()["input_tokens"] == 2
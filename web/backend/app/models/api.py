@@ -19,6 +19,8 @@ from pydantic import BaseModel, Field
 class VerificationResultResponse(BaseModel):
     """Mirrors ale.registry.models.VerificationResult."""
 
+    model_config = {"from_attributes": True}
+
     schema_passed: bool = False
     validator_passed: bool = False
     hooks_runnable: bool = False
@@ -29,6 +31,8 @@ class VerificationResultResponse(BaseModel):
 class QualitySignalsResponse(BaseModel):
     """Mirrors ale.registry.models.QualitySignals."""
 
+    model_config = {"from_attributes": True}
+
     verification: VerificationResultResponse = Field(
         default_factory=VerificationResultResponse
     )
@@ -43,6 +47,8 @@ class QualitySignalsResponse(BaseModel):
 class LibraryEntryResponse(BaseModel):
     """Mirrors ale.registry.models.RegistryEntry."""
 
+    model_config = {"from_attributes": True}
+
     name: str
     version: str
     library_id: str = ""
@@ -408,6 +414,12 @@ class ValidateContentResponse(BaseModel):
     semantic_warnings: list[str] = Field(default_factory=list)
 
 
+class ValidateBatchRequest(BaseModel):
+    """Request body for validating several YAML documents at once."""
+
+    items: list[ValidateContentRequest] = Field(..., max_length=100)
+
+
 class EnrichRequest(BaseModel):
     """Request body for LLM enrichment."""
 
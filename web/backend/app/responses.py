@@ -0,0 +1,22 @@
+"""Shared response classes for the ALE API.
+
+``ORJSONResponse`` renders JSON with orjson instead of the stdlib encoder.
+It is defined here rather than imported from ``fastapi.responses`` so it
+behaves the same across the FastAPI versions the backend supports.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson (much faster on large trees)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -23,6 +23,12 @@ from web.backend.app.models.api import (
     ValidationIssueResponse,
 )
 
+# Use libyaml's C loader when available; fall back to the pure-Python one.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
 router = APIRouter(tags=["conformance"])
 
 
@@ -107,7 +113,7 @@ async def validate_only(request: ConformanceRequest):
 
     try:
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
     except Exception as exc:
         raise HTTPException(
             status_code=400, detail=f"Failed to parse YAML: {exc}"
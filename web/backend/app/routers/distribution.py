@@ -23,6 +23,12 @@ from ale.registry.local_registry import LocalRegistry, _dict_to_entry, generate_
 from ale.registry.models import SearchQuery
 from web.backend.app.middleware.auth import get_current_user
 
+# Use libyaml's C loader when available; fall back to the pure-Python one.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
 router = APIRouter(prefix="/api/v1", tags=["distribution"])
 
 # Configurable registry directory; default to project-level .ale_registry
@@ -152,7 +158,7 @@ def _load_yaml_data(library_path: str) -> dict:
             detail=f"Library YAML file not found at: {library_path}",
         )
     with open(library_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def _render_build_plan(yaml_data: dict, library_id: str) -> str:
@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import hashlib
+import mmap
 import os
 import re
-import tempfile
+import secrets
+import stat
+import threading
+import time
 import uuid
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 
+import orjson
 import yaml
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from git import Repo as GitRepo
 
 from ale.registry.local_registry import LocalRegistry
 from ale.spec.schema_validator import validate_schema
@@ -29,16 +42,27 @@ from web.backend.app.models.api import (
     LibraryDocNodeResponse,
     LibraryEntryResponse,
     PublishFromEditorRequest,
-    QualitySignalsResponse,
     SaveDraftRequest,
     UpdateCheckResponse,
     UpdateLibraryRequest,
+    ValidateBatchRequest,
     ValidateContentRequest,
     ValidateContentResponse,
-    VerificationResultResponse,
 )
-
-router = APIRouter(prefix="/api/generate", tags=["generator"])
+from web.backend.app.responses import ORJSONResponse
+
+# Prefer libyaml's C loader (several times faster on large specs); PyYAML
+# builds without libyaml fall back to the pure-Python SafeLoader.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
+router = APIRouter(
+    prefix="/api/generate",
+    tags=["generator"],
+    default_response_class=ORJSONResponse,
+)
 
 # ---------------------------------------------------------------------------
 # Drafts storage directory
@@ -48,27 +72,105 @@ DRAFTS_DIR = Path.home() / ".ale" / "drafts"
 # Hierarchical libraries storage directory
 LIBRARIES_DIR = Path.home() / ".ale" / "libraries"
 
+_LIBS_DIR_STR = str(LIBRARIES_DIR)
+
+# Storage directories already created by this process
+_READY_DIRS: set[Path] = set()
+
 # Registry directory (same as used by the registry router)
 REGISTRY_DIR = os.environ.get("ALE_REGISTRY_DIR", "/home/user/ALE/.ale_registry")
 
+# Library and draft files are machine-read, so they are stored compact; set
+# ALE_PRETTY_JSON=1 to indent them when inspecting by hand.
+_STORE_JSON_OPTS = orjson.OPT_INDENT_2 if os.environ.get("ALE_PRETTY_JSON") else 0
+
+# Library files larger than this are parsed from a read-only memory map
+# instead of being copied into a bytes object first.
+_MMAP_THRESHOLD = 1 << 20
+
+# Append-only draft manifest (one orjson record or tombstone per line)
+_DRAFT_INDEX = "_index.jsonl"
+_DRAFT_INDEX_COMPACT_MIN = 256
+
+# Serializes manifest appends with its rebuild/compaction, so a draft saved
+# or deleted while the manifest is being replaced is never dropped.
+_draft_index_lock = threading.Lock()
+
+# Sorted draft listing, keyed on the manifest's (st_mtime_ns, st_size, st_ino)
+_drafts_cache: tuple[tuple[int, int, int], list[dict]] | None = None
+
+# Draft and library IDs (UUIDs); anything else could escape the storage dirs
+_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,64}\Z")
+
+# _slugify: drop punctuation, then collapse whitespace/underscore/hyphen runs
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_COLLAPSE = re.compile(r"[\s_-]+")
+# Display names: underscores and hyphens become spaces in one pass
+_NAME_SPACES = str.maketrans("_-", "  ")
+
+# Backtick-quoted file references inside generated markdown content
+_BACKTICK_PATH_RE = re.compile(r"`([^`]+\.\w+)`")
+_CODE_EXTS = (".py", ".ts", ".tsx", ".js", ".jsx", ".go", ".rs", ".java")
+
+# Source repo HEAD lookups: a short-lived SHA cache keyed by the (client
+# supplied) repo path, cleared outright once it reaches the cap
+_HEAD_CACHE_TTL = 1.0
+_HEAD_CACHE_MAX = 256
+_HEAD_CACHE: dict[str, tuple[float, str]] = {}
+_SHA_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?\Z")
+
+# Parsed generated libraries keyed by ID: (st_mtime_ns, st_size, data).
+# Kept in least-recently-used order.  The cap is on the summed file sizes,
+# since single libraries can run to megabytes (the parsed dicts take a
+# few times their file size); a file over the cap is never cached.
+_LIB_CACHE_MAX_BYTES = 64 << 20
+_LIB_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+# Bounded pool for bulk file reads: library cache misses during a scan and
+# draft files when the draft manifest is rebuilt
+_FILE_READ_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="ale-file-read")
+
+# Library IDs recently found missing, keyed by ID -> time.monotonic() of the miss
+_MISSING_CACHE_TTL = 1.0
+_MISSING_CACHE_MAX = 1024
+_MISSING_CACHE: dict[str, float] = {}
+
+# Editor YAML parse + validation results keyed by blake2b digest of the text,
+# so the usual Validate -> Publish sequence parses and validates only once
+_VALIDATION_CACHE_MAX = 256
+_VALIDATION_CACHE: dict[bytes, tuple] = {}
+_NOT_A_MAPPING = "YAML must be a mapping (object) at the top level"
+
+# Sort key for drafts and libraries.  Both always store updated_at as a
+# UTC isoformat() string, which orders lexicographically by time.
+_BY_UPDATED_AT = itemgetter("updated_at")
+
+# Keys of a stored library that belong in API responses (drops storage-only
+# fields such as source_commit and source_files)
+_LIB_RESPONSE_FIELDS = frozenset(GeneratedLibraryResponse.model_fields)
+_DRAFT_RESPONSE_FIELDS = frozenset(DraftResponse.model_fields)
+
 
 def _ensure_drafts_dir() -> Path:
-    """Create the drafts directory if it does not exist."""
-    DRAFTS_DIR.mkdir(parents=True, exist_ok=True)
+    """Create the drafts directory if it does not exist (once per process)."""
+    if DRAFTS_DIR not in _READY_DIRS:
+        DRAFTS_DIR.mkdir(parents=True, exist_ok=True)
+        _READY_DIRS.add(DRAFTS_DIR)
     return DRAFTS_DIR
 
 
 def _ensure_libraries_dir() -> Path:
-    """Create the libraries directory if it does not exist."""
-    LIBRARIES_DIR.mkdir(parents=True, exist_ok=True)
+    """Create the libraries directory if it does not exist (once per process)."""
+    if LIBRARIES_DIR not in _READY_DIRS:
+        LIBRARIES_DIR.mkdir(parents=True, exist_ok=True)
+        _READY_DIRS.add(LIBRARIES_DIR)
     return LIBRARIES_DIR
 
 
+@functools.lru_cache(maxsize=256)
 def _slugify(name: str) -> str:
-    """Convert a name into a filesystem-safe slug."""
-    slug = re.sub(r"[^\w\s-]", "", name.lower().strip())
-    slug = re.sub(r"[\s_-]+", "_", slug)
-    return slug
+    """Convert a name into a filesystem-safe slug (memoized; names repeat)."""
+    return _SLUG_COLLAPSE.sub("_", _SLUG_STRIP.sub("", name.lower().strip()))
 
 
 def _get_registry() -> LocalRegistry:
@@ -77,39 +179,13 @@ def _get_registry() -> LocalRegistry:
 
 
 def _entry_to_response(entry) -> LibraryEntryResponse:
-    """Convert a RegistryEntry dataclass to a Pydantic response model."""
-    v = entry.quality.verification
-    return LibraryEntryResponse(
-        name=entry.name,
-        version=entry.version,
-        spec_version=entry.spec_version,
-        description=entry.description,
-        tags=entry.tags,
-        capabilities=entry.capabilities,
-        complexity=entry.complexity,
-        language_agnostic=entry.language_agnostic,
-        target_languages=entry.target_languages,
-        quality=QualitySignalsResponse(
-            verification=VerificationResultResponse(
-                schema_passed=v.schema_passed,
-                validator_passed=v.validator_passed,
-                hooks_runnable=v.hooks_runnable,
-                verified_at=v.verified_at,
-                verified_by=v.verified_by,
-            ),
-            rating=entry.quality.rating,
-            rating_count=entry.quality.rating_count,
-            download_count=entry.quality.download_count,
-            maintained=entry.quality.maintained,
-            maintainer=entry.quality.maintainer,
-            last_updated=entry.quality.last_updated,
-        ),
-        source_repo=entry.source_repo,
-        library_path=entry.library_path,
-        compatibility_targets=entry.compatibility_targets,
-        qualified_id=entry.qualified_id,
-        is_verified=entry.is_verified,
-    )
+    """Convert a RegistryEntry dataclass to a Pydantic response model.
+
+    The response models read attributes directly (``from_attributes``), so
+    pydantic-core copies every field, including the nested quality signals
+    and the ``qualified_id``/``is_verified`` properties, in one call.
+    """
+    return LibraryEntryResponse.model_validate(entry)
 
 
 # ---------------------------------------------------------------------------
@@ -129,6 +205,157 @@ def _get_llm_client():
     return _llm_client
 
 
+# Concurrent /enrich calls arriving within a short window share one LLM
+# round trip: up to _ENRICH_BATCH_MAX drafts go out in a single prompt.
+_ENRICH_BATCH_MAX = 4
+_ENRICH_BATCH_WINDOW = 0.025
+
+# (loop, queue) of the running batch collector; recreated per event loop
+_enrich_batcher: tuple[asyncio.AbstractEventLoop, asyncio.Queue] | None = None
+_enrich_tasks: set[asyncio.Task] = set()
+
+
+async def _enrich_via_batch(yaml_content: str) -> str:
+    """Queue *yaml_content* for batched enrichment and await its result."""
+    global _enrich_batcher
+    loop = asyncio.get_running_loop()
+    if _enrich_batcher is None or _enrich_batcher[0] is not loop:
+        queue: asyncio.Queue = asyncio.Queue()
+        _enrich_batcher = (loop, queue)
+        _spawn_enrich_task(_collect_enrich_batches(queue))
+
+    future = loop.create_future()
+    await _enrich_batcher[1].put((yaml_content, future))
+    return await future
+
+
+def _spawn_enrich_task(coro) -> None:
+    """Start *coro* as a task, holding a reference until it finishes."""
+    task = asyncio.get_running_loop().create_task(coro)
+    _enrich_tasks.add(task)
+    task.add_done_callback(_enrich_tasks.discard)
+
+
+async def _collect_enrich_batches(queue: asyncio.Queue) -> None:
+    """Group queued enrich requests and dispatch each group to the LLM."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + _ENRICH_BATCH_WINDOW
+        while len(batch) < _ENRICH_BATCH_MAX:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except TimeoutError:
+                break
+        _spawn_enrich_task(_run_enrich_batch(batch))
+
+
+async def _run_enrich_batch(batch: list[tuple[str, asyncio.Future]]) -> None:
+    """Enrich every draft in *batch* and resolve the waiting futures.
+
+    A single draft uses the regular enrichment prompt.  Several drafts are
+    sent together in one marked-up prompt; any draft the reply doesn't
+    account for cleanly is retried on its own.  Each future gets its own
+    outcome, so one failed retry doesn't fail the drafts that succeeded.
+    """
+    docs = [yaml_content for yaml_content, _ in batch]
+    results: list[str | BaseException]
+    try:
+        if len(docs) == 1:
+            results = [await _complete_enrich(docs[0])]
+        else:
+            results = await _complete_enrich_batch(docs)
+    except Exception as exc:
+        results = [exc] * len(batch)
+    for (_, future), result in zip(batch, results):
+        if future.done():
+            continue
+        if isinstance(result, asyncio.CancelledError):
+            future.cancel()
+        elif isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+async def _complete_enrich(yaml_content: str) -> str:
+    """Enrich one draft with ``LIBRARY_ENRICHMENT_PROMPT``."""
+    from ale.llm.prompts import LIBRARY_ENRICHMENT_PROMPT
+
+    prompt = LIBRARY_ENRICHMENT_PROMPT.format(yaml_content=yaml_content)
+    return await _complete_and_track(prompt, max_tokens=4096)
+
+
+async def _complete_enrich_batch(docs: list[str]) -> list[str | BaseException]:
+    """Enrich several drafts in one LLM call, retrying any it drops.
+
+    The drafts come from different callers, so the markers carry a random
+    per-batch nonce that no draft can know in advance.  A reply is only
+    trusted for an index that appears exactly once, and not at all if it
+    names an index that was never sent.  Untrusted drafts are enriched on
+    their own; a failed retry is returned as its exception, not raised.
+    """
+    from ale.llm.prompts import LIBRARY_ENRICHMENT_BATCH_PROMPT
+
+    nonce = secrets.token_hex(8)
+    documents = "\n\n".join(
+        f"<<<doc {nonce} {i}>>>\n{doc}\n<<<end {nonce}>>>" for i, doc in enumerate(docs)
+    )
+    prompt = LIBRARY_ENRICHMENT_BATCH_PROMPT.format(nonce=nonce, documents=documents)
+    content = await _complete_and_track(prompt, max_tokens=4096 * len(docs))
+
+    results: dict[int, str | BaseException] = dict(
+        _parse_enrich_batch(content, nonce, len(docs))
+    )
+    missing = [i for i in range(len(docs)) if i not in results]
+    retried = await asyncio.gather(
+        *(_complete_enrich(docs[i]) for i in missing), return_exceptions=True
+    )
+    results.update(zip(missing, retried))
+    return [results[i] for i in range(len(docs))]
+
+
+def _parse_enrich_batch(content: str, nonce: str, count: int) -> dict[int, str]:
+    """Map each draft index that *content* answers unambiguously to its YAML."""
+    marker = re.escape(nonce)
+    pattern = re.compile(
+        rf"<<<doc {marker} (\d+)>>>\n?(.*?)\n?<<<end {marker}>>>", re.DOTALL
+    )
+    found: dict[int, list[str]] = {}
+    for index, body in pattern.findall(content):
+        found.setdefault(int(index), []).append(body)
+    if any(i >= count for i in found):
+        return {}
+    return {i: bodies[0] for i, bodies in found.items() if len(bodies) == 1}
+
+
+async def _complete_and_track(prompt: str, max_tokens: int) -> str:
+    """Run one completion and record its token usage.
+
+    The Anthropic call and the usage file write both block; they run in
+    worker threads so other requests keep being served meanwhile.  Usage
+    goes to the LLM router's shared tracker, which buffers its writes and
+    flushes the rest at exit.
+    """
+    from web.backend.app.routers.llm import _get_tracker
+
+    resp = await asyncio.to_thread(_get_llm_client().complete, prompt, max_tokens=max_tokens)
+
+    # Track usage
+    await asyncio.to_thread(
+        _get_tracker().record_usage,
+        model=resp.model,
+        input_tokens=resp.input_tokens,
+        output_tokens=resp.output_tokens,
+        purpose="enrich",
+        cost_estimate=resp.cost_estimate,
+    )
+    return resp.content
+
+
 @router.post(
     "/enrich",
     response_model=EnrichResponse,
@@ -147,28 +374,11 @@ async def enrich_yaml(request: EnrichRequest):
     client = _get_llm_client()
 
     if client.configured:
-        from ale.llm.prompts import LIBRARY_ENRICHMENT_PROMPT
-        from ale.llm.usage_tracker import UsageTracker
-
-        prompt = LIBRARY_ENRICHMENT_PROMPT.format(yaml_content=request.yaml_content)
-        resp = client.complete(prompt)
-
-        # Track usage
-        tracker = UsageTracker()
-        tracker.record_usage(
-            model=resp.model,
-            input_tokens=resp.input_tokens,
-            output_tokens=resp.output_tokens,
-            purpose="enrich",
-            cost_estimate=resp.cost_estimate,
-        )
-
-        enriched = resp.content
+        enriched = await _enrich_via_batch(request.yaml_content)
         # If the model prepended commentary, try to separate it
-        if "---" in enriched:
-            parts = enriched.split("---", 1)
-            if len(parts) == 2 and len(parts[1].strip()) > len(parts[0].strip()):
-                enriched = "---" + parts[1]
+        head, sep, tail = enriched.partition("---")
+        if sep and len(tail.strip()) > len(head.strip()):
+            enriched = "---" + tail
 
         return EnrichResponse(
             enriched_yaml=enriched,
@@ -201,6 +411,7 @@ async def enrich_yaml(request: EnrichRequest):
 )
 async def save_draft(request: SaveDraftRequest):
     """Save a YAML draft to the local drafts directory."""
+    global _drafts_cache
     if not request.name.strip():
         raise HTTPException(status_code=400, detail="name is required")
     if not request.yaml_content.strip():
@@ -217,9 +428,13 @@ async def save_draft(request: SaveDraftRequest):
         "updated_at": now,
     }
 
+    # Write-then-rename so a crash never leaves a truncated draft behind
     draft_path = drafts_dir / f"{draft['id']}.json"
-    with open(draft_path, "w") as f:
-        json.dump(draft, f, indent=2)
+    tmp_path = draft_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(orjson.dumps(draft, option=_STORE_JSON_OPTS))
+    os.replace(tmp_path, draft_path)
+    _append_draft_index(drafts_dir, draft)
+    _drafts_cache = None
 
     return DraftResponse(**draft)
 
@@ -229,22 +444,18 @@ async def save_draft(request: SaveDraftRequest):
     response_model=list[DraftResponse],
     summary="List saved drafts",
 )
-async def list_drafts():
-    """List all saved drafts, sorted by most recently updated."""
-    drafts_dir = _ensure_drafts_dir()
-    drafts: list[dict] = []
-
-    for draft_file in drafts_dir.glob("*.json"):
-        try:
-            with open(draft_file) as f:
-                draft = json.load(f)
-            drafts.append(draft)
-        except (json.JSONDecodeError, KeyError):
-            continue
+async def list_drafts(
+    limit: int | None = Query(None, ge=1, description="Maximum number of drafts to return"),
+):
+    """List saved drafts, sorted by most recently updated.
 
-    # Sort by updated_at descending
-    drafts.sort(key=lambda d: d.get("updated_at", ""), reverse=True)
-    return [DraftResponse(**d) for d in drafts]
+    Drafts are stored in the response shape, so the listing is rendered
+    straight to orjson instead of building a model per draft.
+    """
+    drafts = await asyncio.to_thread(_scan_drafts, limit)
+    return ORJSONResponse(
+        [{k: v for k, v in d.items() if k in _DRAFT_RESPONSE_FIELDS} for d in drafts]
+    )
 
 
 @router.get(
@@ -254,16 +465,16 @@ async def list_drafts():
 )
 async def get_draft(draft_id: str):
     """Retrieve a specific draft by ID."""
+    if not _ID_RE.match(draft_id):
+        raise HTTPException(status_code=400, detail=f"Invalid draft ID '{draft_id}'")
     drafts_dir = _ensure_drafts_dir()
     draft_path = drafts_dir / f"{draft_id}.json"
 
-    if not draft_path.exists():
-        raise HTTPException(status_code=404, detail=f"Draft '{draft_id}' not found")
-
     try:
-        with open(draft_path) as f:
-            draft = json.load(f)
-    except (json.JSONDecodeError, KeyError) as exc:
+        draft = orjson.loads(draft_path.read_bytes())
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Draft '{draft_id}' not found")
+    except (orjson.JSONDecodeError, KeyError) as exc:
         raise HTTPException(status_code=500, detail=f"Failed to read draft: {exc}")
 
     return DraftResponse(**draft)
@@ -275,13 +486,18 @@ async def get_draft(draft_id: str):
 )
 async def delete_draft(draft_id: str):
     """Delete a specific draft by ID."""
+    global _drafts_cache
+    if not _ID_RE.match(draft_id):
+        raise HTTPException(status_code=400, detail=f"Invalid draft ID '{draft_id}'")
     drafts_dir = _ensure_drafts_dir()
     draft_path = drafts_dir / f"{draft_id}.json"
 
-    if not draft_path.exists():
+    try:
+        draft_path.unlink()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Draft '{draft_id}' not found")
-
-    draft_path.unlink()
+    _append_draft_index(drafts_dir, {"id": draft_id, "deleted": True})
+    _drafts_cache = None
     return {"detail": "Draft deleted"}
 
 
@@ -298,42 +514,42 @@ async def delete_draft(draft_id: str):
 async def validate_content(request: ValidateContentRequest):
     """Run schema and semantic validation on raw YAML content.
 
-    Returns errors and warnings without saving or publishing.
+    Returns errors and warnings without saving or publishing.  Parsing
+    and validation are CPU-bound, so they run in a worker thread.
     """
-    if not request.yaml_content.strip():
-        return ValidateContentResponse(
-            valid=False,
-            schema_errors=["YAML content is empty"],
-        )
+    return await asyncio.to_thread(_validation_response, request.yaml_content)
+
+
+@router.post(
+    "/validate-batch",
+    response_model=list[ValidateContentResponse],
+    summary="Validate several YAML documents in one request",
+)
+async def validate_batch(request: ValidateBatchRequest):
+    """Validate each item like ``/validate``, returning results in order.
+
+    The whole batch runs in a worker thread so a large request does not
+    block the event loop.
+    """
+    return await asyncio.to_thread(
+        lambda: [_validation_response(item.yaml_content) for item in request.items]
+    )
 
-    # Parse the YAML
-    try:
-        data = yaml.safe_load(request.yaml_content)
-    except yaml.YAMLError as exc:
-        return ValidateContentResponse(
-            valid=False,
-            schema_errors=[f"YAML parse error: {exc}"],
-        )
 
-    if not isinstance(data, dict):
+def _validation_response(yaml_content: str) -> ValidateContentResponse:
+    """Build the ``/validate`` response for one YAML document."""
+    if not yaml_content.strip():
         return ValidateContentResponse(
             valid=False,
-            schema_errors=["YAML must be a mapping (object) at the top level"],
+            schema_errors=["YAML content is empty"],
         )
 
-    # Gate 1: Schema validation
-    schema_errors = validate_schema(data)
-
-    # Gate 2: Semantic validation
-    sem_result = validate_semantics(data)
-    semantic_errors = [
-        f"[{issue.code}] {issue.path}: {issue.message}"
-        for issue in sem_result.errors
-    ]
-    semantic_warnings = [
-        f"[{issue.code}] {issue.path}: {issue.message}"
-        for issue in sem_result.warnings
-    ]
+    # Parse, then Gate 1 (schema) and Gate 2 (semantic) validation
+    data, error, schema_errors, semantic_errors, semantic_warnings = _validate_yaml(
+        yaml_content
+    )
+    if data is None:
+        return ValidateContentResponse(valid=False, schema_errors=[error])
 
     valid = len(schema_errors) == 0 and len(semantic_errors) == 0
 
@@ -365,27 +581,12 @@ async def publish_from_editor(request: PublishFromEditorRequest):
     if not request.yaml_content.strip():
         raise HTTPException(status_code=400, detail="yaml_content is required")
 
-    # Parse the YAML
-    try:
-        data = yaml.safe_load(request.yaml_content)
-    except yaml.YAMLError as exc:
-        raise HTTPException(
-            status_code=400, detail=f"YAML parse error: {exc}"
-        )
-
-    if not isinstance(data, dict):
-        raise HTTPException(
-            status_code=400,
-            detail="YAML must be a mapping (object) at the top level",
-        )
-
-    # Validate
-    schema_errors = validate_schema(data)
-    sem_result = validate_semantics(data)
-    semantic_errors = [
-        f"[{issue.code}] {issue.path}: {issue.message}"
-        for issue in sem_result.errors
-    ]
+    # Parse and validate (reuses the result of a preceding /validate call)
+    data, error, schema_errors, semantic_errors, _ = await asyncio.to_thread(
+        _validate_yaml, request.yaml_content
+    )
+    if data is None:
+        raise HTTPException(status_code=400, detail=error)
 
     if schema_errors or semantic_errors:
         all_errors = schema_errors + semantic_errors
@@ -394,28 +595,56 @@ async def publish_from_editor(request: PublishFromEditorRequest):
             detail=f"Validation failed: {'; '.join(all_errors)}",
         )
 
-    # Write to a temp file and publish
-    lib = data.get("agentic_library", {})
-    manifest = lib.get("manifest", {})
-    name = request.name or manifest.get("name", "untitled")
-
-    with tempfile.NamedTemporaryFile(
-        delete=False,
-        suffix=".agentic.yaml",
-        prefix=f"ale_{name}_",
-        mode="w",
-    ) as tmp:
-        tmp.write(request.yaml_content)
-        tmp_path = tmp.name
-
+    # Publish the parsed document directly; no temp file round trip
     try:
         reg = _get_registry()
-        entry = reg.publish(tmp_path)
+        entry = await asyncio.to_thread(reg.publish_data, data)
         return _entry_to_response(entry)
     except Exception as exc:
         raise HTTPException(status_code=400, detail=str(exc))
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+
+
+def _validate_yaml(
+    yaml_content: str,
+) -> tuple[dict | None, str, list[str], list[str], list[str]]:
+    """Parse and validate editor YAML, memoized by content digest.
+
+    Returns ``(data, error, schema_errors, semantic_errors,
+    semantic_warnings)``.  ``data`` is ``None`` and ``error`` is set when
+    the text is not valid YAML or not a mapping.  Callers must treat the
+    returned objects as read-only since they are shared via the cache.
+    """
+    # A library document needs at least one "key: value" pair, so text
+    # without any ':' is rejected without hashing or parsing it.
+    if ":" not in yaml_content:
+        return (None, _NOT_A_MAPPING, [], [], [])
+
+    key = hashlib.blake2b(yaml_content.encode("utf-8"), digest_size=16).digest()
+    cached = _VALIDATION_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        data = yaml.load(yaml_content, Loader=_YamlLoader)
+    except yaml.YAMLError as exc:
+        result = (None, f"YAML parse error: {exc}", [], [], [])
+    else:
+        if not isinstance(data, dict):
+            result = (None, _NOT_A_MAPPING, [], [], [])
+        else:
+            sem_result = validate_semantics(data)
+            result = (
+                data,
+                "",
+                validate_schema(data),
+                [f"[{issue.code}] {issue.path}: {issue.message}" for issue in sem_result.errors],
+                [f"[{issue.code}] {issue.path}: {issue.message}" for issue in sem_result.warnings],
+            )
+
+    if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_MAX:
+        _VALIDATION_CACHE.clear()
+    _VALIDATION_CACHE[key] = result
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -550,68 +779,38 @@ def _analyze_source_code(
     }
 
 
-def _build_library_structure(
-    name: str,
-    slug: str,
-    description: str,
-    source_files: list[str],
-    entry_points: list[str],
-    tags: list[str],
-    source_repo_url: str,
-    candidate_name: str,
-    code_analysis: dict | None = None,
-) -> LibraryDocNodeResponse:
-    """Build a hierarchical document tree for a generated library.
-
-    When ``code_analysis`` is provided (from ``_analyze_source_code``),
-    instructions are derived from the actual code structure rather than
-    generic templates.  ``source_repo_url`` is the display URL/path for
-    the source repository (never a temp clone directory).
-    """
-    now = datetime.now(timezone.utc).isoformat()
-
-    files_list = "\n".join(f"- `{f}`" for f in source_files[:30]) or "- *(none detected)*"
-    ep_list = "\n".join(f"- `{ep}`" for ep in entry_points[:20]) or "- *(none detected)*"
-    tags_inline = ", ".join(tags) if tags else "general"
+# Root + 10 sections + 3 instruction steps built by ``_build_library_structure``
+_NODES_PER_LIBRARY = 14
 
-    # Use code analysis to build richer content
-    ca = code_analysis or {"classes": [], "functions": [], "imports": [], "patterns": []}
 
-    # Build a code sketch from actual signatures
-    class_sketch = ""
-    if ca["classes"]:
-        lines = []
-        for cls in ca["classes"][:15]:
-            lines.append(f"- **`{cls['name']}`** (in `{cls['file']}`)")
-        class_sketch = "\n".join(lines)
+# Rendered library trees keyed by a digest of the builder's inputs.  The
+# markers stand in for the generation timestamp, which differs per call.
+_STRUCTURE_CACHE_MAX = 256
+_STRUCTURE_CACHE: dict[bytes, dict] = {}
+_NOW_MARK = "\x00now\x00"
+_TODAY_MARK = "\x00today\x00"
 
-    func_sketch = ""
-    if ca["functions"]:
-        lines = []
-        for fn in ca["functions"][:20]:
-            lines.append(f"- `{fn['signature']}`  *(in `{fn['file']}`)*")
-        func_sketch = "\n".join(lines)
 
-    imports_list = ""
-    if ca["imports"]:
-        imports_list = "\n".join(f"- `{pkg}`" for pkg in ca["imports"])
+def _node_ids(count: int) -> Iterator[str]:
+    """Yield ``count`` random UUID4 strings drawn from one ``os.urandom`` call."""
+    buf = os.urandom(16 * count)
+    for i in range(0, len(buf), 16):
+        yield str(uuid.UUID(bytes=buf[i:i + 16], version=4))
 
-    patterns_list = ""
-    if ca["patterns"]:
-        patterns_list = "\n".join(f"- {p}" for p in ca["patterns"])
 
-    # ---- Build instruction steps from actual code ----
+# Markdown templates for ``_build_library_structure``.  Each is rendered
+# with ``str.format_map`` against one shared context dict per library, so
+# only the substitutions run per request.
 
-    # Step 1: Data models & types (classes found)
-    step1_content = f"""# Step 1: Define Data Models & Types
+_STEP1_HEAD = """# Step 1: Define Data Models & Types
 
 ## Objective
 Recreate the data models and type definitions used by **{name}**.
 
 ## What to Build
 """
-    if class_sketch:
-        step1_content += f"""The source code defines these key classes/types:
+
+_STEP1_CLASSES = """The source code defines these key classes/types:
 
 {class_sketch}
 
@@ -619,27 +818,27 @@ Implement equivalent data structures in your target project's language,
 following its conventions for models (dataclasses, Pydantic, TypeScript
 interfaces, Go structs, etc.).
 """
-    else:
-        step1_content += """No explicit class definitions were detected. Define any data
+
+_STEP1_NO_CLASSES = """No explicit class definitions were detected. Define any data
 structures needed based on the entry points and function signatures below.
 """
-    step1_content += """
+
+_STEP1_TAIL = """
 ## Guidelines
 - Use the target project's idiomatic approach for data modeling
 - Ensure all fields have appropriate types and validation
 - Add serialization support if the data crosses API boundaries
 """
 
-    # Step 2: Core functions/logic
-    step2_content = f"""# Step 2: Implement Core Logic
+_STEP2_HEAD = """# Step 2: Implement Core Logic
 
 ## Objective
 Build the primary functions and business logic for **{name}**.
 
 ## Functions to Implement
 """
-    if func_sketch:
-        step2_content += f"""The source code exposes these public functions:
+
+_STEP2_FUNCTIONS = """The source code exposes these public functions:
 
 {func_sketch}
 
@@ -647,26 +846,26 @@ Reimplement each function's behavior in your target language. The
 signatures above show the expected inputs; adapt parameter names and
 types to your project's conventions.
 """
-    else:
-        step2_content += f"""Implement the logic corresponding to these entry points:
+
+_STEP2_ENTRY_POINTS = """Implement the logic corresponding to these entry points:
 
 {ep_list}
 """
-    step2_content += """
+
+_STEP2_TAIL = """
 ## Guidelines
 - Each function should have a single clear responsibility
 - Include error handling consistent with your project's patterns
 - Write unit tests alongside each function
 """
 
-    # Step 3: Integration & wiring
-    step3_content = f"""# Step 3: Integration & Wiring
+_STEP3_HEAD = """# Step 3: Integration & Wiring
 
 ## Objective
 Connect all modules and expose the public interface for **{name}**.
 """
-    if ca["patterns"]:
-        step3_content += f"""
+
+_STEP3_PATTERNS = """
 ## Detected Patterns
 The source code uses these architectural patterns:
 
@@ -675,14 +874,15 @@ The source code uses these architectural patterns:
 Wire up your implementation to follow the same patterns using your
 target framework's conventions.
 """
-    if ca["imports"]:
-        step3_content += f"""
+
+_STEP3_IMPORTS = """
 ## External Dependencies
 The source relies on these packages -- find equivalents in your ecosystem:
 
 {imports_list}
 """
-    step3_content += """
+
+_STEP3_TAIL = """
 ## Actions
 1. Create the public API surface (exports, endpoints, CLI commands)
 2. Configure dependency injection or wiring for internal modules
@@ -690,62 +890,22 @@ The source relies on these packages -- find equivalents in your ecosystem:
 4. Verify all entry points are reachable end-to-end
 """
 
-    instruction_children = [
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Step 1: Data Models & Types",
-            slug=f"{slug}/instructions/step_1_models",
-            type="subsection",
-            summary="Define data models and type structures from the analyzed code.",
-            content=step1_content,
-            children=[],
-        ),
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Step 2: Core Logic",
-            slug=f"{slug}/instructions/step_2_core_logic",
-            type="subsection",
-            summary="Implement the primary functions and business logic.",
-            content=step2_content,
-            children=[],
-        ),
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Step 3: Integration & Wiring",
-            slug=f"{slug}/instructions/step_3_integration",
-            type="subsection",
-            summary="Connect components, wire dependencies, and expose public API.",
-            content=step3_content,
-            children=[],
-        ),
-    ]
-
-    # ---- Build instruction steps table from actual steps ----
-    step_table = "\n".join(
-        f"| {i+1} | {child.title} | {child.summary} |"
-        for i, child in enumerate(instruction_children)
-    )
-
-    # ---- Architecture section with real data ----
-    arch_content = f"""# {name} -- Architecture
+_ARCH_HEAD = """# {name} -- Architecture
 
 ## Detected Patterns
 """
-    if patterns_list:
-        arch_content += patterns_list + "\n"
-    else:
-        arch_content += "- *(Analyze source for architectural patterns)*\n"
 
-    arch_content += f"""
+_ARCH_MODULES = """
 ## Module Structure
 {files_list}
 """
-    if class_sketch:
-        arch_content += f"""
+
+_ARCH_TYPES = """
 ## Key Types
 {class_sketch}
 """
-    arch_content += f"""
+
+_ARCH_TAIL = """
 ## Entry Points
 {ep_list}
 
@@ -755,51 +915,27 @@ The source relies on these packages -- find equivalents in your ecosystem:
 3. Results are returned through the public API surface
 """
 
-    # Build the sections
-    sections = [
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Overview",
-            slug=f"{slug}/overview",
-            type="section",
-            summary=f"High-level overview of the {name} library.",
-            content=f"""# {name} -- Overview
+_OVERVIEW_TMPL = """# {name} -- Overview
 
 ## Purpose
-{description or 'A library extracted from the analyzed codebase.'}
+{purpose}
 
 ## Scope
 This library encapsulates the functionality identified in the **{candidate_name}** candidate.
 
 ## Source Reference
 - **Repository**: `{source_repo_url}`
-- **File count**: {len(source_files)}
-- **Entry points**: {len(entry_points)}
+- **File count**: {file_count}
+- **Entry points**: {ep_count}
 
 ## Key Capabilities
 {tags_inline}
 
 ## When to Use
 Use this library's instructions to rebuild {candidate_name} functionality natively in your own project. The instructions describe *what* to build and *how* the pieces connect -- implement them in your target language and framework.
-""",
-            children=[],
-        ),
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Architecture",
-            slug=f"{slug}/architecture",
-            type="section",
-            summary="Architecture and design patterns from source analysis.",
-            content=arch_content,
-            children=[],
-        ),
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Instructions",
-            slug=f"{slug}/instructions",
-            type="section",
-            summary="Step-by-step implementation guide derived from source code analysis.",
-            content=f"""# {name} -- Implementation Instructions
+"""
+
+_INSTRUCTIONS_TMPL = """# {name} -- Implementation Instructions
 
 ## Overview
 This section provides a step-by-step guide for rebuilding the **{name}** functionality in your own project. Each step is informed by analysis of the source code's actual structure, classes, and functions.
@@ -811,16 +947,9 @@ This section provides a step-by-step guide for rebuilding the **{name}** functio
 {step_table}
 
 See each sub-document for detailed instructions.
-""",
-            children=instruction_children,
-        ),
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Guardrails",
-            slug=f"{slug}/guardrails",
-            type="section",
-            summary="Rules, constraints, and coding standards.",
-            content=f"""# {name} -- Guardrails
+"""
+
+_GUARDRAILS_TMPL = """# {name} -- Guardrails
 
 ## Mandatory Rules (MUST)
 - **Native implementation**: Implement all functionality in the target project's primary language -- never copy-paste source code
@@ -836,16 +965,9 @@ See each sub-document for detailed instructions.
 ## Optional Rules (MAY)
 - Add performance benchmarks for hot paths
 - Include usage examples in documentation
-""",
-            children=[],
-        ),
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Validation",
-            slug=f"{slug}/validation",
-            type="section",
-            summary="Testing criteria and validation approach.",
-            content=f"""# {name} -- Validation
+"""
+
+_VALIDATION_TMPL = """# {name} -- Validation
 
 ## Test Strategy
 1. **Unit tests**: Cover each function/class in isolation
@@ -864,19 +986,12 @@ See each sub-document for detailed instructions.
 | Core functionality | Unit tests | All tests pass |
 | API contracts | Integration tests | Correct inputs/outputs |
 | Error handling | Negative tests | Graceful failure |
-""",
-            children=[],
-        ),
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Dependencies",
-            slug=f"{slug}/dependencies",
-            type="section",
-            summary="External and internal dependency tracking.",
-            content=f"""# {name} -- Dependencies
+"""
+
+_DEPENDENCIES_TMPL = """# {name} -- Dependencies
 
 ## External Dependencies
-{imports_list if imports_list else '*(None detected -- review source for runtime dependencies)*'}
+{deps_list}
 
 Find equivalent packages in your target ecosystem and add them to your
 dependency manifest.
@@ -887,16 +1002,9 @@ dependency manifest.
 ## Compatibility Notes
 - Ensure compatibility with the target project's runtime environment
 - Check version constraints for all external dependencies
-""",
-            children=[],
-        ),
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Versioning",
-            slug=f"{slug}/versioning",
-            type="section",
-            summary="Version history, changelog, and release policy.",
-            content=f"""# {name} -- Versioning
+"""
+
+_VERSIONING_TMPL = """# {name} -- Versioning
 
 ## Current Version
 - **Version**: 1.0.0
@@ -911,21 +1019,14 @@ This library follows [Semantic Versioning](https://semver.org/):
 
 ## Changelog
 
-### v1.0.0 ({now[:10]})
+### v1.0.0 ({today})
 - Initial library generation from {candidate_name}
 - Source repository: `{source_repo_url}`
-- {len(source_files)} source files analysed
-- {len(entry_points)} entry points identified
-""",
-            children=[],
-        ),
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Audit Trail",
-            slug=f"{slug}/audit_trail",
-            type="section",
-            summary="Provenance tracking and generation history.",
-            content=f"""# {name} -- Audit Trail
+- {file_count} source files analysed
+- {ep_count} entry points identified
+"""
+
+_AUDIT_TMPL = """# {name} -- Audit Trail
 
 ## Generation Provenance
 | Field | Value |
@@ -933,27 +1034,20 @@ This library follows [Semantic Versioning](https://semver.org/):
 | Generated At | {now} |
 | Source Repository | `{source_repo_url}` |
 | Candidate | {candidate_name} |
-| Source Files | {len(source_files)} |
-| Entry Points | {len(entry_points)} |
+| Source Files | {file_count} |
+| Entry Points | {ep_count} |
 | Tags | {tags_inline} |
 
 ## Change Log
-- **{now[:10]}**: Initial library generated from analyzer candidate "{candidate_name}"
+- **{today}**: Initial library generated from analyzer candidate "{candidate_name}"
 
 ## Compliance Notes
 - This library was generated using ALE's automated analysis pipeline
 - Instructions are derived from static analysis of the source code
 - Review the Security section for any flagged concerns
-""",
-            children=[],
-        ),
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Security",
-            slug=f"{slug}/security",
-            type="section",
-            summary="Security considerations and threat model.",
-            content=f"""# {name} -- Security
+"""
+
+_SECURITY_TMPL = """# {name} -- Security
 
 ## Security Considerations
 - **Input validation**: All public API inputs must be validated
@@ -973,16 +1067,9 @@ This library follows [Semantic Versioning](https://semver.org/):
 1. Run `npm audit` / `pip-audit` / equivalent before deployment
 2. Enable dependabot or similar for automated security updates
 3. Review the guardrails section for mandatory security rules
-""",
-            children=[],
-        ),
-        LibraryDocNodeResponse(
-            id=str(uuid.uuid4()),
-            title="Variables & Configuration",
-            slug=f"{slug}/variables",
-            type="section",
-            summary="Environment variables and configuration reference.",
-            content=f"""# {name} -- Variables & Configuration
+"""
+
+_VARIABLES_TMPL = """# {name} -- Variables & Configuration
 
 ## Environment Variables
 Document all environment variables this library depends on:
@@ -1004,29 +1091,14 @@ List any configuration files needed:
 - All configuration should be injectable (no hardcoded values)
 - Provide reasonable defaults for all optional settings
 - Document the expected format and valid ranges for each variable
-""",
-            children=[],
-        ),
-    ]
-
-    # Build root node
-    section_toc = "\n".join(
-        f"| [{s.title}](./{slug}/{s.slug.split('/')[-1]}) | {s.summary} |"
-        for s in sections
-    )
+"""
 
-    root = LibraryDocNodeResponse(
-        id=str(uuid.uuid4()),
-        title=f"{name} Library",
-        slug=slug,
-        type="root",
-        summary=description or f"Agentic library generated from {candidate_name}.",
-        content=f"""# {name} Library
+_ROOT_TMPL = """# {name} Library
 
 > Agentic build instructions generated from the **{candidate_name}** analysis candidate.
 
 ## Summary
-{description or 'A library extracted from the analyzed codebase.'}
+{purpose}
 
 ## Source Reference
 - **Repository**: `{source_repo_url}`
@@ -1049,11 +1121,310 @@ List any configuration files needed:
 
 ## Tags
 {tags_inline}
-""",
-        children=sections,
+"""
+
+
+def _build_library_structure(
+    name: str,
+    slug: str,
+    description: str,
+    source_files: list[str],
+    entry_points: list[str],
+    tags: list[str],
+    source_repo_url: str,
+    candidate_name: str,
+    code_analysis: dict | None = None,
+    now: str | None = None,
+) -> LibraryDocNodeResponse:
+    """Build a hierarchical document tree for a generated library.
+
+    When ``code_analysis`` is provided (from ``_analyze_source_code``),
+    instructions are derived from the actual code structure rather than
+    generic templates.  ``source_repo_url`` is the display URL/path for
+    the source repository (never a temp clone directory).  ``now`` is the
+    ISO timestamp stamped into the generated docs; callers pass the same
+    value they store as ``created_at``/``updated_at``.
+
+    The rendered Markdown is memoized on the inputs, so regenerating the
+    same candidate only assigns fresh node IDs and timestamps.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc).isoformat()
+
+    args = (
+        name, slug, description, source_files, entry_points, tags,
+        source_repo_url, candidate_name, code_analysis,
     )
+    key = hashlib.blake2b(orjson.dumps(args), digest_size=16).digest()
+    tree = _STRUCTURE_CACHE.get(key)
+    if tree is None:
+        tree = _render_library_tree(*args)
+        if len(_STRUCTURE_CACHE) >= _STRUCTURE_CACHE_MAX:
+            _STRUCTURE_CACHE.clear()
+        _STRUCTURE_CACHE[key] = tree
 
-    return root
+    next_id = _node_ids(_NODES_PER_LIBRARY).__next__
+    return _materialize_node(tree, next_id, now)
+
+
+def _materialize_node(
+    node: dict, next_id: Callable[[], str], now: str,
+) -> LibraryDocNodeResponse:
+    """Turn a cached template node into a response node.
+
+    Assigns a fresh ID and fills the timestamp markers.  The cached tree
+    only holds trusted strings, so ``model_construct`` skips validation.
+    """
+    content = node["content"]
+    if _NOW_MARK in content or _TODAY_MARK in content:
+        content = content.replace(_NOW_MARK, now).replace(_TODAY_MARK, now[:10])
+    return LibraryDocNodeResponse.model_construct(
+        id=next_id(),
+        title=node["title"],
+        slug=node["slug"],
+        type=node["type"],
+        summary=node["summary"],
+        content=content,
+        children=[_materialize_node(c, next_id, now) for c in node["children"]],
+    )
+
+
+def _render_library_tree(
+    name: str,
+    slug: str,
+    description: str,
+    source_files: list[str],
+    entry_points: list[str],
+    tags: list[str],
+    source_repo_url: str,
+    candidate_name: str,
+    code_analysis: dict | None,
+) -> dict:
+    """Render the library document tree as plain dicts without IDs.
+
+    Timestamps are left as ``_NOW_MARK``/``_TODAY_MARK`` so the result can
+    be cached and reused by ``_build_library_structure``.
+    """
+    files_list = "\n".join(f"- `{f}`" for f in source_files[:30]) or "- *(none detected)*"
+    ep_list = "\n".join(f"- `{ep}`" for ep in entry_points[:20]) or "- *(none detected)*"
+    tags_inline = ", ".join(tags) if tags else "general"
+
+    # Use code analysis to build richer content
+    ca = code_analysis or {"classes": [], "functions": [], "imports": [], "patterns": []}
+
+    # Build a code sketch from actual signatures
+    class_sketch = ""
+    if ca["classes"]:
+        lines = []
+        for cls in ca["classes"][:15]:
+            lines.append(f"- **`{cls['name']}`** (in `{cls['file']}`)")
+        class_sketch = "\n".join(lines)
+
+    func_sketch = ""
+    if ca["functions"]:
+        lines = []
+        for fn in ca["functions"][:20]:
+            lines.append(f"- `{fn['signature']}`  *(in `{fn['file']}`)*")
+        func_sketch = "\n".join(lines)
+
+    imports_list = ""
+    if ca["imports"]:
+        imports_list = "\n".join(f"- `{pkg}`" for pkg in ca["imports"])
+
+    patterns_list = ""
+    if ca["patterns"]:
+        patterns_list = "\n".join(f"- {p}" for p in ca["patterns"])
+
+    # One substitution context shared by every template below
+    ctx = {
+        "name": name,
+        "candidate_name": candidate_name,
+        "source_repo_url": source_repo_url,
+        "purpose": description or "A library extracted from the analyzed codebase.",
+        "now": _NOW_MARK,
+        "today": _TODAY_MARK,
+        "file_count": len(source_files),
+        "ep_count": len(entry_points),
+        "files_list": files_list,
+        "ep_list": ep_list,
+        "tags_inline": tags_inline,
+        "class_sketch": class_sketch,
+        "func_sketch": func_sketch,
+        "imports_list": imports_list,
+        "patterns_list": patterns_list,
+        "deps_list": imports_list or "*(None detected -- review source for runtime dependencies)*",
+    }
+
+    # ---- Build instruction steps from actual code ----
+
+    # Step 1: Data models & types (classes found)
+    step1_content = (
+        _STEP1_HEAD
+        + (_STEP1_CLASSES if class_sketch else _STEP1_NO_CLASSES)
+        + _STEP1_TAIL
+    ).format_map(ctx)
+
+    # Step 2: Core functions/logic
+    step2_content = (
+        _STEP2_HEAD
+        + (_STEP2_FUNCTIONS if func_sketch else _STEP2_ENTRY_POINTS)
+        + _STEP2_TAIL
+    ).format_map(ctx)
+
+    # Step 3: Integration & wiring
+    step3_content = (
+        _STEP3_HEAD
+        + (_STEP3_PATTERNS if ca["patterns"] else "")
+        + (_STEP3_IMPORTS if ca["imports"] else "")
+        + _STEP3_TAIL
+    ).format_map(ctx)
+
+    instruction_children = [
+        {
+            "title": title,
+            "slug": f"{slug}/instructions/{suffix}",
+            "type": "subsection",
+            "summary": summary,
+            "content": content,
+            "children": [],
+        }
+        for title, suffix, summary, content in (
+            (
+                "Step 1: Data Models & Types",
+                "step_1_models",
+                "Define data models and type structures from the analyzed code.",
+                step1_content,
+            ),
+            (
+                "Step 2: Core Logic",
+                "step_2_core_logic",
+                "Implement the primary functions and business logic.",
+                step2_content,
+            ),
+            (
+                "Step 3: Integration & Wiring",
+                "step_3_integration",
+                "Connect components, wire dependencies, and expose public API.",
+                step3_content,
+            ),
+        )
+    ]
+
+    # ---- Build instruction steps table from actual steps ----
+    ctx["step_table"] = "\n".join(
+        f"| {i+1} | {child['title']} | {child['summary']} |"
+        for i, child in enumerate(instruction_children)
+    )
+
+    # ---- Architecture section with real data ----
+    arch_content = (
+        _ARCH_HEAD.format_map(ctx)
+        + (
+            patterns_list + "\n"
+            if patterns_list
+            else "- *(Analyze source for architectural patterns)*\n"
+        )
+        + (_ARCH_MODULES + (_ARCH_TYPES if class_sketch else "") + _ARCH_TAIL).format_map(ctx)
+    )
+
+    # Build the sections
+    sections = [
+        {
+            "title": title,
+            "slug": f"{slug}/{suffix}",
+            "type": "section",
+            "summary": summary,
+            "content": content,
+            "children": children,
+        }
+        for title, suffix, summary, content, children in (
+            (
+                "Overview",
+                "overview",
+                f"High-level overview of the {name} library.",
+                _OVERVIEW_TMPL.format_map(ctx),
+                [],
+            ),
+            (
+                "Architecture",
+                "architecture",
+                "Architecture and design patterns from source analysis.",
+                arch_content,
+                [],
+            ),
+            (
+                "Instructions",
+                "instructions",
+                "Step-by-step implementation guide derived from source code analysis.",
+                _INSTRUCTIONS_TMPL.format_map(ctx),
+                instruction_children,
+            ),
+            (
+                "Guardrails",
+                "guardrails",
+                "Rules, constraints, and coding standards.",
+                _GUARDRAILS_TMPL.format_map(ctx),
+                [],
+            ),
+            (
+                "Validation",
+                "validation",
+                "Testing criteria and validation approach.",
+                _VALIDATION_TMPL.format_map(ctx),
+                [],
+            ),
+            (
+                "Dependencies",
+                "dependencies",
+                "External and internal dependency tracking.",
+                _DEPENDENCIES_TMPL.format_map(ctx),
+                [],
+            ),
+            (
+                "Versioning",
+                "versioning",
+                "Version history, changelog, and release policy.",
+                _VERSIONING_TMPL.format_map(ctx),
+                [],
+            ),
+            (
+                "Audit Trail",
+                "audit_trail",
+                "Provenance tracking and generation history.",
+                _AUDIT_TMPL.format_map(ctx),
+                [],
+            ),
+            (
+                "Security",
+                "security",
+                "Security considerations and threat model.",
+                _SECURITY_TMPL.format_map(ctx),
+                [],
+            ),
+            (
+                "Variables & Configuration",
+                "variables",
+                "Environment variables and configuration reference.",
+                _VARIABLES_TMPL.format_map(ctx),
+                [],
+            ),
+        )
+    ]
+
+    # Build root node
+    ctx["section_toc"] = "\n".join(
+        f"| [{s['title']}](./{slug}/{s['slug'].split('/')[-1]}) | {s['summary']} |"
+        for s in sections
+    )
+
+    return {
+        "title": f"{name} Library",
+        "slug": slug,
+        "type": "root",
+        "summary": description or f"Agentic library generated from {candidate_name}.",
+        "content": _ROOT_TMPL.format_map(ctx),
+        "children": sections,
+    }
 
 
 @router.post(
@@ -1088,11 +1459,12 @@ async def generate_hierarchical_library(request: GenerateHierarchicalLibraryRequ
             url_parts = source_repo_url.rstrip("/").split("/")
             dir_name = url_parts[-1].replace(".git", "") if url_parts else "codebase"
         raw_name = dir_name
-    display_name = raw_name.replace("_", " ").replace("-", " ").title()
+    display_name = raw_name.translate(_NAME_SPACES).title()
     slug = _slugify(raw_name) + "_library"
 
     # Analyze the actual source code for richer instructions
     code_analysis = _analyze_source_code(request.repo_path, request.source_files)
+    now = datetime.now(timezone.utc).isoformat()
 
     structure = _build_library_structure(
         name=display_name,
@@ -1104,9 +1476,9 @@ async def generate_hierarchical_library(request: GenerateHierarchicalLibraryRequ
         source_repo_url=source_repo_url,
         candidate_name=request.candidate_name,
         code_analysis=code_analysis,
+        now=now,
     )
 
-    now = datetime.now(timezone.utc).isoformat()
     library_id = str(uuid.uuid4())
 
     library = GeneratedLibraryResponse(
@@ -1122,17 +1494,13 @@ async def generate_hierarchical_library(request: GenerateHierarchicalLibraryRequ
     )
 
     # Persist to disk — include source commit and source_repo_url
-    libs_dir = _ensure_libraries_dir()
-    lib_path = libs_dir / f"{library_id}.json"
     lib_data = library.model_dump()
     lib_data["source_commit"] = _get_repo_head_commit(request.repo_path)
-    with open(lib_path, "w") as f:
-        json.dump(lib_data, f, indent=2)
+    _write_library(library_id, lib_data)
 
-    return GenerateHierarchicalLibraryResponse(
-        success=True,
-        library=library,
-        message=f"Library '{display_name}' generated successfully with {len(structure.children)} sections.",
+    return _library_response(
+        lib_data,
+        f"Library '{display_name}' generated successfully with {len(structure.children)} sections.",
     )
 
 
@@ -1141,21 +1509,42 @@ async def generate_hierarchical_library(request: GenerateHierarchicalLibraryRequ
     response_model=list[GeneratedLibraryResponse],
     summary="List all generated hierarchical libraries",
 )
-async def list_generated_libraries():
-    """List all generated hierarchical libraries, sorted by most recent."""
-    libs_dir = _ensure_libraries_dir()
-    libraries: list[dict] = []
+async def list_generated_libraries(
+    limit: int | None = Query(None, ge=1, description="Maximum number of libraries to return"),
+):
+    """List all generated hierarchical libraries, sorted by most recent.
 
-    for lib_file in libs_dir.glob("*.json"):
-        try:
-            with open(lib_file) as f:
-                lib = json.load(f)
-            libraries.append(lib)
-        except (json.JSONDecodeError, KeyError):
-            continue
+    Library files are rewritten whenever ``updated_at`` changes, so the
+    file mtime orders them without parsing; only the returned page is read,
+    and unchanged files come from the in-memory library cache.  Stored
+    libraries were validated when written, so they are rendered as-is.
+    """
+    libraries = await asyncio.to_thread(_scan_libraries, limit)
+    return ORJSONResponse([_public_library(lib) for lib in libraries])
 
-    libraries.sort(key=lambda d: d.get("updated_at", ""), reverse=True)
-    return [GeneratedLibraryResponse(**lib) for lib in libraries]
+
+@router.get(
+    "/libraries/stream",
+    summary="Stream generated libraries as NDJSON",
+)
+async def stream_generated_libraries(
+    limit: int | None = Query(None, ge=1, description="Maximum number of libraries to return"),
+):
+    """Stream generated libraries as ``application/x-ndjson``, newest first.
+
+    Same documents and order as ``GET /libraries``, one JSON object per
+    line, sent as each file is read so the first result arrives without
+    waiting for the whole directory.
+    """
+    entries = await asyncio.to_thread(_list_library_entries, limit)
+
+    async def lines():
+        for entry in entries:
+            lib = await asyncio.to_thread(_try_read_library, entry)
+            if lib is not None:
+                yield orjson.dumps(_public_library(lib)) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -1172,34 +1561,9 @@ async def search_generated_libraries(
     contain the search text (case-insensitive).  Returns all libraries
     if no text is provided.
     """
-    libs_dir = _ensure_libraries_dir()
-    libraries: list[dict] = []
-    query = text.strip().lower()
-
-    for lib_file in libs_dir.glob("*.json"):
-        try:
-            with open(lib_file) as f:
-                lib = json.load(f)
-        except (json.JSONDecodeError, KeyError):
-            continue
-
-        if not query:
-            libraries.append(lib)
-            continue
-
-        # Search across multiple fields
-        searchable = " ".join([
-            lib.get("name", ""),
-            lib.get("candidate_name", ""),
-            lib.get("source_repo_url", ""),
-            lib.get("repo_path", ""),
-        ]).lower()
-
-        if query in searchable:
-            libraries.append(lib)
-
-    libraries.sort(key=lambda d: d.get("updated_at", ""), reverse=True)
-    return [GeneratedLibraryResponse(**lib) for lib in libraries]
+    libraries = await asyncio.to_thread(_search_libraries, text.strip().lower())
+    libraries.sort(key=_BY_UPDATED_AT, reverse=True)
+    return ORJSONResponse([_public_library(lib) for lib in libraries])
 
 
 @router.get(
@@ -1208,20 +1572,13 @@ async def search_generated_libraries(
     summary="Get a specific generated library",
 )
 async def get_generated_library(library_id: str):
-    """Retrieve a specific generated library by ID."""
-    libs_dir = _ensure_libraries_dir()
-    lib_path = libs_dir / f"{library_id}.json"
-
-    if not lib_path.exists():
-        raise HTTPException(status_code=404, detail=f"Library '{library_id}' not found")
-
-    try:
-        with open(lib_path) as f:
-            lib = json.load(f)
-    except (json.JSONDecodeError, KeyError) as exc:
-        raise HTTPException(status_code=500, detail=f"Failed to read library: {exc}")
+    """Retrieve a specific generated library by ID.
 
-    return GeneratedLibraryResponse(**lib)
+    Stored libraries were written from a validated model, so the cached
+    dict is serialized directly rather than rebuilt as a pydantic model.
+    """
+    lib = await asyncio.to_thread(_load_library, library_id)
+    return ORJSONResponse(_public_library(lib))
 
 
 @router.delete(
@@ -1230,13 +1587,14 @@ async def get_generated_library(library_id: str):
 )
 async def delete_generated_library(library_id: str):
     """Delete a specific generated library by ID."""
-    libs_dir = _ensure_libraries_dir()
-    lib_path = libs_dir / f"{library_id}.json"
+    lib_path = _library_path(library_id)
 
-    if not lib_path.exists():
+    try:
+        await asyncio.to_thread(os.unlink, lib_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Library '{library_id}' not found")
-
-    lib_path.unlink()
+    _LIB_CACHE.pop(library_id, None)
+    _remember_missing(library_id, time.monotonic())
     return {"detail": "Library deleted"}
 
 
@@ -1245,44 +1603,483 @@ async def delete_generated_library(library_id: str):
 # ---------------------------------------------------------------------------
 
 
+def _library_response(lib_data: dict, message: str) -> ORJSONResponse:
+    """Build a ``GenerateHierarchicalLibraryResponse`` body from *lib_data*.
+
+    Reuses the ``model_dump()`` already taken for persistence so the
+    library tree is not validated and serialized a second time by FastAPI.
+    """
+    return ORJSONResponse(
+        {"success": True, "library": _public_library(lib_data), "message": message}
+    )
+
+
+def _public_library(lib_data: dict) -> dict:
+    """Return *lib_data* without storage-only keys (``_LIB_RESPONSE_FIELDS`` only)."""
+    return {k: v for k, v in lib_data.items() if k in _LIB_RESPONSE_FIELDS}
+
+
+def _write_library(library_id: str, lib_data: dict) -> None:
+    """Atomically persist a generated library and refresh its cache entry.
+
+    The source files referenced by the structure are stored alongside it
+    so update checks don't have to walk the tree.  The JSON is written to
+    a sibling temp file and renamed over the target, so readers never
+    observe a half-written library.
+    """
+    lib_data["source_files"] = _extract_source_files_from_structure(lib_data["structure"])
+    lib_path = _library_path(library_id)
+    tmp_path = lib_path + ".tmp"
+    st = _write_bytes(tmp_path, orjson.dumps(lib_data, option=_STORE_JSON_OPTS))
+    os.replace(tmp_path, lib_path)
+    _MISSING_CACHE.pop(library_id, None)
+    _cache_library(library_id, st, lib_data)
+
+
+def _library_path(library_id: str) -> str:
+    """Return the storage path of *library_id* as a plain string, or raise 400.
+
+    IDs that could escape the libraries directory are rejected before any
+    filesystem access.  The path is built by concatenation rather than
+    ``Path`` joins since it is on every library request's syscall path.
+    """
+    if not _ID_RE.match(library_id):
+        raise HTTPException(status_code=400, detail=f"Invalid library ID '{library_id}'")
+    _ensure_libraries_dir()
+    return f"{_LIBS_DIR_STR}/{library_id}.json"
+
+
+def _remember_missing(library_id: str, now: float) -> None:
+    """Record a miss for *library_id*, clearing the cache once it is full."""
+    if len(_MISSING_CACHE) >= _MISSING_CACHE_MAX:
+        _MISSING_CACHE.clear()
+    _MISSING_CACHE[library_id] = now
+
+
 def _load_library(library_id: str) -> dict:
-    """Load a generated library JSON by ID, or raise 404."""
-    libs_dir = _ensure_libraries_dir()
-    lib_path = libs_dir / f"{library_id}.json"
-    if not lib_path.exists():
+    """Load a generated library JSON by ID, or raise 404.
+
+    Parsed libraries are cached in-process and revalidated against the
+    file's mtime and size; callers must treat the result as read-only.
+    Misses are remembered for ``_MISSING_CACHE_TTL`` seconds so clients
+    polling a deleted ID don't cost a ``stat`` per request.
+    """
+    now = time.monotonic()
+    missed_at = _MISSING_CACHE.get(library_id)
+    if missed_at is not None and now - missed_at < _MISSING_CACHE_TTL:
+        raise HTTPException(status_code=404, detail=f"Library '{library_id}' not found")
+
+    lib_path = _library_path(library_id)
+    try:
+        st = os.stat(lib_path)
+    except FileNotFoundError:
+        _remember_missing(library_id, now)
         raise HTTPException(status_code=404, detail=f"Library '{library_id}' not found")
+
     try:
-        with open(lib_path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, KeyError) as exc:
+        return _read_library_cached(library_id, lib_path, st)
+    except (orjson.JSONDecodeError, KeyError) as exc:
         raise HTTPException(status_code=500, detail=f"Failed to read library: {exc}")
 
 
+def _read_library_cached(library_id: str, path: str | Path, st: os.stat_result) -> dict:
+    """Parse the library file at ``path``, reusing ``_LIB_CACHE`` when unchanged.
+
+    ``st`` is the caller's stat of ``path``; it doubles as the cache key.
+    Raises ``orjson.JSONDecodeError`` / ``OSError`` on unreadable files.
+    """
+    cached = _LIB_CACHE.get(library_id)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        # Move to the most-recently-used end
+        _LIB_CACHE[library_id] = _LIB_CACHE.pop(library_id, cached)
+        return cached[2]
+
+    if st.st_size > _MMAP_THRESHOLD:
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm, memoryview(mm) as view:
+            lib = orjson.loads(view)
+    else:
+        lib = orjson.loads(_read_bytes(path, st.st_size))
+
+    if "source_files" not in lib:
+        # Libraries written before source_files was stored
+        lib["source_files"] = _extract_source_files_from_structure(lib.get("structure", {}))
+    _cache_library(library_id, st, lib)
+    return lib
+
+
+def _read_bytes(path: str | Path, size_hint: int) -> bytes:
+    """Read a whole file with raw ``os.read`` calls (no buffered file object).
+
+    ``size_hint`` is the caller's ``st_size``; the first read asks for one
+    byte more so an unchanged file is fully read after a single EOF check.
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        chunks = []
+        want = size_hint + 1
+        while chunk := os.read(fd, want):
+            chunks.append(chunk)
+            want = 1 << 16
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _write_bytes(path: str, data: bytes) -> os.stat_result:
+    """Write *data* to *path* with raw ``os.write`` calls; return its stat.
+
+    No fsync: libraries can be regenerated, so durability is left to the
+    OS.  The stat is taken from the open descriptor, which saves a lookup
+    and stays valid after the file is renamed.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        return os.fstat(fd)
+    finally:
+        os.close(fd)
+
+
+def _cache_library(library_id: str, st: os.stat_result, lib: dict) -> None:
+    """Store *lib* in ``_LIB_CACHE``, evicting the least recently used entries.
+
+    Entries are evicted until the cached file sizes fit in
+    ``_LIB_CACHE_MAX_BYTES``.
+    """
+    _LIB_CACHE.pop(library_id, None)
+    if st.st_size > _LIB_CACHE_MAX_BYTES:
+        return
+    total = st.st_size + sum(size for _, size, _ in list(_LIB_CACHE.values()))
+    while total > _LIB_CACHE_MAX_BYTES:
+        try:
+            _, size, _ = _LIB_CACHE.pop(next(iter(_LIB_CACHE)))
+        except (KeyError, RuntimeError, StopIteration):
+            # Another worker thread changed the cache meanwhile
+            break
+        total -= size
+    _LIB_CACHE[library_id] = (st.st_mtime_ns, st.st_size, lib)
+
+
 def _extract_source_files_from_structure(structure: dict) -> list[str]:
-    """Walk the library document tree and extract referenced source file paths."""
+    """Walk the library document tree and extract referenced source file paths.
+
+    Uses an explicit stack (pre-order, same as a recursive walk) so very
+    deep trees cannot hit the recursion limit.
+    """
     files: list[str] = []
-    content = structure.get("content", "")
-    # Look for backtick-quoted file paths in the content
-    for match in re.finditer(r"`([^`]+\.\w+)`", content):
-        candidate = match.group(1)
-        # Filter to likely file paths (contain / or end with known extensions)
-        if "/" in candidate or candidate.endswith((".py", ".ts", ".tsx", ".js", ".jsx", ".go", ".rs", ".java")):
-            files.append(candidate)
+    seen: set[str] = set()
+    stack = deque([structure])
+    while stack:
+        node = stack.pop()
+        content = node.get("content", "")
+        # Look for backtick-quoted file paths in the content
+        if content and "`" in content:
+            for match in _BACKTICK_PATH_RE.finditer(content):
+                candidate = match.group(1)
+                if candidate in seen:
+                    continue
+                # Filter to likely file paths (contain / or end with known extensions)
+                if "/" in candidate or candidate.endswith(_CODE_EXTS):
+                    seen.add(candidate)
+                    files.append(candidate)
+        stack.extend(reversed(node.get("children", [])))
+
+    return files
+
+
+def _scan_drafts(limit: int | None = None) -> list[dict]:
+    """Return up to ``limit`` drafts (all by default), newest ``updated_at`` first.
+
+    Drafts are listed from the append-only ``_index.jsonl`` manifest in one
+    sequential read; the per-draft files are only scanned to (re)build a
+    missing manifest. The sorted listing is cached until the manifest's
+    stat changes, so polling an unchanged drafts directory costs a single
+    ``stat()``. Runs in a worker thread so a large drafts directory does
+    not block the event loop.
+    """
+    global _drafts_cache
+    drafts_dir = _ensure_drafts_dir()
+    index_path = drafts_dir / _DRAFT_INDEX
 
-    for child in structure.get("children", []):
-        files.extend(_extract_source_files_from_structure(child))
+    key = _draft_index_key(index_path)
+    cached = _drafts_cache
+    if key is not None and cached is not None and cached[0] == key:
+        drafts = cached[1]
+        return drafts[:limit] if limit is not None else list(drafts)
 
-    return list(dict.fromkeys(files))  # deduplicate preserving order
+    try:
+        data = index_path.read_bytes()
+    except FileNotFoundError:
+        with _draft_index_lock:
+            if index_path.exists():
+                # Rebuilt by another listing meanwhile
+                data = index_path.read_bytes()
+            else:
+                data = None
+                drafts = _read_draft_files(drafts_dir)
+                _rewrite_draft_index(index_path, drafts)
+    if data is not None:
+        # Only whole lines; an append still being written is read later
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].splitlines()
+        live: dict[str, dict] = {}
+        _fold_draft_records(live, lines)
+        # Compact once tombstones and superseded records dominate the file
+        if len(lines) > _DRAFT_INDEX_COMPACT_MIN and len(lines) > 2 * len(live):
+            with _draft_index_lock:
+                # Fold in whatever was appended since the read above
+                with open(index_path, "rb") as f:
+                    f.seek(end)
+                    _fold_draft_records(live, f.read().splitlines())
+                _rewrite_draft_index(index_path, list(live.values()))
+            key = None
+        drafts = list(live.values())
+
+    drafts.sort(key=_BY_UPDATED_AT, reverse=True)
+    # Re-stat after a rebuild or compaction so the cache keys the new file
+    key = key if key is not None else _draft_index_key(index_path)
+    if key is not None:
+        _drafts_cache = (key, drafts)
+    return drafts[:limit] if limit is not None else list(drafts)
+
+
+def _fold_draft_records(live: dict[str, dict], lines: list[bytes]) -> None:
+    """Apply manifest *lines* (records and tombstones) to *live*, in order."""
+    for line in lines:
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+        if record.get("deleted"):
+            live.pop(record.get("id"), None)
+        else:
+            live[record["id"]] = record
 
 
-def _get_repo_head_commit(repo_path: str) -> str:
-    """Get the current HEAD commit SHA for a repo path."""
+def _draft_index_key(index_path: Path) -> tuple[int, int, int] | None:
+    """Return the manifest's stat key, or ``None`` if it does not exist."""
     try:
-        from git import Repo as GitRepo
-        r = GitRepo(repo_path)
-        return str(r.head.commit.hexsha)
-    except Exception:
-        return ""
+        st = os.stat(index_path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _read_draft_files(drafts_dir: Path) -> list[dict]:
+    """Parse every ``<id>.json`` draft file in *drafts_dir*, reading in parallel."""
+    with os.scandir(drafts_dir) as it:
+        paths = [
+            entry.path for entry in it
+            if entry.name.endswith(".json") and not entry.name.startswith("_")
+        ]
+    return [d for d in _FILE_READ_POOL.map(_try_read_draft, paths) if d is not None]
+
+
+def _try_read_draft(path: str) -> dict | None:
+    """Parse one draft file, or return ``None`` if it is unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (orjson.JSONDecodeError, OSError):
+        return None
+
+
+def _append_draft_index(drafts_dir: Path, record: dict) -> None:
+    """Append one draft record (or ``deleted`` tombstone) to the manifest.
+
+    A missing manifest is left alone; the next listing rebuilds it from the
+    draft files, which already include this change.  Holding
+    ``_draft_index_lock`` keeps the append out of a concurrent rebuild or
+    compaction, which would otherwise replace the file without it.
+    """
+    index_path = drafts_dir / _DRAFT_INDEX
+    with _draft_index_lock:
+        if not index_path.exists():
+            return
+        with open(index_path, "ab") as f:
+            f.write(orjson.dumps(record) + b"\n")
+
+
+def _rewrite_draft_index(index_path: Path, drafts: list[dict]) -> None:
+    """Atomically replace the manifest with one record per live draft."""
+    tmp_path = index_path.with_suffix(".jsonl.tmp")
+    tmp_path.write_bytes(b"".join(orjson.dumps(d) + b"\n" for d in drafts))
+    os.replace(tmp_path, index_path)
+
+
+def _search_libraries(query: str) -> list[dict]:
+    """Return stored libraries matching the lower-cased *query* (all if empty).
+
+    Runs in a worker thread; see ``search_generated_libraries``.
+    """
+    libs_dir = _ensure_libraries_dir()
+    libraries: list[dict] = []
+
+    with os.scandir(libs_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".json") or entry.name.startswith("_"):
+                continue
+            try:
+                lib = _read_library_cached(entry.name[:-5], entry.path, entry.stat())
+            except (orjson.JSONDecodeError, OSError):
+                continue
+
+            if not query:
+                libraries.append(lib)
+                continue
+
+            # Search across multiple fields
+            searchable = " ".join([
+                lib.get("name", ""),
+                lib.get("candidate_name", ""),
+                lib.get("source_repo_url", ""),
+                lib.get("repo_path", ""),
+            ]).lower()
+
+            if query in searchable:
+                libraries.append(lib)
+
+    return libraries
+
+
+def _list_library_entries(limit: int | None) -> list[tuple[int, str, str, os.stat_result]]:
+    """Return ``(mtime_ns, name, path, stat)`` for up to ``limit`` library files.
+
+    Newest first, ordered by mtime alone; no file is opened.
+    """
+    libs_dir = _ensure_libraries_dir()
+    entries: list[tuple[int, str, str, os.stat_result]] = []
+
+    with os.scandir(libs_dir) as it:
+        for entry in it:
+            if (
+                not entry.name.endswith(".json")
+                or entry.name.startswith("_")
+                or not entry.is_file()
+            ):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, entry.name, entry.path, st))
+
+    entries.sort(key=lambda e: (e[0], e[1]), reverse=True)
+    if limit is not None:
+        entries = entries[:limit]
+    return entries
+
+
+def _scan_libraries(limit: int | None) -> list[dict]:
+    """Return up to ``limit`` stored libraries, most recently written first.
+
+    Runs in a worker thread; see ``list_generated_libraries``.
+    """
+    entries = _list_library_entries(limit)
+
+    # Files whose cache entry is stale are read in parallel: on network or
+    # cloud volumes the per-file read latency, not parsing, dominates.
+    stale = [
+        e for e in entries
+        if _LIB_CACHE.get(e[1][:-5], (None, None))[:2] != (e[3].st_mtime_ns, e[3].st_size)
+    ]
+    if len(stale) > 1:
+        list(_FILE_READ_POOL.map(_try_read_library, stale))
+
+    libraries: list[dict] = []
+    for entry in entries:
+        lib = _try_read_library(entry)
+        if lib is not None:
+            libraries.append(lib)
+
+    return libraries
+
+
+def _try_read_library(entry: tuple[int, str, str, os.stat_result]) -> dict | None:
+    """``_read_library_cached`` for a scan entry, or ``None`` if unreadable."""
+    _, name, path, st = entry
+    try:
+        return _read_library_cached(name[:-5], path, st)
+    except (orjson.JSONDecodeError, OSError):
+        return None
+
+
+def _stat_once(path: str) -> os.stat_result | None:
+    """Return ``os.stat(path)``, or ``None`` if the path cannot be stat'ed."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _read_head_sha(repo_path: str) -> str | None:
+    """Resolve HEAD by reading the git metadata files directly.
+
+    Handles detached HEADs, loose refs, packed refs and ``.git`` files
+    (worktrees/submodules).  Returns ``None`` when the layout is anything
+    else so the caller can fall back to GitPython.
+    """
+    try:
+        git_dir = Path(repo_path) / ".git"
+        if git_dir.is_file():
+            pointer = git_dir.read_text().strip()
+            if not pointer.startswith("gitdir: "):
+                return None
+            git_dir = (git_dir.parent / pointer[8:]).resolve()
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head if _SHA_RE.match(head) else None
+
+        ref = head[5:]
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            common_dir = (git_dir / commondir_file.read_text().strip()).resolve()
+        for base in dict.fromkeys((git_dir, common_dir)):
+            ref_path = base / ref
+            if ref_path.is_file():
+                sha = ref_path.read_text().strip()
+                return sha if _SHA_RE.match(sha) else None
+
+        packed = common_dir / "packed-refs"
+        if packed.is_file():
+            for line in packed.read_text().splitlines():
+                sha, _, name = line.partition(" ")
+                if name == ref and _SHA_RE.match(sha):
+                    return sha
+    except (OSError, UnicodeDecodeError):
+        pass
+    return None
+
+
+def _get_repo_head_commit(repo_path: str) -> str:
+    """Get the current HEAD commit SHA for a repo path.
+
+    HEAD is read straight from the ``.git`` directory when possible; a
+    GitPython ``Repo`` is only opened (and closed again) as the fallback,
+    so no ``git cat-file`` processes outlive the call.  The SHA is cached
+    for ``_HEAD_CACHE_TTL`` seconds, so back-to-back endpoint calls for the
+    same repository do not hit the disk again.
+    """
+    now = time.monotonic()
+    cached = _HEAD_CACHE.get(repo_path)
+    if cached is not None and now - cached[0] < _HEAD_CACHE_TTL:
+        return cached[1]
+    sha = _read_head_sha(repo_path)
+    if sha is None:
+        try:
+            with GitRepo(repo_path) as repo:
+                sha = str(repo.head.commit.hexsha)
+        except Exception:
+            return ""
+    if len(_HEAD_CACHE) >= _HEAD_CACHE_MAX:
+        _HEAD_CACHE.clear()
+    _HEAD_CACHE[repo_path] = (now, sha)
+    return sha
 
 
 @router.post(
@@ -1297,17 +2094,18 @@ async def check_library_updates(library_id: str):
     as major, minor, or patch based on commit volume, file churn, version
     tags, and whether the library's own source files were affected.
     """
-    lib = _load_library(library_id)
+    lib = await asyncio.to_thread(_load_library, library_id)
     repo_path = lib.get("repo_path", "")
 
-    if not repo_path or not Path(repo_path).is_dir():
+    repo_stat = _stat_once(repo_path) if repo_path else None
+    if repo_stat is None or not stat.S_ISDIR(repo_stat.st_mode):
         raise HTTPException(
             status_code=400,
             detail=f"Source repository path is not accessible: {repo_path}",
         )
 
-    # Extract source files from the library structure for relevance checking
-    source_files = _extract_source_files_from_structure(lib.get("structure", {}))
+    # Source files referenced by the library structure, for relevance checking
+    source_files = lib["source_files"]
 
     # Determine the commit the library was generated from
     # We store this in the library metadata; if not present, use the creation timestamp
@@ -1315,7 +2113,8 @@ async def check_library_updates(library_id: str):
 
     from ale.sync.update_checker import check_for_updates
 
-    result = check_for_updates(
+    result = await asyncio.to_thread(
+        check_for_updates,
         repo_path=repo_path,
         since_commit=since_commit,
         source_files=source_files,
@@ -1363,11 +2162,12 @@ async def update_library(library_id: str):
     Overwrites the existing library with a freshly generated version
     using the same candidate parameters but the latest source code.
     """
-    lib = _load_library(library_id)
+    lib = await asyncio.to_thread(_load_library, library_id)
     repo_path = lib.get("repo_path", "")
     candidate_name = lib.get("candidate_name", "")
 
-    if not repo_path or not Path(repo_path).is_dir():
+    repo_stat = _stat_once(repo_path) if repo_path else None
+    if repo_stat is None or not stat.S_ISDIR(repo_stat.st_mode):
         raise HTTPException(
             status_code=400,
             detail=f"Source repository path is not accessible: {repo_path}",
@@ -1380,20 +2180,22 @@ async def update_library(library_id: str):
     raw_name = candidate_name
     if raw_name == "__whole_codebase__":
         raw_name = Path(repo_path).name or "codebase"
-    display_name = raw_name.replace("_", " ").replace("-", " ").title()
+    display_name = raw_name.translate(_NAME_SPACES).title()
     slug = _slugify(raw_name) + "_library"
 
-    # Extract source files and other metadata from the original structure
-    source_files = _extract_source_files_from_structure(lib.get("structure", {}))
+    # Source files (stored at write time) and other metadata from the original
+    source_files = lib["source_files"]
     description = lib.get("structure", {}).get("summary", "")
 
     # Capture current commit for future update checks
-    current_commit = _get_repo_head_commit(repo_path)
+    current_commit = await asyncio.to_thread(_get_repo_head_commit, repo_path)
 
     # Analyze actual source code for richer instructions
-    code_analysis = _analyze_source_code(repo_path, source_files)
+    code_analysis = await asyncio.to_thread(_analyze_source_code, repo_path, source_files)
+    now = datetime.now(timezone.utc).isoformat()
 
-    structure = _build_library_structure(
+    structure = await asyncio.to_thread(
+        _build_library_structure,
         name=display_name,
         slug=slug,
         description=description,
@@ -1403,10 +2205,9 @@ async def update_library(library_id: str):
         source_repo_url=source_repo_url,
         candidate_name=candidate_name,
         code_analysis=code_analysis,
+        now=now,
     )
 
-    now = datetime.now(timezone.utc).isoformat()
-
     updated_library = GeneratedLibraryResponse(
         id=library_id,  # Keep the same ID
         name=display_name,
@@ -1420,17 +2221,13 @@ async def update_library(library_id: str):
     )
 
     # Persist (overwrite) to disk
-    libs_dir = _ensure_libraries_dir()
-    lib_path = libs_dir / f"{library_id}.json"
     lib_data = updated_library.model_dump()
     lib_data["source_commit"] = current_commit
-    with open(lib_path, "w") as f:
-        json.dump(lib_data, f, indent=2)
+    await asyncio.to_thread(_write_library, library_id, lib_data)
 
-    return GenerateHierarchicalLibraryResponse(
-        success=True,
-        library=updated_library,
-        message=f"Library '{display_name}' updated from latest source. Commit: {current_commit[:12]}",
+    return _library_response(
+        lib_data,
+        f"Library '{display_name}' updated from latest source. Commit: {current_commit[:12]}",
     )
 
 
@@ -1445,12 +2242,13 @@ async def create_from_latest(library_id: str, request: CreateFromLatestRequest):
     This allows the user to test and experiment with the new version
     before deciding to overwrite the existing library.
     """
-    lib = _load_library(library_id)
+    lib = await asyncio.to_thread(_load_library, library_id)
     repo_path = lib.get("repo_path", "")
     candidate_name = lib.get("candidate_name", "")
     source_repo_url = lib.get("source_repo_url", repo_path)
 
-    if not repo_path or not Path(repo_path).is_dir():
+    repo_stat = _stat_once(repo_path) if repo_path else None
+    if repo_stat is None or not stat.S_ISDIR(repo_stat.st_mode):
         raise HTTPException(
             status_code=400,
             detail=f"Source repository path is not accessible: {repo_path}",
@@ -1462,22 +2260,24 @@ async def create_from_latest(library_id: str, request: CreateFromLatestRequest):
 
     # Use custom name or generate one with timestamp
     now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
     if request.new_name and request.new_name.strip():
         display_name = request.new_name.strip()
     else:
-        display_name = raw_name.replace("_", " ").replace("-", " ").title()
+        display_name = raw_name.translate(_NAME_SPACES).title()
         display_name = f"{display_name} ({now.strftime('%Y-%m-%d %H:%M')})"
 
     slug = _slugify(display_name) + "_library"
 
-    source_files = _extract_source_files_from_structure(lib.get("structure", {}))
+    source_files = lib["source_files"]
     description = lib.get("structure", {}).get("summary", "")
 
-    current_commit = _get_repo_head_commit(repo_path)
+    current_commit = await asyncio.to_thread(_get_repo_head_commit, repo_path)
 
-    code_analysis = _analyze_source_code(repo_path, source_files)
+    code_analysis = await asyncio.to_thread(_analyze_source_code, repo_path, source_files)
 
-    structure = _build_library_structure(
+    structure = await asyncio.to_thread(
+        _build_library_structure,
         name=display_name,
         slug=slug,
         description=description,
@@ -1487,6 +2287,7 @@ async def create_from_latest(library_id: str, request: CreateFromLatestRequest):
         source_repo_url=source_repo_url,
         candidate_name=candidate_name,
         code_analysis=code_analysis,
+        now=now_iso,
     )
 
     new_library_id = str(uuid.uuid4())
@@ -1497,23 +2298,19 @@ async def create_from_latest(library_id: str, request: CreateFromLatestRequest):
         root_doc=f"{slug}.md",
         repo_path=repo_path,
         candidate_name=candidate_name,
-        created_at=now.isoformat(),
-        updated_at=now.isoformat(),
+        created_at=now_iso,
+        updated_at=now_iso,
         structure=structure,
         source_repo_url=source_repo_url,
     )
 
     # Persist as a new file
-    libs_dir = _ensure_libraries_dir()
-    lib_path = libs_dir / f"{new_library_id}.json"
     lib_data = new_library.model_dump()
     lib_data["source_commit"] = current_commit
     lib_data["forked_from"] = library_id
-    with open(lib_path, "w") as f:
-        json.dump(lib_data, f, indent=2)
+    await asyncio.to_thread(_write_library, new_library_id, lib_data)
 
-    return GenerateHierarchicalLibraryResponse(
-        success=True,
-        library=new_library,
-        message=f"New library '{display_name}' created from latest source. Original preserved.",
+    return _library_response(
+        lib_data,
+        f"New library '{display_name}' created from latest source. Original preserved.",
     )
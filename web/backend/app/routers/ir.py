@@ -20,8 +20,12 @@ router = APIRouter(tags=["ir"])
 
 
 def _symbol_to_response(symbol) -> IRSymbolResponse:
-    """Convert an IRSymbol dataclass to a Pydantic response."""
-    return IRSymbolResponse(
+    """Convert an IRSymbol dataclass to a Pydantic response.
+
+    The IR dataclasses already carry correctly typed values, so the
+    response models are built with ``model_construct`` (no validation).
+    """
+    return IRSymbolResponse.model_construct(
         name=symbol.name,
         kind=symbol.kind.value,
         source_file=symbol.source_file,
@@ -30,7 +34,7 @@ def _symbol_to_response(symbol) -> IRSymbolResponse:
         line_count=symbol.line_count,
         visibility=symbol.visibility.value,
         parameters=[
-            IRParameterResponse(
+            IRParameterResponse.model_construct(
                 name=p.name,
                 type_hint=p.type_hint,
                 default_value=p.default_value,
@@ -51,7 +55,7 @@ def _symbol_to_response(symbol) -> IRSymbolResponse:
 
 def _dependency_to_response(dep) -> IRDependencyResponse:
     """Convert an IRDependency dataclass to a Pydantic response."""
-    return IRDependencyResponse(
+    return IRDependencyResponse.model_construct(
         source=dep.source,
         target=dep.target,
         kind=dep.kind.value,
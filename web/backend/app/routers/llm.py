@@ -6,20 +6,18 @@ guardrail suggestions, usage tracking, and budget management.
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
-from typing import Literal
+import atexit
+from typing import TYPE_CHECKING, Literal
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query
 
-from ale.llm.client import LLMClient, LLMResponse
 from ale.llm.prompts import (
     DESCRIPTION_PROMPT,
     GUARDRAIL_PROMPT,
     LIBRARY_ENRICHMENT_PROMPT,
     PREVIEW_PROMPT,
 )
-from ale.llm.usage_tracker import UsageTracker
 from web.backend.app.models.api import (
     BudgetResponse,
     BudgetStatusResponse,
@@ -37,14 +35,41 @@ from web.backend.app.models.api import (
     UsageSummaryResponse,
 )
 
+if TYPE_CHECKING:
+    from ale.llm.client import LLMClient, LLMResponse
+    from ale.llm.usage_tracker import UsageTracker
+
 router = APIRouter(prefix="/api/llm", tags=["llm"])
 
 # ---------------------------------------------------------------------------
 # Shared singletons
 # ---------------------------------------------------------------------------
 
-_client = LLMClient()
-_tracker = UsageTracker()
+# Created on first use so importing the router does not build the
+# Anthropic SDK clients or touch ~/.ale.
+_client: LLMClient | None = None
+_tracker: UsageTracker | None = None
+
+
+def _get_client() -> LLMClient:
+    global _client
+    if _client is None:
+        from ale.llm.client import LLMClient
+
+        _client = LLMClient()
+    return _client
+
+
+def _get_tracker() -> UsageTracker:
+    global _tracker
+    if _tracker is None:
+        from ale.llm.usage_tracker import UsageTracker
+
+        # Usage records are appended in batches; every query flushes
+        # first, and the remainder is written at interpreter exit.
+        _tracker = UsageTracker(flush_every=16)
+        atexit.register(_tracker.flush)
+    return _tracker
 
 
 # ---------------------------------------------------------------------------
@@ -54,7 +79,7 @@ _tracker = UsageTracker()
 
 def _require_configured() -> None:
     """Raise 503 if the LLM API key is not set."""
-    if not _client.configured:
+    if not _get_client().configured:
         raise HTTPException(
             status_code=503,
             detail="LLM not configured. Set the ANTHROPIC_API_KEY environment variable.",
@@ -63,7 +88,7 @@ def _require_configured() -> None:
 
 def _require_budget() -> None:
     """Raise 402 if the monthly budget has been exceeded."""
-    status = _tracker.check_budget()
+    status = _get_tracker().check_budget()
     if status.over_limit:
         raise HTTPException(
             status_code=402,
@@ -73,7 +98,7 @@ def _require_budget() -> None:
 
 def _track(response: LLMResponse, purpose: str) -> None:
     """Record an LLM call in the usage tracker."""
-    _tracker.record_usage(
+    _get_tracker().record_usage(
         model=response.model,
         input_tokens=response.input_tokens,
         output_tokens=response.output_tokens,
@@ -82,6 +107,14 @@ def _track(response: LLMResponse, purpose: str) -> None:
     )
 
 
+def _strip_fences(content: str) -> str:
+    """Remove a Markdown code fence (and its info string) around *content*."""
+    if content.startswith("```"):
+        _, newline, rest = content.partition("\n")
+        content = rest if newline else content[3:]
+    return content.removesuffix("```").strip()
+
+
 # ---------------------------------------------------------------------------
 # LLM action endpoints
 # ---------------------------------------------------------------------------
@@ -94,7 +127,7 @@ async def generate_preview(req: LLMPreviewRequest):
     _require_budget()
 
     prompt = PREVIEW_PROMPT.format(yaml_content=req.yaml_content, format=req.format)
-    resp = _client.complete(prompt)
+    resp = _get_client().complete(prompt)
     _track(resp, "preview")
 
     return LLMPreviewResponse(
@@ -111,17 +144,16 @@ async def enrich_library(req: LLMEnrichRequest):
     _require_budget()
 
     prompt = LIBRARY_ENRICHMENT_PROMPT.format(yaml_content=req.yaml_content)
-    resp = _client.complete(prompt)
+    resp = _get_client().complete(prompt)
     _track(resp, "enrich")
 
     # Try to extract a changes summary from the response
     changes: list[str] = []
     enriched = resp.content
     # If the model prepended commentary, try to separate it
-    if "---" in enriched:
-        parts = enriched.split("---", 1)
-        if len(parts) == 2 and len(parts[1].strip()) > len(parts[0].strip()):
-            enriched = "---" + parts[1]
+    head, sep, tail = enriched.partition("---")
+    if sep and len(tail.strip()) > len(head.strip()):
+        enriched = sep + tail
 
     return LLMEnrichResponse(
         enriched_yaml=enriched,
@@ -138,22 +170,20 @@ async def suggest_guardrails(req: LLMSuggestGuardrailsRequest):
     _require_budget()
 
     prompt = GUARDRAIL_PROMPT.format(yaml_content=req.yaml_content)
-    resp = _client.complete(prompt)
+    resp = _get_client().complete(prompt)
     _track(resp, "suggest-guardrails")
 
     # Parse JSON array from LLM response
     guardrails: list[dict] = []
     try:
         content = resp.content.strip()
-        # Strip markdown fences if present
-        if content.startswith("```"):
-            content = content.split("\n", 1)[1] if "\n" in content else content[3:]
-        if content.endswith("```"):
-            content = content[: content.rfind("```")]
-        guardrails = json.loads(content.strip())
+        # Usually bare JSON; only fenced replies need trimming
+        if content[:1] not in ("[", "{"):
+            content = _strip_fences(content)
+        guardrails = orjson.loads(content)
         if not isinstance(guardrails, list):
             guardrails = [guardrails]
-    except (json.JSONDecodeError, ValueError):
+    except orjson.JSONDecodeError:
         guardrails = [{"description": resp.content, "type": "info"}]
 
     return LLMSuggestGuardrailsResponse(
@@ -170,7 +200,7 @@ async def describe_library(req: LLMDescribeRequest):
     _require_budget()
 
     prompt = DESCRIPTION_PROMPT.format(yaml_content=req.yaml_content)
-    resp = _client.complete(prompt)
+    resp = _get_client().complete(prompt)
     _track(resp, "describe")
 
     return LLMDescribeResponse(
@@ -190,9 +220,10 @@ async def get_usage(
     period: Literal["today", "week", "month", "all"] = Query("month"),
 ):
     """Get usage stats for a period."""
-    records = _tracker.get_usage(period=period)
-    tokens = _tracker.get_total_tokens(period=period)
-    total_cost = _tracker.get_total_cost(period=period)
+    tracker = _get_tracker()
+    records = tracker.get_usage(period=period)
+    tokens = tracker.get_total_tokens(period=period)
+    total_cost = tracker.get_total_cost(period=period)
 
     return UsageSummaryResponse(
         total_input_tokens=tokens["input_tokens"],
@@ -219,7 +250,7 @@ async def get_usage_cost(
     period: Literal["today", "week", "month", "all"] = Query("month"),
 ):
     """Get total cost for a period."""
-    total_cost = _tracker.get_total_cost(period=period)
+    total_cost = _get_tracker().get_total_cost(period=period)
     return {"total_cost": round(total_cost, 6)}
 
 
@@ -231,7 +262,7 @@ async def get_usage_cost(
 @router.get("/budget", response_model=BudgetResponse)
 async def get_budget():
     """Get current budget settings."""
-    budget = _tracker.get_budget()
+    budget = _get_tracker().get_budget()
     if budget is None:
         return BudgetResponse()
     return BudgetResponse(
@@ -244,7 +275,7 @@ async def get_budget():
 @router.put("/budget", response_model=BudgetResponse)
 async def set_budget(req: BudgetUpdateRequest):
     """Set budget configuration."""
-    budget = _tracker.set_budget(
+    budget = _get_tracker().set_budget(
         monthly_limit=req.monthly_limit,
         alert_threshold_pct=req.alert_threshold_pct,
     )
@@ -258,7 +289,7 @@ async def set_budget(req: BudgetUpdateRequest):
 @router.get("/budget/status", response_model=BudgetStatusResponse)
 async def get_budget_status():
     """Check if budget allows more usage."""
-    status = _tracker.check_budget()
+    status = _get_tracker().check_budget()
     return BudgetStatusResponse(
         allowed=status.allowed,
         remaining=status.remaining,
@@ -276,14 +307,15 @@ async def get_budget_status():
 @router.get("/status", response_model=LLMStatusResponse)
 async def get_status():
     """Check if LLM is configured."""
-    if _client.configured:
+    client = _get_client()
+    if client.configured:
         return LLMStatusResponse(
             configured=True,
-            model=_client.model,
+            model=client.model,
             message="LLM is configured and ready.",
         )
     return LLMStatusResponse(
         configured=False,
-        model=_client.model,
+        model=client.model,
         message="LLM not configured. Set ANTHROPIC_API_KEY environment variable.",
     )
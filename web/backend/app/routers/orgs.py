@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
-import re
+import functools
+import heapq
+import time
 import uuid
-from datetime import datetime
-from typing import Optional
+from datetime import UTC, datetime
+from operator import attrgetter
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 
 from ale.auth.models import User
-from ale.auth.store import UserStore
-from ale.orgs.models import OrgRole, Organization
+from ale.orgs.models import OrgMember, OrgRole, Organization, Repository, ScanStatus
 from ale.orgs.org_store import OrgStore
-from web.backend.app.middleware.auth import get_current_user, get_optional_user, get_store
+from web.backend.app.middleware.auth import get_current_user, get_store
 from web.backend.app.models.api import (
     AddMemberRequest,
     AddRepoRequest,
@@ -25,22 +26,25 @@ from web.backend.app.models.api import (
     RoleUpdateRequest,
     UpdateOrgRequest,
 )
+from web.backend.app.responses import ORJSONResponse
 
-router = APIRouter(prefix="/api/orgs", tags=["organizations"])
+router = APIRouter(
+    prefix="/api/orgs",
+    tags=["organizations"],
+    default_response_class=ORJSONResponse,
+)
+
+_VALID_ROLES: frozenset[str] = frozenset(r.value for r in OrgRole)
+_BY_LAST_SCANNED = attrgetter("last_scanned")
 
 # ---------------------------------------------------------------------------
 # Shared store instance
 # ---------------------------------------------------------------------------
 
-_org_store: Optional[OrgStore] = None
-
-
+@functools.lru_cache(maxsize=1)
 def _get_org_store() -> OrgStore:
-    """Return the singleton OrgStore instance."""
-    global _org_store
-    if _org_store is None:
-        _org_store = OrgStore()
-    return _org_store
+    """Return the singleton OrgStore instance (injected via ``Depends``)."""
+    return OrgStore()
 
 
 # ---------------------------------------------------------------------------
@@ -48,19 +52,47 @@ def _get_org_store() -> OrgStore:
 # ---------------------------------------------------------------------------
 
 
+# ASCII letters/digits pass through, separators become spaces (then ``-``),
+# and all other ASCII characters are deleted.
+_ASCII_SLUG_TABLE = {
+    i: c if c.isalnum() else " " if c.isspace() or c in "_-" else None
+    for i, c in enumerate(map(chr, range(128)))
+}
+
+
 def _slugify(name: str) -> str:
-    """Create a URL-friendly slug from an organization name."""
-    slug = name.lower().strip()
-    slug = re.sub(r"[^\w\s-]", "", slug)
-    slug = re.sub(r"[\s_]+", "-", slug)
-    slug = re.sub(r"-+", "-", slug)
-    return slug.strip("-")
+    """Create a URL-friendly slug from an organization name.
+
+    Punctuation is dropped and each run of whitespace, underscores and
+    hyphens becomes a single ``-`` (none at either end).  ASCII names go
+    through a translate table; anything else takes the character loop.
+    """
+    if name.isascii():
+        return "-".join(name.lower().translate(_ASCII_SLUG_TABLE).split())
+    out: list[str] = []
+    pending_dash = False
+    for ch in name.lower():
+        if ch.isalnum():
+            if pending_dash and out:
+                out.append("-")
+            out.append(ch)
+            pending_dash = False
+        elif ch.isspace() or ch == "_" or ch == "-":
+            pending_dash = True
+    return "".join(out)
 
 
 def _org_response(org: Organization, store: OrgStore) -> OrganizationResponse:
     """Convert a domain Organization to the Pydantic response model."""
-    members = store.list_members(org.id)
-    repos = store.list_repos(org.id)
+    return _org_response_from_counts(
+        org, len(store.list_members(org.id)), len(store.list_repos(org.id))
+    )
+
+
+def _org_response_from_counts(
+    org: Organization, member_count: int, repo_count: int,
+) -> OrganizationResponse:
+    """Build an OrganizationResponse from already-known counts."""
     return OrganizationResponse(
         id=org.id,
         name=org.name,
@@ -68,12 +100,12 @@ def _org_response(org: Organization, store: OrgStore) -> OrganizationResponse:
         description=org.description,
         owner_id=org.owner_id,
         created_at=org.created_at,
-        member_count=len(members),
-        repo_count=len(repos),
+        member_count=member_count,
+        repo_count=repo_count,
     )
 
 
-def _repo_response(repo) -> RepoResponse:
+def _repo_response(repo: Repository) -> RepoResponse:
     """Convert a domain Repository to the Pydantic response model."""
     return RepoResponse(
         id=repo.id,
@@ -83,18 +115,17 @@ def _repo_response(repo) -> RepoResponse:
         default_branch=repo.default_branch,
         added_at=repo.added_at,
         last_scanned=repo.last_scanned,
-        scan_status=repo.scan_status.value if hasattr(repo.scan_status, "value") else repo.scan_status,
+        scan_status=repo.scan_status.value,
     )
 
 
-def _member_response(member, user_store: UserStore) -> OrgMemberResponse:
-    """Convert a domain OrgMember to the Pydantic response model."""
-    user = user_store.get_user(member.user_id)
+def _member_response(member: OrgMember, user: User | None) -> OrgMemberResponse:
+    """Convert a domain OrgMember (and its user, if known) to the response model."""
     return OrgMemberResponse(
         user_id=member.user_id,
         username=user.username if user else "",
         email=user.email if user else "",
-        role=member.role.value if hasattr(member.role, "value") else member.role,
+        role=member.role.value,
         joined_at=member.joined_at,
     )
 
@@ -109,16 +140,6 @@ def _require_org_admin(org_id: str, user_id: str, store: OrgStore) -> None:
         )
 
 
-def _require_org_member(org_id: str, user_id: str, store: OrgStore) -> None:
-    """Raise 403 if the user is not a member of the given org."""
-    member = store.get_member(org_id, user_id)
-    if member is None:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Organization membership required",
-        )
-
-
 def _get_org_or_404(slug: str, store: OrgStore) -> Organization:
     """Look up an org by slug or raise 404."""
     org = store.get_org_by_slug(slug)
@@ -130,6 +151,56 @@ def _get_org_or_404(slug: str, store: OrgStore) -> Organization:
     return org
 
 
+def _resolve_org(
+    slug: str, user_id: str, store: OrgStore, *, require_admin: bool = False,
+) -> tuple[Organization, OrgMember]:
+    """Look up an org by slug and the caller's membership in one store call.
+
+    Raises 404 if the org does not exist and 403 if the user is not a
+    member (or not an admin, when *require_admin* is set).
+    """
+    org, member = store.get_org_and_member(slug, user_id)
+    if org is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Organization '{slug}' not found",
+        )
+    if require_admin:
+        if member is None or member.role != OrgRole.admin:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Organization admin access required",
+            )
+    elif member is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Organization membership required",
+        )
+    return org, member
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_second(sec: int) -> str:
+    """Naive UTC ISO-8601 timestamp for *sec*, formatted once per second.
+
+    Naive like the ``datetime.utcnow().isoformat()`` values already stored
+    in ``last_scanned``, so old and new scans compare and sort together.
+    """
+    return datetime.fromtimestamp(sec, UTC).replace(tzinfo=None).isoformat()
+
+
+def _finalize_scan(store: OrgStore, repo_id: str, last_scanned: str) -> None:
+    """Background task: mark a repository scan as complete.
+
+    The store updates under its lock, and only while the repository still
+    exists and is scanning, so a late finalize cannot resurrect a removed
+    repo or overwrite a newer status.
+    """
+    store.update_repo_status(
+        repo_id, "complete", last_scanned=last_scanned, expected_status="scanning"
+    )
+
+
 # ---------------------------------------------------------------------------
 # Organization CRUD
 # ---------------------------------------------------------------------------
@@ -140,12 +211,12 @@ def _get_org_or_404(slug: str, store: OrgStore) -> Organization:
     response_model=OrganizationResponse,
     summary="Create a new organization",
 )
-async def create_org(
+def create_org(
     body: CreateOrgRequest,
     user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
 ):
     """Create a new organization. The authenticated user becomes the owner and admin."""
-    store = _get_org_store()
 
     slug = _slugify(body.name)
     if not slug:
@@ -182,19 +253,15 @@ async def create_org(
     response_model=list[OrganizationResponse],
     summary="List user's organizations",
 )
-async def list_orgs(user: User = Depends(get_current_user)):
+def list_orgs(
+    user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
+):
     """List all organizations the authenticated user is a member of."""
-    store = _get_org_store()
-    all_orgs = store.list_orgs()
-
-    # Filter to orgs the user is a member of
-    user_orgs = []
-    for org in all_orgs:
-        member = store.get_member(org.id, user.id)
-        if member is not None:
-            user_orgs.append(_org_response(org, store))
-
-    return user_orgs
+    return [
+        _org_response_from_counts(org, member_count, repo_count)
+        for org, member_count, repo_count in store.list_orgs_with_counts_for_user(user.id)
+    ]
 
 
 @router.get(
@@ -202,11 +269,13 @@ async def list_orgs(user: User = Depends(get_current_user)):
     response_model=OrganizationResponse,
     summary="Get organization by slug",
 )
-async def get_org(slug: str, user: User = Depends(get_current_user)):
+def get_org(
+    slug: str,
+    user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
+):
     """Get an organization's details by its slug."""
-    store = _get_org_store()
-    org = _get_org_or_404(slug, store)
-    _require_org_member(org.id, user.id, store)
+    org, _ = _resolve_org(slug, user.id, store)
     return _org_response(org, store)
 
 
@@ -215,15 +284,14 @@ async def get_org(slug: str, user: User = Depends(get_current_user)):
     response_model=OrganizationResponse,
     summary="Update organization",
 )
-async def update_org(
+def update_org(
     slug: str,
     body: UpdateOrgRequest,
     user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
 ):
     """Update an organization. Requires admin role."""
-    store = _get_org_store()
-    org = _get_org_or_404(slug, store)
-    _require_org_admin(org.id, user.id, store)
+    org, _ = _resolve_org(slug, user.id, store, require_admin=True)
 
     kwargs = {}
     if body.name:
@@ -247,9 +315,12 @@ async def update_org(
     "/{slug}",
     summary="Delete organization (owner only)",
 )
-async def delete_org(slug: str, user: User = Depends(get_current_user)):
+def delete_org(
+    slug: str,
+    user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
+):
     """Delete an organization. Only the owner can delete it."""
-    store = _get_org_store()
     org = _get_org_or_404(slug, store)
 
     if org.owner_id != user.id:
@@ -278,15 +349,18 @@ async def delete_org(slug: str, user: User = Depends(get_current_user)):
     response_model=list[OrgMemberResponse],
     summary="List organization members",
 )
-async def list_members(slug: str, user: User = Depends(get_current_user)):
+def list_members(
+    slug: str,
+    user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
+):
     """List all members of an organization."""
-    store = _get_org_store()
     user_store = get_store()
-    org = _get_org_or_404(slug, store)
-    _require_org_member(org.id, user.id, store)
+    org, _ = _resolve_org(slug, user.id, store)
 
     members = store.list_members(org.id)
-    return [_member_response(m, user_store) for m in members]
+    users = user_store.get_users(m.user_id for m in members)
+    return [_member_response(m, users.get(m.user_id)) for m in members]
 
 
 @router.post(
@@ -294,16 +368,15 @@ async def list_members(slug: str, user: User = Depends(get_current_user)):
     response_model=OrgMemberResponse,
     summary="Add a member to the organization",
 )
-async def add_member(
+def add_member(
     slug: str,
     body: AddMemberRequest,
     user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
 ):
     """Add a member to the organization. Requires admin role."""
-    store = _get_org_store()
     user_store = get_store()
-    org = _get_org_or_404(slug, store)
-    _require_org_admin(org.id, user.id, store)
+    org, _ = _resolve_org(slug, user.id, store, require_admin=True)
 
     # Verify the target user exists
     target_user = user_store.get_user(body.user_id)
@@ -314,20 +387,20 @@ async def add_member(
         )
 
     member = store.add_member(org.id, body.user_id, body.role)
-    return _member_response(member, user_store)
+    return _member_response(member, target_user)
 
 
 @router.delete(
     "/{slug}/members/{user_id}",
     summary="Remove a member from the organization",
 )
-async def remove_member(
+def remove_member(
     slug: str,
     user_id: str,
     user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
 ):
     """Remove a member from the organization. Requires admin role (or self-remove)."""
-    store = _get_org_store()
     org = _get_org_or_404(slug, store)
 
     # Allow self-removal or admin removal
@@ -356,24 +429,22 @@ async def remove_member(
     response_model=OrgMemberResponse,
     summary="Update a member's role",
 )
-async def update_member_role(
+def update_member_role(
     slug: str,
     user_id: str,
     body: RoleUpdateRequest,
     user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
 ):
     """Update a member's role within the organization. Requires admin role."""
-    store = _get_org_store()
     user_store = get_store()
-    org = _get_org_or_404(slug, store)
-    _require_org_admin(org.id, user.id, store)
+    org, _ = _resolve_org(slug, user.id, store, require_admin=True)
 
     # Validate role
-    valid_roles = [r.value for r in OrgRole]
-    if body.role not in valid_roles:
+    if body.role not in _VALID_ROLES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid role: {body.role}. Valid roles: {valid_roles}",
+            detail=f"Invalid role: {body.role}. Valid roles: {sorted(_VALID_ROLES)}",
         )
 
     updated = store.update_member_role(org.id, user_id, body.role)
@@ -383,7 +454,7 @@ async def update_member_role(
             detail="Member not found",
         )
 
-    return _member_response(updated, user_store)
+    return _member_response(updated, user_store.get_user(user_id))
 
 
 # ---------------------------------------------------------------------------
@@ -396,15 +467,14 @@ async def update_member_role(
     response_model=RepoResponse,
     summary="Add a repository to the organization",
 )
-async def add_repo(
+def add_repo(
     slug: str,
     body: AddRepoRequest,
     user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
 ):
     """Add a repository to the organization. Requires admin or member role."""
-    store = _get_org_store()
-    org = _get_org_or_404(slug, store)
-    _require_org_member(org.id, user.id, store)
+    org, _ = _resolve_org(slug, user.id, store)
 
     repo = store.add_repo(org.id, body.name, body.url, body.default_branch)
     return _repo_response(repo)
@@ -415,11 +485,13 @@ async def add_repo(
     response_model=list[RepoResponse],
     summary="List organization repositories",
 )
-async def list_repos(slug: str, user: User = Depends(get_current_user)):
+def list_repos(
+    slug: str,
+    user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
+):
     """List all repositories for an organization."""
-    store = _get_org_store()
-    org = _get_org_or_404(slug, store)
-    _require_org_member(org.id, user.id, store)
+    org, _ = _resolve_org(slug, user.id, store)
 
     repos = store.list_repos(org.id)
     return [_repo_response(r) for r in repos]
@@ -429,15 +501,14 @@ async def list_repos(slug: str, user: User = Depends(get_current_user)):
     "/{slug}/repos/{repo_id}",
     summary="Remove a repository from the organization",
 )
-async def remove_repo(
+def remove_repo(
     slug: str,
     repo_id: str,
     user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
 ):
     """Remove a repository. Requires admin role."""
-    store = _get_org_store()
-    org = _get_org_or_404(slug, store)
-    _require_org_admin(org.id, user.id, store)
+    org, _ = _resolve_org(slug, user.id, store, require_admin=True)
 
     # Verify repo belongs to this org
     repo = store.get_repo(repo_id)
@@ -461,19 +532,19 @@ async def remove_repo(
     "/{slug}/repos/{repo_id}/scan",
     summary="Trigger a repository scan",
 )
-async def scan_repo(
+def scan_repo(
     slug: str,
     repo_id: str,
+    background: BackgroundTasks,
     user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
 ):
     """Trigger a scan on a repository. Sets status to 'scanning'.
 
-    In a real implementation this would kick off an async job.
-    For now, we simulate by updating the status to 'scanning' and then to 'complete'.
+    The scan itself runs as a background task after the response is sent;
+    for now it simply marks the repository 'complete'.
     """
-    store = _get_org_store()
-    org = _get_org_or_404(slug, store)
-    _require_org_member(org.id, user.id, store)
+    org, _ = _resolve_org(slug, user.id, store)
 
     # Verify repo belongs to this org
     repo = store.get_repo(repo_id)
@@ -483,19 +554,16 @@ async def scan_repo(
             detail="Repository not found in this organization",
         )
 
-    now = datetime.utcnow().isoformat()
-
-    # In a real system, this would enqueue a background task.
-    # We simulate by immediately marking it as complete.
-    store.update_repo_status(repo_id, "scanning", last_scanned=now)
-    updated = store.update_repo_status(repo_id, "complete", last_scanned=now)
+    now = _iso_second(int(time.time()))
 
+    updated = store.update_repo_status(repo_id, "scanning", last_scanned=now)
     if updated is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update scan status",
         )
 
+    background.add_task(_finalize_scan, store, repo_id, now)
     return _repo_response(updated)
 
 
@@ -509,29 +577,33 @@ async def scan_repo(
     response_model=OrgDashboardResponse,
     summary="Get organization dashboard stats",
 )
-async def org_dashboard(slug: str, user: User = Depends(get_current_user)):
+def org_dashboard(
+    slug: str,
+    user: User = Depends(get_current_user),
+    store: OrgStore = Depends(_get_org_store),
+):
     """Get aggregated dashboard statistics for the organization."""
-    store = _get_org_store()
-    org = _get_org_or_404(slug, store)
-    _require_org_member(org.id, user.id, store)
+    org, _ = _resolve_org(slug, user.id, store)
 
     members = store.list_members(org.id)
     repos = store.list_repos(org.id)
 
-    # Recent scans: repos sorted by last_scanned descending, limit 5
-    scanned_repos = sorted(
-        [r for r in repos if r.last_scanned],
-        key=lambda r: r.last_scanned,
-        reverse=True,
-    )[:5]
-
     # Count libraries: for now, we use repo count as a proxy.
     # In a full implementation, this would query the registry for libraries
     # belonging to this org.
-    total_libraries = len([r for r in repos if r.scan_status.value == "complete"])
+    total_libraries = 0
+    scanned = []
+    for r in repos:
+        if r.scan_status == ScanStatus.complete:
+            total_libraries += 1
+        if r.last_scanned:
+            scanned.append(r)
+
+    # Recent scans: the 5 most recently scanned repos, newest first
+    scanned_repos = heapq.nlargest(5, scanned, key=_BY_LAST_SCANNED)
 
     return OrgDashboardResponse(
-        org=_org_response(org, store),
+        org=_org_response_from_counts(org, len(members), len(repos)),
         total_libraries=total_libraries,
         total_members=len(members),
         total_repos=len(repos),
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import functools
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from ale.policies.approval_store import ApprovalStore
 from ale.policies.policy_store import PolicyStore
@@ -16,33 +16,31 @@ from web.backend.app.models.api import (
     EvaluatePolicyRequest,
     PolicyEvaluationResponse,
     PolicyResponse,
+    PolicyRuleRequest,
     TogglePolicyRequest,
     UpdatePolicyRequest,
 )
+from web.backend.app.responses import ORJSONResponse
 
-router = APIRouter(prefix="/api", tags=["policies"])
+router = APIRouter(
+    prefix="/api",
+    tags=["policies"],
+    default_response_class=ORJSONResponse,
+)
 
 
 # ---------------------------------------------------------------------------
 # Store singletons
 # ---------------------------------------------------------------------------
 
-_policy_store: PolicyStore | None = None
-_approval_store: ApprovalStore | None = None
-
-
+@functools.lru_cache(maxsize=1)
 def _get_policy_store() -> PolicyStore:
-    global _policy_store
-    if _policy_store is None:
-        _policy_store = PolicyStore()
-    return _policy_store
+    return PolicyStore()
 
 
+@functools.lru_cache(maxsize=1)
 def _get_approval_store() -> ApprovalStore:
-    global _approval_store
-    if _approval_store is None:
-        _approval_store = ApprovalStore()
-    return _approval_store
+    return ApprovalStore()
 
 
 # ---------------------------------------------------------------------------
@@ -50,14 +48,41 @@ def _get_approval_store() -> ApprovalStore:
 # ---------------------------------------------------------------------------
 
 
+# Built responses, reused while a row is unchanged.  Policies are keyed on
+# (id, updated_at), which every edit bumps; approval requests on
+# (id, status, decided_at), which change together on a decision.  Each dict
+# is cleared outright once it reaches _RESPONSE_CACHE_MAX entries.
+_RESPONSE_CACHE_MAX = 1024
+_POLICY_RESPONSES: dict[tuple[str, str], PolicyResponse] = {}
+_APPROVAL_RESPONSES: dict[tuple[str, str, str], ApprovalRequestResponse] = {}
+
+
 def _policy_response(p: dict) -> PolicyResponse:
     """Convert a policy dict to a PolicyResponse."""
-    return PolicyResponse(
+    key = (p["id"], p.get("updated_at", ""))
+    resp = _POLICY_RESPONSES.get(key)
+    if resp is None:
+        if len(_POLICY_RESPONSES) >= _RESPONSE_CACHE_MAX:
+            _POLICY_RESPONSES.clear()
+        resp = _POLICY_RESPONSES[key] = _build_policy_response(p)
+    return resp
+
+
+def _evict_policy_responses(policy_id: str) -> None:
+    """Drop cached responses for a policy that was just changed or deleted."""
+    for key in [k for k in _POLICY_RESPONSES if k[0] == policy_id]:
+        _POLICY_RESPONSES.pop(key, None)
+
+
+def _build_policy_response(p: dict) -> PolicyResponse:
+    # Stored policies were written from validated request models, so the
+    # response is assembled without re-validating every field.
+    return PolicyResponse.model_construct(
         id=p["id"],
         name=p["name"],
         description=p.get("description", ""),
         version=p.get("version", "1.0.0"),
-        rules=p.get("rules", []),
+        rules=[PolicyRuleRequest.model_construct(**r) for r in p.get("rules", [])],
         created_at=p.get("created_at", ""),
         updated_at=p.get("updated_at", ""),
         enabled=p.get("enabled", True),
@@ -66,7 +91,17 @@ def _policy_response(p: dict) -> PolicyResponse:
 
 def _approval_response(r: dict) -> ApprovalRequestResponse:
     """Convert an approval request dict to an ApprovalRequestResponse."""
-    return ApprovalRequestResponse(
+    key = (r["id"], r.get("status", "pending"), r.get("decided_at", ""))
+    resp = _APPROVAL_RESPONSES.get(key)
+    if resp is None:
+        if len(_APPROVAL_RESPONSES) >= _RESPONSE_CACHE_MAX:
+            _APPROVAL_RESPONSES.clear()
+        resp = _APPROVAL_RESPONSES[key] = _build_approval_response(r)
+    return resp
+
+
+def _build_approval_response(r: dict) -> ApprovalRequestResponse:
+    return ApprovalRequestResponse.model_construct(
         id=r["id"],
         library_name=r["library_name"],
         library_version=r["library_version"],
@@ -92,11 +127,13 @@ def _approval_response(r: dict) -> ApprovalRequestResponse:
     summary="Create a new policy",
     status_code=status.HTTP_201_CREATED,
 )
-async def create_policy(body: CreatePolicyRequest):
+def create_policy(
+    body: CreatePolicyRequest,
+    store: PolicyStore = Depends(_get_policy_store),
+):
     """Create a new policy with the given name, description, and rules."""
-    store = _get_policy_store()
     # Convert rule models to dicts for storage
-    rules = [r.model_dump() for r in body.rules] if body.rules else []
+    rules = body.model_dump(include={"rules"})["rules"]
     policy = store.create_policy(
         name=body.name,
         description=body.description,
@@ -110,9 +147,8 @@ async def create_policy(body: CreatePolicyRequest):
     response_model=list[PolicyResponse],
     summary="List all policies",
 )
-async def list_policies():
+def list_policies(store: PolicyStore = Depends(_get_policy_store)):
     """Return all configured policies."""
-    store = _get_policy_store()
     return [_policy_response(p) for p in store.list_policies()]
 
 
@@ -121,9 +157,11 @@ async def list_policies():
     response_model=PolicyResponse,
     summary="Get a specific policy",
 )
-async def get_policy(policy_id: str):
+def get_policy(
+    policy_id: str,
+    store: PolicyStore = Depends(_get_policy_store),
+):
     """Return a single policy by ID."""
-    store = _get_policy_store()
     policy = store.get_policy(policy_id)
     if policy is None:
         raise HTTPException(
@@ -138,18 +176,22 @@ async def get_policy(policy_id: str):
     response_model=PolicyResponse,
     summary="Update a policy",
 )
-async def update_policy(policy_id: str, body: UpdatePolicyRequest):
+def update_policy(
+    policy_id: str,
+    body: UpdatePolicyRequest,
+    store: PolicyStore = Depends(_get_policy_store),
+):
     """Update an existing policy's name, description, or rules."""
-    store = _get_policy_store()
     kwargs: dict = {}
     if body.name:
         kwargs["name"] = body.name
     if body.description:
         kwargs["description"] = body.description
     if body.rules is not None:
-        kwargs["rules"] = [r.model_dump() for r in body.rules]
+        kwargs["rules"] = body.model_dump(include={"rules"})["rules"]
 
     updated = store.update_policy(policy_id, **kwargs)
+    _evict_policy_responses(policy_id)
     if updated is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -162,10 +204,13 @@ async def update_policy(policy_id: str, body: UpdatePolicyRequest):
     "/policies/{policy_id}",
     summary="Delete a policy",
 )
-async def delete_policy(policy_id: str):
+def delete_policy(
+    policy_id: str,
+    store: PolicyStore = Depends(_get_policy_store),
+):
     """Delete a policy by ID."""
-    store = _get_policy_store()
     deleted = store.delete_policy(policy_id)
+    _evict_policy_responses(policy_id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -179,10 +224,14 @@ async def delete_policy(policy_id: str):
     response_model=PolicyResponse,
     summary="Enable or disable a policy",
 )
-async def toggle_policy(policy_id: str, body: TogglePolicyRequest):
+def toggle_policy(
+    policy_id: str,
+    body: TogglePolicyRequest,
+    store: PolicyStore = Depends(_get_policy_store),
+):
     """Toggle a policy's enabled state."""
-    store = _get_policy_store()
     updated = store.toggle_policy(policy_id, body.enabled)
+    _evict_policy_responses(policy_id)
     if updated is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -196,9 +245,11 @@ async def toggle_policy(policy_id: str, body: TogglePolicyRequest):
     response_model=PolicyEvaluationResponse,
     summary="Evaluate policies for a library application",
 )
-async def evaluate_policies(body: EvaluatePolicyRequest):
+def evaluate_policies(
+    body: EvaluatePolicyRequest,
+    store: PolicyStore = Depends(_get_policy_store),
+):
     """Evaluate all enabled policies against the given context."""
-    store = _get_policy_store()
     result = store.evaluate_policies(
         library_name=body.library_name,
         library_version=body.library_version,
@@ -213,9 +264,11 @@ async def evaluate_policies(body: EvaluatePolicyRequest):
     response_model=PolicyEvaluationResponse,
     summary="Test policies against mock context (dry run)",
 )
-async def test_policies(body: EvaluatePolicyRequest):
+def test_policies(
+    body: EvaluatePolicyRequest,
+    store: PolicyStore = Depends(_get_policy_store),
+):
     """Dry-run evaluation of policies -- same as evaluate but semantically a test."""
-    store = _get_policy_store()
     result = store.evaluate_policies(
         library_name=body.library_name,
         library_version=body.library_version,
@@ -234,9 +287,8 @@ async def test_policies(body: EvaluatePolicyRequest):
     "/approvals/pending/count",
     summary="Get count of pending approvals",
 )
-async def get_pending_count():
+def get_pending_count(store: ApprovalStore = Depends(_get_approval_store)):
     """Return the number of pending approval requests."""
-    store = _get_approval_store()
     return {"count": store.get_pending_count()}
 
 
@@ -246,9 +298,11 @@ async def get_pending_count():
     summary="Create an approval request",
     status_code=status.HTTP_201_CREATED,
 )
-async def create_approval(body: CreateApprovalRequest):
+def create_approval(
+    body: CreateApprovalRequest,
+    store: ApprovalStore = Depends(_get_approval_store),
+):
     """Create a new approval request for a library application."""
-    store = _get_approval_store()
     req = store.create_request(
         library_name=body.library_name,
         library_version=body.library_version,
@@ -264,9 +318,11 @@ async def create_approval(body: CreateApprovalRequest):
     response_model=list[ApprovalRequestResponse],
     summary="List approval requests",
 )
-async def list_approvals(status_filter: Optional[str] = None):
+def list_approvals(
+    status_filter: str | None = None,
+    store: ApprovalStore = Depends(_get_approval_store),
+):
     """Return all approval requests, optionally filtered by status."""
-    store = _get_approval_store()
     return [_approval_response(r) for r in store.list_requests(status=status_filter)]
 
 
@@ -275,9 +331,11 @@ async def list_approvals(status_filter: Optional[str] = None):
     response_model=ApprovalRequestResponse,
     summary="Get an approval request",
 )
-async def get_approval(request_id: str):
+def get_approval(
+    request_id: str,
+    store: ApprovalStore = Depends(_get_approval_store),
+):
     """Return a single approval request by ID."""
-    store = _get_approval_store()
     req = store.get_request(request_id)
     if req is None:
         raise HTTPException(
@@ -292,9 +350,12 @@ async def get_approval(request_id: str):
     response_model=ApprovalRequestResponse,
     summary="Approve an approval request",
 )
-async def approve_request(request_id: str, body: ApprovalDecisionRequest):
+def approve_request(
+    request_id: str,
+    body: ApprovalDecisionRequest,
+    store: ApprovalStore = Depends(_get_approval_store),
+):
     """Approve a pending approval request."""
-    store = _get_approval_store()
     req = store.approve(
         request_id=request_id,
         approver_id="current-user",  # Would come from auth in production
@@ -313,9 +374,12 @@ async def approve_request(request_id: str, body: ApprovalDecisionRequest):
     response_model=ApprovalRequestResponse,
     summary="Reject an approval request",
 )
-async def reject_request(request_id: str, body: ApprovalDecisionRequest):
+def reject_request(
+    request_id: str,
+    body: ApprovalDecisionRequest,
+    store: ApprovalStore = Depends(_get_approval_store),
+):
     """Reject a pending approval request."""
-    store = _get_approval_store()
     req = store.reject(
         request_id=request_id,
         approver_id="current-user",  # Would come from auth in production
@@ -2,25 +2,31 @@
 
 from __future__ import annotations
 
+import functools
 import os
-import tempfile
 from pathlib import Path
 from typing import Optional
 
+import orjson
+import yaml
 from fastapi import APIRouter, HTTPException, Query, UploadFile, File
+from fastapi.responses import StreamingResponse
 
-from ale.registry.local_registry import LocalRegistry
-from ale.registry.models import SearchQuery
+from ale.registry.local_registry import LocalRegistry, _dict_to_entry
+from ale.registry.models import SearchQuery, SearchResult
 
 from web.backend.app.models.api import (
     LibraryEntryResponse,
-    QualitySignalsResponse,
     SearchQueryRequest,
     SearchResultResponse,
-    VerificationResultResponse,
 )
+from web.backend.app.responses import ORJSONResponse
 
-router = APIRouter(prefix="/api/registry", tags=["registry"])
+router = APIRouter(
+    prefix="/api/registry",
+    tags=["registry"],
+    default_response_class=ORJSONResponse,
+)
 
 # Configurable registry directory; default to project-level .ale_registry
 REGISTRY_DIR = os.environ.get(
@@ -28,46 +34,71 @@ REGISTRY_DIR = os.environ.get(
 )
 
 
-def _get_registry() -> LocalRegistry:
-    """Return a LocalRegistry instance for the configured directory."""
+def _index_key() -> tuple[int, int]:
+    """(mtime_ns, size) of the registry index; (0, 0) while it doesn't exist."""
+    try:
+        st = os.stat(Path(REGISTRY_DIR) / LocalRegistry.INDEX_FILE)
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _registry_for(index_key: tuple[int, int]) -> LocalRegistry:
     return LocalRegistry(REGISTRY_DIR)
 
 
-def _entry_to_response(entry) -> LibraryEntryResponse:
-    """Convert a RegistryEntry dataclass to a Pydantic response model."""
-    v = entry.quality.verification
-    return LibraryEntryResponse(
-        name=entry.name,
-        library_id=entry.library_id,
-        version=entry.version,
-        spec_version=entry.spec_version,
-        description=entry.description,
-        tags=entry.tags,
-        capabilities=entry.capabilities,
-        complexity=entry.complexity,
-        language_agnostic=entry.language_agnostic,
-        target_languages=entry.target_languages,
-        quality=QualitySignalsResponse(
-            verification=VerificationResultResponse(
-                schema_passed=v.schema_passed,
-                validator_passed=v.validator_passed,
-                hooks_runnable=v.hooks_runnable,
-                verified_at=v.verified_at,
-                verified_by=v.verified_by,
-            ),
-            rating=entry.quality.rating,
-            rating_count=entry.quality.rating_count,
-            download_count=entry.quality.download_count,
-            maintained=entry.quality.maintained,
-            maintainer=entry.quality.maintainer,
-            last_updated=entry.quality.last_updated,
-        ),
-        source_repo=entry.source_repo,
-        library_path=entry.library_path,
-        compatibility_targets=entry.compatibility_targets,
-        qualified_id=entry.qualified_id,
-        is_verified=entry.is_verified,
+def _get_registry() -> LocalRegistry:
+    """Return a LocalRegistry for the configured directory.
+
+    The instance (and its parsed index) is shared until the index file
+    changes, so it must be treated as read-only; publishing goes through
+    a fresh ``LocalRegistry``.
+    """
+    return _registry_for(_index_key())
+
+
+@functools.lru_cache(maxsize=256)
+def _search(
+    index_key: tuple[int, int],
+    text: str,
+    tags: tuple[str, ...],
+    capabilities: tuple[str, ...],
+    verified_only: bool,
+    min_rating: float,
+) -> SearchResult:
+    """Run a registry search, memoized per index version and filter set."""
+    query = SearchQuery(
+        text=text,
+        tags=list(tags),
+        capabilities=list(capabilities),
+        verified_only=verified_only,
+        min_rating=min_rating,
     )
+    return _registry_for(index_key).search(query)
+
+
+def _csv(value: str | None) -> tuple[str, ...]:
+    """Split a comma-separated query parameter, dropping blank items."""
+    if not value:
+        return ()
+    return tuple(filter(None, map(str.strip, value.split(","))))
+
+
+def _entry_to_response(entry) -> LibraryEntryResponse:
+    """Convert a RegistryEntry dataclass to a Pydantic response model.
+
+    The response models read attributes directly (``from_attributes``), so
+    pydantic-core copies every field, including the nested quality signals
+    and the ``qualified_id``/``is_verified`` properties, in one call.
+    """
+    return LibraryEntryResponse.model_validate(entry)
+
+
+@functools.lru_cache(maxsize=1)
+def _library_responses(index_key: tuple[int, int]) -> list[LibraryEntryResponse]:
+    """Response models for every entry, rebuilt only when the index changes."""
+    return [_entry_to_response(e) for e in _registry_for(index_key).list_all()]
 
 
 @router.get(
@@ -75,11 +106,30 @@ def _entry_to_response(entry) -> LibraryEntryResponse:
     response_model=list[LibraryEntryResponse],
     summary="List all libraries",
 )
-async def list_libraries():
+def list_libraries():
     """List every library in the registry."""
-    reg = _get_registry()
-    entries = reg.list_all()
-    return [_entry_to_response(e) for e in entries]
+    return _library_responses(_index_key())
+
+
+@router.get(
+    "/stream",
+    summary="Stream all libraries as NDJSON",
+)
+def stream_libraries():
+    """Stream every library as ``application/x-ndjson``.
+
+    Same documents as ``GET /api/registry``, one JSON object per line.
+    Each entry is converted as it is sent, so large registries never hold
+    the whole response in memory.
+    """
+    records = list(_get_registry()._index.values())
+
+    def lines():
+        for data in records:
+            resp = _entry_to_response(_dict_to_entry(data))
+            yield orjson.dumps(resp.model_dump()) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -87,7 +137,7 @@ async def list_libraries():
     response_model=SearchResultResponse,
     summary="Search libraries",
 )
-async def search_libraries(
+def search_libraries(
     text: Optional[str] = Query(None, description="Free-text search"),
     tags: Optional[str] = Query(None, description="Comma-separated tags"),
     capabilities: Optional[str] = Query(
@@ -97,17 +147,15 @@ async def search_libraries(
     min_rating: float = Query(0.0, description="Minimum quality rating"),
 ):
     """Search the registry with optional filters."""
-    reg = _get_registry()
-    query = SearchQuery(
-        text=text or "",
-        tags=[t.strip() for t in tags.split(",")] if tags else [],
-        capabilities=[c.strip() for c in capabilities.split(",")]
-        if capabilities
-        else [],
-        verified_only=verified_only,
-        min_rating=min_rating,
+    result = _search(
+        _index_key(),
+        text or "",
+        _csv(tags),
+        _csv(capabilities),
+        verified_only,
+        min_rating,
     )
-    result = reg.search(query)
+    query = result.query
 
     return SearchResultResponse(
         entries=[_entry_to_response(e) for e in result.entries],
@@ -127,7 +175,7 @@ async def search_libraries(
     response_model=list[LibraryEntryResponse],
     summary="List all versions of a library",
 )
-async def list_versions(name: str):
+def list_versions(name: str):
     """List all versions of a library by name.
 
     Returns all versions found in the registry index, sorted by version string.
@@ -144,7 +192,6 @@ async def list_versions(name: str):
     entries = []
     for key in matching_keys:
         data = reg._index[key]
-        from ale.registry.local_registry import _dict_to_entry
         entries.append(_entry_to_response(_dict_to_entry(data)))
     return entries
 
@@ -154,7 +201,7 @@ async def list_versions(name: str):
     response_model=LibraryEntryResponse,
     summary="Get latest version of a library",
 )
-async def get_library(name: str):
+def get_library(name: str):
     """Retrieve the latest version of a library by name."""
     reg = _get_registry()
     entry = reg.get(name)
@@ -168,7 +215,7 @@ async def get_library(name: str):
     response_model=LibraryEntryResponse,
     summary="Get a specific version of a library",
 )
-async def get_library_version(name: str, version: str):
+def get_library_version(name: str, version: str):
     """Retrieve a specific version of a library."""
     reg = _get_registry()
     entry = reg.get(name, version)
@@ -185,31 +232,23 @@ async def get_library_version(name: str, version: str):
     response_model=LibraryEntryResponse,
     summary="Publish a library",
 )
-async def publish_library(file: UploadFile = File(...)):
+def publish_library(file: UploadFile = File(...)):
     """Publish an Agentic Library from an uploaded YAML file.
 
-    Accepts a multipart file upload of an ``.agentic.yaml`` file. The file
-    is saved to a temporary location, published to the local registry, and
-    the resulting entry is returned.
+    Accepts a multipart file upload of an ``.agentic.yaml`` file. The YAML
+    is parsed straight from the upload's spooled file (kept in memory for
+    small uploads) and published to the local registry, and the resulting
+    entry is returned.  The handler is sync so parsing and publishing run
+    in the threadpool.
     """
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file uploaded")
 
-    # Save uploaded file to a temp location
-    suffix = Path(file.filename).suffix or ".yaml"
-    with tempfile.NamedTemporaryFile(
-        delete=False, suffix=suffix, prefix="ale_upload_"
-    ) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
-
     try:
-        reg = _get_registry()
-        entry = reg.publish(tmp_path)
+        data = yaml.safe_load(file.file)
+        # Not the shared instance: publish mutates the registry's index.
+        reg = LocalRegistry(REGISTRY_DIR)
+        entry = reg.publish_data(data)
         return _entry_to_response(entry)
     except Exception as exc:
         raise HTTPException(status_code=400, detail=str(exc))
-    finally:
-        # Clean up temp file
-        Path(tmp_path).unlink(missing_ok=True)
@@ -5,13 +5,14 @@ Prefix: ``/api/security``
 
 from __future__ import annotations
 
-from dataclasses import asdict
-from datetime import datetime, timedelta, timezone
+import asyncio
+import atexit
+from datetime import UTC, datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
 
-from ale.security.audit_log import AuditLogger
+from ale.security.audit_log import AuditEntry, AuditLogger
 from ale.security.plugin_manager import PluginManager
 from ale.security.webhook_manager import WebhookManager
 from web.backend.app.models.api import (
@@ -28,15 +29,39 @@ from web.backend.app.models.api import (
     WebhookDeliveryResponse,
     WebhookResponse,
 )
+from web.backend.app.responses import ORJSONResponse
 
-router = APIRouter(prefix="/api/security", tags=["security"])
+router = APIRouter(
+    prefix="/api/security",
+    tags=["security"],
+    default_response_class=ORJSONResponse,
+)
 
 # ---------------------------------------------------------------------------
 # Shared manager instances (singletons for the running process)
 # ---------------------------------------------------------------------------
+# Webhook and plugin mutations are written to disk at most once per
+# _STORE_FLUSH_INTERVAL seconds; anything pending is flushed at exit.
+_STORE_FLUSH_INTERVAL = 0.25
+
 _audit = AuditLogger()
-_webhooks = WebhookManager()
-_plugins = PluginManager()
+_webhooks = WebhookManager(flush_interval=_STORE_FLUSH_INTERVAL)
+_plugins = PluginManager(flush_interval=_STORE_FLUSH_INTERVAL)
+atexit.register(_webhooks.flush)
+atexit.register(_webhooks.close)
+atexit.register(_plugins.flush)
+
+# Audit events raised by request handlers are queued and appended in
+# batches by a background task, so responses don't wait on the log file.
+# A batch closes at _AUDIT_BATCH_MAX events or _AUDIT_BATCH_WINDOW seconds
+# after its first event; if the queue is full the event is written inline.
+_AUDIT_BATCH_MAX = 100
+_AUDIT_BATCH_WINDOW = 0.2
+_AUDIT_QUEUE_MAX = 10_000
+
+# (loop, queue) of the running audit writer; recreated per event loop
+_audit_writer: tuple[asyncio.AbstractEventLoop, asyncio.Queue] | None = None
+_audit_tasks: set[asyncio.Task] = set()
 
 
 # ---------------------------------------------------------------------------
@@ -44,32 +69,117 @@ _plugins = PluginManager()
 # ---------------------------------------------------------------------------
 
 
+# The converters below build responses with model_construct straight from
+# the managers' flat dataclasses: the field types already match, so neither
+# asdict()'s recursive copy nor pydantic validation is needed.
+
+# Audit entries never change once written, so their responses are reused by
+# entry id.  The dict is cleared outright once it reaches the cap.
+_AUDIT_RESPONSE_CACHE_MAX = 4096
+_AUDIT_RESPONSES: dict[str, AuditEntryResponse] = {}
+
+
 def _audit_entry_to_response(e) -> AuditEntryResponse:
-    d = asdict(e) if hasattr(e, "__dataclass_fields__") else e
-    return AuditEntryResponse(**d)
+    is_dataclass = hasattr(e, "__dataclass_fields__")
+    entry_id = e.id if is_dataclass else e["id"]
+    resp = _AUDIT_RESPONSES.get(entry_id)
+    if resp is None:
+        if len(_AUDIT_RESPONSES) >= _AUDIT_RESPONSE_CACHE_MAX:
+            _AUDIT_RESPONSES.clear()
+        d = vars(e) if is_dataclass else e
+        resp = _AUDIT_RESPONSES[entry_id] = AuditEntryResponse.model_construct(**d)
+    return resp
 
 
 def _webhook_to_response(w) -> WebhookResponse:
-    d = asdict(w) if hasattr(w, "__dataclass_fields__") else w
+    if hasattr(w, "__dataclass_fields__"):
+        # Attribute by attribute, so the secret is never copied.
+        return WebhookResponse.model_construct(
+            id=w.id,
+            name=w.name,
+            url=w.url,
+            events=w.events,
+            active=w.active,
+            created_at=w.created_at,
+            updated_at=w.updated_at,
+        )
     return WebhookResponse(
-        id=d["id"],
-        name=d["name"],
-        url=d["url"],
-        events=d.get("events", []),
-        active=d.get("active", True),
-        created_at=d.get("created_at", ""),
-        updated_at=d.get("updated_at", ""),
+        id=w["id"],
+        name=w["name"],
+        url=w["url"],
+        events=w.get("events", []),
+        active=w.get("active", True),
+        created_at=w.get("created_at", ""),
+        updated_at=w.get("updated_at", ""),
     )
 
 
 def _delivery_to_response(d) -> WebhookDeliveryResponse:
-    data = asdict(d) if hasattr(d, "__dataclass_fields__") else d
-    return WebhookDeliveryResponse(**data)
+    if hasattr(d, "__dataclass_fields__"):
+        return WebhookDeliveryResponse.model_construct(**vars(d))
+    return WebhookDeliveryResponse(**d)
 
 
 def _plugin_to_response(p) -> PluginResponse:
-    d = asdict(p) if hasattr(p, "__dataclass_fields__") else p
-    return PluginResponse(**d)
+    if hasattr(p, "__dataclass_fields__"):
+        return PluginResponse.model_construct(**vars(p))
+    return PluginResponse(**p)
+
+
+def _log_event_nowait(**kwargs) -> None:
+    """Queue an audit event for the background writer.
+
+    Must be called from the event loop.  Takes the same arguments as
+    ``AuditLogger.log_event``; the entry is timestamped immediately.
+    """
+    global _audit_writer
+    entry = _audit.new_entry(**kwargs)
+    loop = asyncio.get_running_loop()
+    if _audit_writer is None or _audit_writer[0] is not loop:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_AUDIT_QUEUE_MAX)
+        _audit_writer = (loop, queue)
+        task = loop.create_task(_write_audit_batches(queue))
+        _audit_tasks.add(task)
+        task.add_done_callback(_audit_tasks.discard)
+    try:
+        _audit_writer[1].put_nowait(entry)
+    except asyncio.QueueFull:
+        _audit.log_entries([entry])
+
+
+async def _write_audit_batches(queue: asyncio.Queue) -> None:
+    """Drain *queue*, appending each batch of entries in one write."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch: list[AuditEntry] = [await queue.get()]
+        deadline = loop.time() + _AUDIT_BATCH_WINDOW
+        try:
+            while len(batch) < _AUDIT_BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            # Shutting down mid-batch: don't lose what was already dequeued.
+            _audit.log_entries(batch)
+            raise
+        await asyncio.to_thread(_audit.log_entries, batch)
+
+
+@atexit.register
+def _flush_audit_queue() -> None:
+    """Write any events still queued when the process exits."""
+    if _audit_writer is None:
+        return
+    queue = _audit_writer[1]
+    pending: list[AuditEntry] = []
+    while not queue.empty():
+        pending.append(queue.get_nowait())
+    if pending:
+        _audit.log_entries(pending)
 
 
 # =========================================================================
@@ -78,7 +188,7 @@ def _plugin_to_response(p) -> PluginResponse:
 
 
 @router.get("/audit", response_model=list[AuditEntryResponse])
-async def list_audit_events(
+def list_audit_events(
     actor: Optional[str] = Query(None),
     action: Optional[str] = Query(None),
     resource_type: Optional[str] = Query(None),
@@ -98,8 +208,12 @@ async def list_audit_events(
     return [_audit_entry_to_response(e) for e in events]
 
 
+# Matches AuditLogger.export_events' default limit.
+_EXPORT_LIMIT = 10000
+
+
 @router.get("/audit/export", response_model=AuditExportResponse)
-async def export_audit_log(
+def export_audit_log(
     format: str = Query("json", regex="^(json|csv)$"),
     actor: Optional[str] = Query(None),
     action: Optional[str] = Query(None),
@@ -108,23 +222,18 @@ async def export_audit_log(
     end_date: Optional[str] = Query(None),
 ):
     """Export the audit log in JSON or CSV format."""
-    content = _audit.export_events(
-        format,
-        actor=actor,
-        action=action,
-        resource_type=resource_type,
-        start_date=start_date,
-        end_date=end_date,
-    )
     events = _audit.get_events(
         actor=actor,
         action=action,
         resource_type=resource_type,
         start_date=start_date,
         end_date=end_date,
+        limit=_EXPORT_LIMIT,
     )
     return AuditExportResponse(
-        format=format, content=content, record_count=len(events)
+        format=format,
+        content=_audit.format_events(events, format),
+        record_count=len(events),
     )
 
 
@@ -132,7 +241,7 @@ async def export_audit_log(
     "/audit/{resource_type}/{resource_id}",
     response_model=list[AuditEntryResponse],
 )
-async def get_events_for_resource(resource_type: str, resource_id: str):
+def get_events_for_resource(resource_type: str, resource_id: str):
     """Get audit events for a specific resource."""
     events = _audit.get_events_for_resource(resource_type, resource_id)
     return [_audit_entry_to_response(e) for e in events]
@@ -152,7 +261,7 @@ async def create_webhook(req: CreateWebhookRequest):
         secret=req.secret,
         name=req.name,
     )
-    _audit.log_event(
+    _log_event_nowait(
         actor="system",
         action="webhook.create",
         resource_type="webhook",
@@ -163,7 +272,7 @@ async def create_webhook(req: CreateWebhookRequest):
 
 
 @router.get("/webhooks", response_model=list[WebhookResponse])
-async def list_webhooks_endpoint():
+def list_webhooks_endpoint():
     """List all registered webhooks."""
     return [_webhook_to_response(w) for w in _webhooks.list_webhooks()]
 
@@ -199,7 +308,7 @@ async def delete_webhook(webhook_id: str):
     """Delete a webhook."""
     if not _webhooks.delete_webhook(webhook_id):
         raise HTTPException(status_code=404, detail="Webhook not found")
-    _audit.log_event(
+    _log_event_nowait(
         actor="system",
         action="webhook.delete",
         resource_type="webhook",
@@ -232,13 +341,8 @@ async def test_webhook(webhook_id: str):
         "message": "This is a test delivery from ALE.",
     }
 
-    delivery = _webhooks._deliver(wh, "test", test_payload)
-
-    # Persist the delivery
-    deliveries = _webhooks._load_deliveries()
-    deliveries.append(asdict(delivery))
-    _webhooks._save_deliveries(deliveries)
-
+    # The HTTP round trip blocks, so it runs off the event loop.
+    delivery = await asyncio.to_thread(_webhooks.deliver, wh, "test", test_payload)
     return _delivery_to_response(delivery)
 
 
@@ -271,7 +375,7 @@ async def create_plugin(req: CreatePluginRequest):
         hooks=req.hooks,
         config=req.config,
     )
-    _audit.log_event(
+    _log_event_nowait(
         actor="system",
         action="plugin.create",
         resource_type="plugin",
@@ -282,7 +386,7 @@ async def create_plugin(req: CreatePluginRequest):
 
 
 @router.get("/plugins", response_model=list[PluginResponse])
-async def list_plugins_endpoint():
+def list_plugins_endpoint():
     """List all registered plugins."""
     return [_plugin_to_response(p) for p in _plugins.list_plugins()]
 
@@ -320,7 +424,7 @@ async def delete_plugin(plugin_id: str):
     """Delete a plugin."""
     if not _plugins.delete_plugin(plugin_id):
         raise HTTPException(status_code=404, detail="Plugin not found")
-    _audit.log_event(
+    _log_event_nowait(
         actor="system",
         action="plugin.delete",
         resource_type="plugin",
@@ -348,36 +452,35 @@ async def toggle_plugin(plugin_id: str, req: TogglePluginRequest):
 
 
 @router.get("/dashboard", response_model=SecurityDashboardResponse)
-async def security_dashboard():
+def security_dashboard():
     """Security posture overview with summary statistics."""
+    now = datetime.now(UTC)
+
     # Audit stats
-    all_events = _audit.get_events(limit=10000)
-    today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    events_today = [e for e in all_events if e.timestamp.startswith(today_str)]
-    recent_events = all_events[:10]
+    today_str = now.strftime("%Y-%m-%d")
+    total_events = _audit.count_events()
+    events_today = _audit.count_events(day=today_str)
+    recent_events = _audit.get_recent_events(10)
 
     # Webhook stats
     webhooks = _webhooks.list_webhooks()
     active_webhooks = [w for w in webhooks if w.active]
 
     # Failed deliveries in last 24h
-    cutoff = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
-    all_deliveries = _webhooks.get_deliveries(limit=10000)
-    failed_24h = [
-        d for d in all_deliveries if not d.success and d.delivered_at >= cutoff
-    ]
+    cutoff = (now - timedelta(hours=24)).isoformat()
+    failed_24h = _webhooks.count_failed_deliveries(since=cutoff)
 
     # Plugin stats
     plugins = _plugins.list_plugins()
     enabled_plugins = [p for p in plugins if p.enabled]
 
     return SecurityDashboardResponse(
-        total_events=len(all_events),
-        events_today=len(events_today),
+        total_events=total_events,
+        events_today=events_today,
         active_webhooks=len(active_webhooks),
         total_webhooks=len(webhooks),
         enabled_plugins=len(enabled_plugins),
         total_plugins=len(plugins),
         recent_events=[_audit_entry_to_response(e) for e in recent_events],
-        failed_deliveries_24h=len(failed_24h),
+        failed_deliveries_24h=failed_24h,
     )